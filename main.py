@@ -1,3 +1,6 @@
+import time
+_T0 = time.perf_counter()
+
 import sys
 import os
 
@@ -8,16 +11,46 @@ _src  = os.path.join(_raiz, "src")
 if _src not in sys.path:
     sys.path.insert(0, _src)
 
-# ── Garantir que todos os mapas existem antes de arrancar ─────────────────────
-from game.core.setup_mapas import garantir_mapas
 
-criados = garantir_mapas()
-if criados:
-    print(f"[setup] Mapas criados: {', '.join(criados)}")
+def _argumentos():
+    import argparse
+    ap = argparse.ArgumentParser(description="Snake")
+    ap.add_argument("--replay", metavar="FICHEIRO",
+                    help="reproduz no ecrã um replay gravado (.snkr)")
+    ap.add_argument("--startup-report", action="store_true",
+                    help="mostra o tempo de cada fase do arranque até ao primeiro frame")
+    return ap.parse_args()
 
-# ── Arrancar o menu ───────────────────────────────────────────────────────────
-from game.ui.menu import Menu
 
 if __name__ == "__main__":
-    menu = Menu()
-    menu.run()
\ No newline at end of file
+    args = _argumentos()
+
+    from game.core import arranque
+    arranque.configurar(inicio=_T0, relatorio=args.startup_report)
+
+    # ── Garantir que todos os mapas existem antes de arrancar ─────────────────
+    with arranque.fase("import setup_mapas"):
+        from game.core.setup_mapas import garantir_mapas
+    with arranque.fase("garantir_mapas"):
+        criados = garantir_mapas()
+    if criados:
+        print(f"[setup] Mapas criados: {', '.join(criados)}")
+
+    with arranque.fase("import pygame"):
+        import pygame  # noqa: F401
+
+    # ── Arrancar o menu (ou reproduzir um replay: --replay FICHEIRO) ──────────
+    # Modos, IA e renderer só são importados quando uma partida começa
+    if args.replay:
+        with arranque.fase("import game.core.engine"):
+            from game.core.engine import Game
+            from game.sim.replay  import Replay
+        with arranque.fase("Game.de_replay"):
+            jogo = Game.de_replay(Replay.carregar(args.replay))
+        jogo.run()
+    else:
+        with arranque.fase("import game.ui.menu"):
+            from game.ui.menu import Menu
+        with arranque.fase("Menu()"):
+            menu = Menu()
+        menu.run()
@@ -0,0 +1,126 @@
+# src/benchmarks/__main__.py
+"""
+Micro-benchmarks dos caminhos quentes (bot, cobra, partículas, mapas, HUD,
+recordes) — correm sem janela (SDL_VIDEODRIVER=dummy) e com seed fixa.
+
+    cd src
+    python -m benchmarks correr                      # → bench_resultados.json
+    python -m benchmarks correr --grupos bot cobra --saida r.json
+    python -m benchmarks correr --guardar-baseline   # → benchmarks/baseline.json
+    python -m benchmarks comparar r.json             # contra a baseline guardada
+    python -m benchmarks comparar r.json --baseline outra.json --tolerancia 0.2
+
+`comparar` termina com código 1 se houver regressões (útil num script de CI).
+"""
+import os
+
+# Antes de qualquer import de pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse     # noqa: E402
+import json         # noqa: E402
+import platform     # noqa: E402
+import sys          # noqa: E402
+import time         # noqa: E402
+
+_src = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _src not in sys.path:
+    sys.path.insert(0, _src)
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def _iniciar_pygame():
+    import pygame
+    import game.config as cfg
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode((cfg.SCREEN_WIDTH + cfg.SIDEBAR_W, cfg.SCREEN_HEIGHT))
+    return pygame
+
+
+def correr(args) -> int:
+    pygame = _iniciar_pygame()
+    from benchmarks.casos   import GRUPOS, np, semear
+    from benchmarks.medicao import medir
+
+    grupos = args.grupos or list(GRUPOS)
+    desconhecidos = [g for g in grupos if g not in GRUPOS]
+    if desconhecidos:
+        print(f"Grupos desconhecidos: {desconhecidos}. Use: {list(GRUPOS)}")
+        return 2
+
+    resultados = {}
+    for g in grupos:
+        semear(args.seed)
+        for m in GRUPOS[g](args.seed):
+            if args.filtro and args.filtro not in m.nome:
+                continue
+            r = medir(m, repeticoes=args.repeticoes)
+            resultados[m.nome] = r
+            print(f"  {m.nome:<46} {r['mediana_us']:12.2f} µs  (±{r['desvio_us']:.2f})")
+
+    dados = {
+        "meta": {
+            "data":       time.strftime("%Y-%m-%d %H:%M:%S"),
+            "seed":       args.seed,
+            "repeticoes": args.repeticoes,
+            "python":     platform.python_version(),
+            "pygame":     pygame.version.ver,
+            "numpy":      np.__version__ if np is not None else None,
+            "plataforma": platform.platform(),
+            "cpu":        platform.processor() or platform.machine(),
+        },
+        "resultados": resultados,
+    }
+    destinos = [args.saida] + ([BASELINE] if args.guardar_baseline else [])
+    for caminho in destinos:
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump(dados, f, indent=2, ensure_ascii=False)
+        print(f"[bench] {len(resultados)} casos → {caminho}")
+    return 0
+
+
+def comparar(args) -> int:
+    from benchmarks.comparar import carregar, relatorio
+
+    if not os.path.exists(args.baseline):
+        print(f"Baseline não encontrada: {args.baseline} "
+              f"(crie-a com: python -m benchmarks correr --guardar-baseline)")
+        return 2
+    texto, regressoes = relatorio(carregar(args.baseline), carregar(args.resultados),
+                                  args.tolerancia, args.metrica)
+    print(texto)
+    return 1 if regressoes else 0
+
+
+def main() -> int:
+    ap  = argparse.ArgumentParser(prog="python -m benchmarks",
+                                  description=__doc__.strip().splitlines()[0])
+    sub = ap.add_subparsers(dest="comando", required=True)
+
+    c = sub.add_parser("correr", help="corre os benchmarks e grava JSON")
+    c.add_argument("--grupos", nargs="*", help="bot, cobra, particulas, mapas, hud, recordes")
+    c.add_argument("--filtro", help="só casos cujo nome contém este texto")
+    c.add_argument("--seed",       type=int, default=1234)
+    c.add_argument("--repeticoes", type=int, default=7)
+    c.add_argument("--saida",      default="bench_resultados.json")
+    c.add_argument("--guardar-baseline", action="store_true",
+                   help=f"grava também em {os.path.relpath(BASELINE)}")
+    c.set_defaults(fn=correr)
+
+    k = sub.add_parser("comparar", help="compara resultados com a baseline")
+    k.add_argument("resultados", nargs="?", default="bench_resultados.json")
+    k.add_argument("--baseline",   default=BASELINE)
+    k.add_argument("--tolerancia", type=float, default=0.10)
+    k.add_argument("--metrica",    default="mediana_us",
+                   choices=("mediana_us", "min_us", "media_us"))
+    k.set_defaults(fn=comparar)
+
+    args = ap.parse_args()
+    return args.fn(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
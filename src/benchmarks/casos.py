@@ -0,0 +1,269 @@
+# src/benchmarks/casos.py
+"""
+Casos de benchmark dos caminhos quentes do jogo.
+
+Cada grupo é um gerador registado com @grupo que recebe a seed e produz
+Medicao(…) já preparadas — todo o estado (mapas, cobras, partículas, bases
+de recordes) é construído a partir de random.Random(seed), pelo que duas
+corridas com a mesma seed medem exactamente o mesmo trabalho.
+
+Requer pygame inicializado com um ecrã (o __main__ usa o driver dummy).
+"""
+from __future__ import annotations
+
+import glob
+import os
+import random
+import tempfile
+from typing import Callable, Dict, Iterator, List
+
+import pygame
+
+import game.config as cfg
+from game.core.caminhos       import caminho_recurso
+from game.core.records        import GestorRecordes
+from game.entities.particulas import SistemaDeParticulas
+from game.entities.snake      import Snake
+from game.maps.map            import Mapas
+from game.maps.mapa_compilado import MapaCompilado
+from game.maps.map_renderer   import MapRenderer
+from game.core.camara         import Camara
+from game.sim.simulacao       import criar_simulacao
+from game.ui                  import fontes
+from game.ui.hud              import HUD
+
+from benchmarks.medicao import Medicao
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover — dependência opcional
+    np = None
+
+GRUPOS: Dict[str, Callable[[int], Iterator[Medicao]]] = {}
+
+DIRECOES = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+
+
+def grupo(nome: str):
+    """Regista um gerador de casos com o nome do grupo."""
+    def registar(fn):
+        GRUPOS[nome] = fn
+        return fn
+    return registar
+
+
+def mapas() -> List[str]:
+    """Mapas distribuídos com o jogo, por ordem alfabética."""
+    return sorted(glob.glob(caminho_recurso(os.path.join("assets", "mapas", "*.txt"))))
+
+
+def semear(seed: int) -> None:
+    """Fixa os geradores globais (as partículas usam o `random` do módulo)."""
+    random.seed(seed)
+    if np is not None:
+        np.random.seed(seed)
+
+
+# ── Bot (A* e flood fill) ─────────────────────────────────────────────────────
+
+@grupo("bot")
+def casos_bot(seed: int) -> Iterator[Medicao]:
+    for caminho in mapas():
+        nome_mapa = os.path.splitext(os.path.basename(caminho))[0]
+        rng = random.Random(seed)
+        sim = criar_simulacao(cfg.MODO_VS_AI, Mapas(caminho, auto_scale=False),
+                              rng=random.Random(seed))
+
+        # Alguns ticks de jogo para haver corpos a bloquear células
+        for _ in range(80):
+            if sim.terminado:
+                break
+            d = rng.choice(DIRECOES) if rng.random() < 0.15 else None
+            sim.step({"p1": d})
+
+        ia        = sim.ia
+        bloqueios = ia._obter_bloqueios()
+        ids       = [ia._id(p) for p in bloqueios
+                     if ia._valido(*p) and p not in ia._obst]
+        livres    = [(x, y) for x in range(ia._mapa.cols) for y in range(ia._mapa.rows)
+                     if (x, y) not in bloqueios]
+        pares     = [tuple(rng.sample(livres, 2)) for _ in range(50)]
+        origens   = [rng.choice(livres) for _ in range(4)]
+
+        def astar(pares=pares, ia=ia, bloqueios=bloqueios):
+            for inicio, objetivo in pares:
+                ia._astar(inicio, objetivo, bloqueios)
+
+        yield Medicao(f"bot.astar[{nome_mapa}]", astar, operacoes=len(pares),
+                      extra={"consultas": len(pares)})
+
+        # Um "tick": marcar os corpos na grelha e 4 consultas de espaço livre
+        for limite in (20, 200):
+            def flood(ia=ia, bloqueios=bloqueios, ids=ids, limite=limite,
+                      origens=origens):
+                ia._grelha.bloquear(ids)
+                for o in origens:
+                    ia._flood_fill(o, bloqueios, limite)
+
+            yield Medicao(f"bot.flood_fill[{nome_mapa},lim={limite}]", flood,
+                          operacoes=len(origens), extra={"limite": limite})
+
+
+# ── Cobra ─────────────────────────────────────────────────────────────────────
+
+def _cobra_serpentina(comprimento: int, largura: int = 40) -> Snake:
+    """Cobra de `comprimento` segmentos dobrada em serpentina (sem colisões)."""
+    s = Snake((0, 0), cfg.BLOCK_SIZE)
+    for i in range(comprimento - 1):
+        linha, col = divmod(i, largura + 1)
+        if col == largura:
+            d = (0, 1)
+        else:
+            d = (1, 0) if linha % 2 == 0 else (-1, 0)
+        s.set_direction(*d)
+        s.grow()
+        s.update()
+    return s
+
+
+@grupo("cobra")
+def casos_cobra(seed: int) -> Iterator[Medicao]:
+    for comprimento in (10, 100, 1000):
+        s = _cobra_serpentina(comprimento)
+        # Sem crescer, o comprimento mantém-se ao longo das repetições
+        yield Medicao(f"snake.update[{comprimento}]", s.update,
+                      extra={"comprimento": len(s.segments)})
+        yield Medicao(f"snake.collides_self[{comprimento}]", s.collides_self,
+                      extra={"comprimento": len(s.segments)})
+
+
+# ── Partículas ────────────────────────────────────────────────────────────────
+
+@grupo("particulas")
+def casos_particulas(seed: int) -> Iterator[Medicao]:
+    superficie = pygame.Surface((cfg.SCREEN_WIDTH + cfg.SIDEBAR_W, cfg.SCREEN_HEIGHT))
+    for n in (500, 5000):
+        ps = SistemaDeParticulas()
+
+        def encher(ps=ps, n=n):
+            ps.clear()
+            rng = random.Random(seed)
+            semear(seed)
+            while ps.count < n:
+                antes = ps.count
+                pos   = (rng.randrange(cfg.SCREEN_WIDTH), rng.randrange(cfg.SCREEN_HEIGHT))
+                ps.emit_food_burst(pos, rng.choice((cfg.FOOD_COLOR, cfg.SNAKE1_HEAD)),
+                                   cfg.BLOCK_SIZE, count=min(50, n - ps.count))
+                if ps.count == antes:        # capacidade máxima atingida
+                    break
+
+        encher()
+        real = ps.count
+        # 10 frames por repetição: as partículas ainda estão todas vivas
+        yield Medicao(f"particulas.update[{n}]", lambda ps=ps: ps.update(1 / 60),
+                      preparar=encher, numero=10, extra={"particulas": real})
+
+        def encher_e_avancar(ps=ps, encher=encher):
+            encher()
+            ps.update(1 / 60)
+
+        yield Medicao(f"particulas.draw[{n}]",
+                      lambda ps=ps: ps.draw(superficie),
+                      preparar=encher_e_avancar, extra={"particulas": real})
+
+
+# ── Mapas ─────────────────────────────────────────────────────────────────────
+
+@grupo("mapas")
+def casos_mapas(seed: int) -> Iterator[Medicao]:
+    for caminho in mapas():
+        nome_mapa = os.path.splitext(os.path.basename(caminho))[0]
+        mapa      = Mapas(caminho, auto_scale=False)
+        yield Medicao(f"mapas.load_from_file[{nome_mapa}]",
+                      lambda m=mapa, c=caminho: m._load_from_file(c))
+
+        # Primeira carga de um .txt (sem .snkm em cache): interpretar + compilar
+        with open(caminho, encoding="utf-8") as f:
+            texto = f.read()
+        yield Medicao(f"mapas.compilar[{nome_mapa}]",
+                      lambda t=texto: MapaCompilado.de_texto(t).para_bytes())
+
+        renderer = MapRenderer(mapa, block_size=cfg.BLOCK_SIZE)
+        alvo     = pygame.Surface((cfg.SCREEN_WIDTH, cfg.SCREEN_HEIGHT))
+        camara   = Camara(cfg.SCREEN_WIDTH, cfg.SCREEN_HEIGHT,
+                          *mapa.area_pixels[2:], cfg.BLOCK_SIZE)
+
+        def rebuild(r=renderer):
+            r.invalidate()
+            r.draw(alvo, camara=camara)
+
+        yield Medicao(f"map_renderer.rebuild[{nome_mapa}]", rebuild,
+                      extra={"obstaculos": len(mapa.obstaculos)})
+
+        # Uma parede que aparece e desaparece: só os chunks vizinhos são refeitos
+        bloco = (mapa.cols // 2 + 1, mapa.rows // 2 + 1)
+
+        def editar(m=mapa, r=renderer):
+            m.definir_obstaculo(*bloco, ativo=bloco not in m._obst_set)
+            r.draw(alvo, camara=camara)
+
+        yield Medicao(f"map_renderer.editar_bloco[{nome_mapa}]", editar)
+        yield Medicao(f"map_renderer.draw_vista[{nome_mapa}]",
+                      lambda r=renderer: r.draw(alvo, camara=camara))
+
+
+# ── HUD ───────────────────────────────────────────────────────────────────────
+
+_INFO_HUD = {
+    cfg.MODO_OG_SNAKE: {"score": 1230, "length": 42, "max_length": 60},
+    cfg.MODO_VS_AI:    {"score": 870, "length": 17, "bot_length": 23,
+                        "boost_vel_ticks": 40, "boost_imune_ticks": 0, "fps_ref": 7},
+    cfg.MODO_1V1:      {"p1_name": "Ana", "p2_name": "Rui", "p1_length": 12,
+                        "p2_length": 9, "max_length": 60,
+                        "p1_ready": True, "p2_ready": False},
+}
+
+
+@grupo("hud")
+def casos_hud(seed: int) -> Iterator[Medicao]:
+    fontes.precarregar()
+    superficie = pygame.Surface((cfg.SCREEN_WIDTH + cfg.SIDEBAR_W, cfg.SCREEN_HEIGHT))
+    for modo, info in _INFO_HUD.items():
+        hud = HUD(jogador="Jogador", modo=modo, dificuldade="Normal", jogador2="Rui")
+        yield Medicao(f"hud.draw_sidebar[{modo}]",
+                      lambda h=hud, i=info, m=modo: h.draw_sidebar(superficie, i, m))
+
+
+# ── Recordes ──────────────────────────────────────────────────────────────────
+
+_NOMES  = ("Ana", "Rui", "Marta", "Tiago", "Inês", "Pedro", "Sofia", "Bot")
+_MODOS  = ("OG Snake", "Vs AI", "1v1")
+_DIFS   = ("Facil", "Normal", "Dificil")
+
+
+@grupo("recordes")
+def casos_recordes(seed: int) -> Iterator[Medicao]:
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as pasta:
+        for linhas in (10_000, 100_000):
+            rng = random.Random(seed)
+            # Caminho absoluto: caminho_dados_utilizador devolve-o tal como está
+            gestor = GestorRecordes(os.path.join(pasta, f"bench_{linhas}.db"),
+                                    ficheiro_legado=None)
+            with gestor._con:
+                gestor._con.executemany(
+                    "INSERT INTO recordes (nome, modo, dificuldade, pontuacao, data) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    ((rng.choice(_NOMES), rng.choice(_MODOS), rng.choice(_DIFS),
+                      rng.randrange(5000), "2025-01-01 12:00") for _ in range(linhas)))
+            gestor._invalidar()
+
+            yield Medicao(f"recordes.ler_pontuacoes[{linhas},todas]",
+                          gestor.ler_pontuacoes, extra={"linhas": linhas})
+            yield Medicao(f"recordes.ler_pontuacoes[{linhas},modo]",
+                          lambda g=gestor: g.ler_pontuacoes("Vs AI"),
+                          extra={"linhas": linhas})
+            yield Medicao(f"recordes.ler_pontuacoes[{linhas},top10]",
+                          lambda g=gestor: g.ler_pontuacoes("Vs AI", limite=10),
+                          extra={"linhas": linhas})
+            gestor._con.close()
+            GestorRecordes._instancias.pop(gestor.caminho, None)
@@ -0,0 +1,67 @@
+# src/benchmarks/comparar.py
+"""
+Comparação de dois ficheiros de resultados (JSON) — assinala regressões.
+
+Um caso regride quando  novo / base > 1 + tolerância  na métrica escolhida
+(mediana por omissão); melhora quando  base / novo > 1 + tolerância.
+"""
+from __future__ import annotations
+
+import json
+from typing import Dict, List, Tuple
+
+REGRESSAO = "REGRESSÃO"
+MELHORIA  = "melhoria"
+IGUAL     = "="
+
+
+def carregar(caminho: str) -> dict:
+    with open(caminho, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def comparar(base: dict, novo: dict, tolerancia: float = 0.10,
+             metrica: str = "mediana_us") -> List[Tuple[str, float, float, float, str]]:
+    """[(caso, base, novo, razão, estado)] para os casos presentes nos dois."""
+    rb: Dict[str, dict] = base["resultados"]
+    rn: Dict[str, dict] = novo["resultados"]
+    linhas = []
+    for nome in sorted(rb.keys() & rn.keys()):
+        vb, vn = rb[nome][metrica], rn[nome][metrica]
+        razao  = vn / vb if vb > 0 else float("inf")
+        if razao > 1.0 + tolerancia:
+            estado = REGRESSAO
+        elif razao * (1.0 + tolerancia) < 1.0:
+            estado = MELHORIA
+        else:
+            estado = IGUAL
+        linhas.append((nome, vb, vn, razao, estado))
+    return linhas
+
+
+def relatorio(base: dict, novo: dict, tolerancia: float = 0.10,
+              metrica: str = "mediana_us") -> Tuple[str, int]:
+    """Tabela em texto e nº de regressões."""
+    linhas = comparar(base, novo, tolerancia, metrica)
+    largura = max((len(l[0]) for l in linhas), default=10)
+    saida = [f"{'caso':<{largura}}  {'base':>10}  {'novo':>10}  {'razão':>6}",
+             "-" * (largura + 34)]
+    for nome, vb, vn, razao, estado in linhas:
+        marca = "" if estado == IGUAL else f"  {estado}"
+        saida.append(f"{nome:<{largura}}  {vb:10.2f}  {vn:10.2f}  {razao:6.2f}{marca}")
+
+    so_base = sorted(base["resultados"].keys() - novo["resultados"].keys())
+    so_novo = sorted(novo["resultados"].keys() - base["resultados"].keys())
+    for rotulo, nomes in (("só na baseline", so_base), ("novos", so_novo)):
+        if nomes:
+            lista = ", ".join(nomes) if len(nomes) <= 5 else f"{len(nomes)} casos"
+            saida.append(f"\n{rotulo}: {lista}")
+
+    regressoes = sum(l[4] == REGRESSAO for l in linhas)
+    saida.append(f"\n{metrica} em µs/operação, tolerância {tolerancia:.0%}: "
+                 f"{regressoes} regressões, "
+                 f"{sum(l[4] == MELHORIA for l in linhas)} melhorias, "
+                 f"{len(linhas)} casos comparados")
+    if base.get("meta", {}).get("seed") != novo.get("meta", {}).get("seed"):
+        saida.append("aviso: as duas corridas usaram seeds diferentes")
+    return "\n".join(saida), regressoes
@@ -0,0 +1,64 @@
+# src/benchmarks/medicao.py
+"""
+Medição de um caso: calibra o nº de chamadas por repetição (como o
+timeit.autorange) e devolve estatísticas por operação em microssegundos.
+"""
+from __future__ import annotations
+
+import gc
+import statistics
+import time
+from typing import Callable, Dict, NamedTuple, Optional
+
+
+class Medicao(NamedTuple):
+    """Um caso a medir, produzido pelos geradores em benchmarks.casos."""
+    nome:      str
+    fn:        Callable[[], object]
+    preparar:  Optional[Callable[[], object]] = None  # antes de cada repetição
+    numero:    Optional[int] = None    # chamadas por repetição (None → calibrar)
+    operacoes: int  = 1                # operações feitas por chamada a fn
+    extra:     dict = {}               # parâmetros registados no JSON
+
+
+def _cronometrar(m: Medicao, numero: int) -> float:
+    if m.preparar is not None:
+        m.preparar()
+    fn = m.fn
+    t0 = time.perf_counter()
+    for _ in range(numero):
+        fn()
+    return time.perf_counter() - t0
+
+
+def _calibrar(m: Medicao, alvo_s: float) -> int:
+    """Menor nº de chamadas 1, 2, 5, 10, 20, 50… cuja repetição dura ≥ alvo_s."""
+    numero = 1
+    while True:
+        for mult in (1, 2, 5):
+            n = numero * mult
+            if _cronometrar(m, n) >= alvo_s or n >= 1_000_000:
+                return n
+        numero *= 10
+
+
+def medir(m: Medicao, repeticoes: int = 7, alvo_s: float = 0.05) -> Dict[str, float]:
+    """Corre `m` e devolve mediana/mínimo/média/desvio por operação (µs)."""
+    numero = m.numero or _calibrar(m, alvo_s)
+    gc_ligado = gc.isenabled()
+    gc.disable()
+    try:
+        tempos = [_cronometrar(m, numero) / (numero * m.operacoes) * 1e6
+                  for _ in range(repeticoes)]
+    finally:
+        if gc_ligado:
+            gc.enable()
+    return {
+        "mediana_us": statistics.median(tempos),
+        "min_us":     min(tempos),
+        "media_us":   statistics.fmean(tempos),
+        "desvio_us":  statistics.stdev(tempos) if len(tempos) > 1 else 0.0,
+        "numero":     numero,
+        "repeticoes": repeticoes,
+        **m.extra,
+    }
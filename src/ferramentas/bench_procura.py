@@ -0,0 +1,181 @@
+# ferramentas/bench_procura.py
+"""
+Micro-benchmark dos núcleos de procura (game.sim.procura) contra a versão
+anterior do bot — tuplos (x, y), dicts para g/came_from e closure de custo.
+
+Corre no labirinto 1v1_mapa2.txt com corpos aleatórios a bloquear células,
+confirma que os dois dão os mesmos resultados e mostra o tempo de cada um.
+
+    python src/ferramentas/bench_procura.py [--consultas N] [--seed S]
+"""
+import argparse
+import heapq
+import os
+import random
+import sys
+import time
+from array import array
+from collections import deque
+
+_raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, os.path.join(_raiz, "src"))
+
+from game.sim.procura import INF, GrelhaProcura   # noqa: E402
+
+DIRECOES = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+CUSTO_BOOST = 0.5
+
+
+# ── Versão de referência (antes dos núcleos) ──────────────────────────────────
+
+def astar_tuplos(inicio, objetivo, bloqueios, obst, boosts, cols, rows):
+    def h(pos):
+        return abs(pos[0] - objetivo[0]) + abs(pos[1] - objetivo[1])
+
+    def custo(pos):
+        if pos in obst:   return None
+        if pos in boosts: return CUSTO_BOOST
+        return 1.0
+
+    heap      = [(h(inicio), 0.0, inicio)]
+    came_from = {inicio: None}
+    g_score   = {inicio: 0.0}
+    while heap:
+        _, g, atual = heapq.heappop(heap)
+        if atual == objetivo:
+            path, node = [], atual
+            while node is not None:
+                path.append(node)
+                node = came_from[node]
+            path.reverse()
+            return path
+        if g > g_score.get(atual, float("inf")):
+            continue
+        for dx, dy in DIRECOES:
+            viz = (atual[0] + dx, atual[1] + dy)
+            if not (0 <= viz[0] < cols and 0 <= viz[1] < rows):
+                continue
+            if viz in bloqueios and viz not in obst:
+                continue
+            c = custo(viz)
+            if c is None:
+                continue
+            ng = g + c
+            if ng < g_score.get(viz, float("inf")):
+                g_score[viz]   = ng
+                came_from[viz] = atual
+                heapq.heappush(heap, (ng + h(viz), ng, viz))
+    return None
+
+
+def flood_tuplos(inicio, bloqueios, limite, cols, rows):
+    if inicio in bloqueios:
+        return 0
+    visitado = {inicio}
+    fila     = deque([inicio])
+    contagem = 0
+    while fila:
+        atual = fila.popleft()
+        contagem += 1
+        if contagem >= limite:
+            return contagem
+        for dx, dy in DIRECOES:
+            viz = (atual[0] + dx, atual[1] + dy)
+            if not (0 <= viz[0] < cols and 0 <= viz[1] < rows):
+                continue
+            if viz in bloqueios or viz in visitado:
+                continue
+            visitado.add(viz)
+            fila.append(viz)
+    return contagem
+
+
+# ── Cenários ──────────────────────────────────────────────────────────────────
+
+def ler_mapa(caminho):
+    with open(caminho, encoding="utf-8") as f:
+        linhas = [l.rstrip("\n") for l in f if l.strip()]
+    rows, cols = len(linhas), max(len(l) for l in linhas)
+    obst = {(x, y) for y, l in enumerate(linhas) for x, ch in enumerate(l) if ch == "#"}
+    return cols, rows, obst
+
+
+def corpo_aleatorio(rng, livres, ocupadas, obst, comprimento):
+    """Passeio aleatório que imita o corpo de uma cobra."""
+    x, y  = rng.choice(livres)
+    corpo = [(x, y)]
+    for _ in range(comprimento - 1):
+        opcoes = [(x + dx, y + dy) for dx, dy in DIRECOES
+                  if (x + dx, y + dy) not in obst and (x + dx, y + dy) not in ocupadas
+                  and (x + dx, y + dy) not in corpo]
+        if not opcoes:
+            break
+        x, y = rng.choice(opcoes)
+        corpo.append((x, y))
+    return corpo
+
+
+def gerar_cenarios(rng, cols, rows, obst, n):
+    livres = [(x, y) for x in range(cols) for y in range(rows) if (x, y) not in obst]
+    cenarios = []
+    for _ in range(n):
+        corpos = set()
+        for comp in (rng.randint(3, 40), rng.randint(3, 40)):
+            corpos.update(corpo_aleatorio(rng, livres, corpos, obst, comp))
+        boosts = set(rng.sample(livres, 2))
+        inicio, objetivo = rng.sample(livres, 2)
+        limite = rng.randint(4, 40)
+        cenarios.append((inicio, objetivo, corpos, boosts, limite))
+    return cenarios
+
+
+# ── Execução ──────────────────────────────────────────────────────────────────
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--mapa",      default=os.path.join(_raiz, "assets", "mapas", "1v1_mapa2.txt"))
+    ap.add_argument("--consultas", type=int, default=2000)
+    ap.add_argument("--seed",      type=int, default=1)
+    args = ap.parse_args()
+
+    cols, rows, obst = ler_mapa(args.mapa)
+    cenarios = gerar_cenarios(random.Random(args.seed), cols, rows, obst, args.consultas)
+
+    # Referência
+    t0 = time.perf_counter()
+    ref = []
+    for inicio, objetivo, corpos, boosts, limite in cenarios:
+        bloq = corpos | obst
+        ref.append((astar_tuplos(inicio, objetivo, bloq, obst, boosts, cols, rows),
+                    flood_tuplos(inicio, bloq, limite, cols, rows)))
+    t_ref = time.perf_counter() - t0
+
+    # Núcleos — a preparação de custos/bloqueios conta para o tempo
+    grelha = GrelhaProcura(cols, rows)
+    base   = array("d", [1.0]) * grelha.n
+    for x, y in obst:
+        base[grelha.id(x, y)] = INF
+    t0 = time.perf_counter()
+    novo = []
+    for inicio, objetivo, corpos, boosts, limite in cenarios:
+        custos = array("d", base)
+        for p in boosts:
+            custos[grelha.id(*p)] = CUSTO_BOOST
+        grelha.bloquear(grelha.id(*p) for p in corpos)
+        caminho = grelha.astar(grelha.id(*inicio), grelha.id(*objetivo), custos)
+        novo.append(([grelha.pos(c) for c in caminho] if caminho else None,
+                     grelha.bfs_contar(grelha.id(*inicio), limite, custos)))
+    t_novo = time.perf_counter() - t0
+
+    diferentes = sum(a != b for a, b in zip(ref, novo))
+    n = len(cenarios)
+    print(f"mapa: {os.path.basename(args.mapa)} ({cols}x{rows}), {n} consultas A* + BFS")
+    print(f"  tuplos + dicts : {t_ref * 1e3:8.1f} ms  ({t_ref / n * 1e6:6.1f} us/consulta)")
+    print(f"  ids + arrays   : {t_novo * 1e3:8.1f} ms  ({t_novo / n * 1e6:6.1f} us/consulta)")
+    print(f"  ganho          : {t_ref / t_novo:8.2f}x")
+    print(f"  resultados diferentes: {diferentes}")
+    return 1 if diferentes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+# ferramentas/replay.py
+"""
+Inspecção e reprodução headless de replays (.snkr) — sem janela.
+
+    python src/ferramentas/replay.py info    partida.snkr
+    python src/ferramentas/replay.py correr  partida.snkr      # tempo + dessincronização
+    python src/ferramentas/replay.py procurar partida.snkr --tick 5000
+
+`procurar` compara o salto a frio (replay acabado de carregar, a partir do
+estado gravado no keyframe anterior) com correr desde o tick 0 e confirma
+que os dois chegam ao mesmo estado.
+Os replays do jogo ficam em ~/.snake/replays (Windows: %APPDATA%\\Snake\\replays).
+"""
+import argparse
+import os
+import sys
+import time
+
+_raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, os.path.join(_raiz, "src"))
+
+from game.sim.replay import Replay, ReprodutorReplay, hash_estado   # noqa: E402
+
+
+def info(replay: Replay, caminho: str) -> int:
+    m = replay.meta
+    print(f"ficheiro   : {caminho} ({os.path.getsize(caminho)} bytes)")
+    print(f"modo       : {m['modo']} ({m.get('dificuldade', '?')}, ×{m.get('velocidade_mult', 1.0)})")
+    print(f"jogadores  : {m.get('jogador', '?')}" +
+          (f" vs {m['jogador2']}" if m["modo"] == "1v1" else ""))
+    print(f"data       : {m.get('data', '?')}")
+    print(f"mapa       : {m['mapa'].get('origem', '?')} "
+          f"({len(m['mapa']['obstaculos'])} obstáculos)")
+    print(f"seed       : {replay.seed}")
+    print(f"ticks      : {replay.n_ticks}  "
+          f"(~{replay.n_ticks / max(1, m.get('base_fps', 7) * m.get('velocidade_mult', 1.0)):.0f} s)")
+    print(f"entradas   : {len(replay.entradas)} bytes, "
+          f"{replay.n_direcoes()} direcções (formato v{replay.versao})")
+    print(f"keyframes  : {len(replay.keyframes)} (a cada {replay.intervalo} ticks"
+          f"{', com estado' if replay.estados else ', sem estado: procurar parte do tick 0'})")
+    return 0
+
+
+def correr(replay: Replay) -> int:
+    rep = ReprodutorReplay(replay)
+    t0  = time.perf_counter()
+    tick = rep.correr()
+    dt  = time.perf_counter() - t0
+    print(f"{tick} ticks em {dt * 1e3:.1f} ms ({tick / max(dt, 1e-9):,.0f} ticks/s)")
+    print(f"pontuação final: {rep.sim.score.obter_pontuacao()}  "
+          f"terminado: {rep.sim.terminado}")
+    if rep.dessincronizado is not None:
+        print(f"DESSINCRONIZADO no tick {rep.dessincronizado}")
+        return 1
+    print(f"sincronizado ({len(replay.keyframes)} keyframes verificados)")
+    return 0
+
+
+def procurar(replay: Replay, tick: int) -> int:
+    t0 = time.perf_counter()
+    rep  = ReprodutorReplay(replay)
+    alvo = hash_estado(rep.procurar(tick))
+    t_salto = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    ref = ReprodutorReplay(replay)
+    ref.correr(tick)
+    t_zero = time.perf_counter() - t0
+
+    igual = hash_estado(ref.sim) == alvo
+    print(f"tick {rep.tick} (keyframe anterior: {rep.keyframe_anterior(tick)})")
+    print(f"  via keyframe : {t_salto * 1e3:8.2f} ms")
+    print(f"  desde tick 0 : {t_zero * 1e3:8.2f} ms")
+    print(f"  estados iguais: {'sim' if igual else 'NÃO'}")
+    return 0 if igual else 1
+
+
+def main():
+    ap  = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    sub = ap.add_subparsers(dest="comando", required=True)
+    for nome in ("info", "correr", "procurar"):
+        p = sub.add_parser(nome)
+        p.add_argument("ficheiro")
+        if nome == "procurar":
+            p.add_argument("--tick", type=int, required=True)
+    args = ap.parse_args()
+
+    replay = Replay.carregar(args.ficheiro)
+    if args.comando == "info":
+        return info(replay, args.ficheiro)
+    if args.comando == "correr":
+        return correr(replay)
+    return procurar(replay, args.tick)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,8 @@
 
 DESIRED_SCREEN_WIDTH  = 900
 DESIRED_SCREEN_HEIGHT = 600
+# Grelha visível na área de jogo (e tamanho dos mapas gerados por tipo).
+# Cada mapa .txt tem o seu próprio tamanho; se for maior, a câmara segue o jogador.
 GRID_COLS = 45
 GRID_ROWS  = 30
 
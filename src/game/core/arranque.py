@@ -0,0 +1,109 @@
+# src/game/core/arranque.py
+"""
+Arranque do jogo — init selectivo do pygame e relatório de tempos.
+
+pygame.init() inicializa todos os módulos (joystick, câmara, MIDI...), e
+o jogo só precisa de três: display, font e mixer. iniciar_pygame() liga
+só esses, uma vez, e tolera não haver dispositivo de som.
+
+O resto do arranque também é preguiçoso: o menu não importa o engine, e
+o engine só importa o modo escolhido (o bot e a procura só entram no Vs
+AI) — até ao primeiro frame do menu nada disso é carregado.
+
+Com `main.py --startup-report` cada fase (imports, inits, janela, fontes,
+música) é medida e o relatório sai no stdout quando o primeiro frame é
+apresentado. Para o detalhe módulo a módulo: `python -X importtime main.py`.
+
+Uso::
+
+    from game.core import arranque
+    with arranque.fase("import game.ui.menu"):
+        from game.ui.menu import Menu
+    ...
+    arranque.primeiro_frame()      # depois do primeiro flip
+"""
+from __future__ import annotations
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+# Instante de referência: o arranque do processo (main.py pode recuá-lo)
+_inicio: float = time.perf_counter()
+
+# [nome, duração, nível] pela ordem em que começaram (fases dentro de fases
+# ficam com nível > 0 e não contam para o total)
+_fases:     List[list] = []
+_nivel:     int  = 0
+_relatorio: bool = False
+_primeiro:  Optional[float] = None
+_pygame_iniciado: bool = False
+
+
+def configurar(inicio: Optional[float] = None, relatorio: bool = False) -> None:
+    """Define o instante zero (perf_counter) e se o relatório é impresso."""
+    global _inicio, _relatorio
+    if inicio is not None:
+        _inicio = inicio
+    _relatorio = relatorio
+
+
+@contextmanager
+def fase(nome: str) -> Iterator[None]:
+    """Mede o bloco e regista-o como uma fase do arranque."""
+    global _nivel
+    entrada = [nome, 0.0, _nivel]
+    _fases.append(entrada)
+    _nivel += 1
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        entrada[1] = time.perf_counter() - t0
+        _nivel    -= 1
+
+
+# ── pygame ────────────────────────────────────────────────────────────────────
+
+def iniciar_pygame() -> None:
+    """Inicializa só display, font e mixer (idempotente)."""
+    global _pygame_iniciado
+    if _pygame_iniciado:
+        return
+    import pygame
+
+    with fase("pygame.display.init"):
+        pygame.display.init()
+    with fase("pygame.font.init"):
+        pygame.font.init()
+    with fase("pygame.mixer.init"):
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:                 # sem placa de som: jogo mudo
+            print(f"[AVISO] Som indisponível: {e}")
+    _pygame_iniciado = True
+
+
+# ── Relatório ─────────────────────────────────────────────────────────────────
+
+def primeiro_frame() -> None:
+    """Marca o primeiro frame apresentado; imprime o relatório se pedido."""
+    global _primeiro
+    if _primeiro is not None:
+        return
+    _primeiro = time.perf_counter() - _inicio
+    if _relatorio:
+        print(relatorio(), flush=True)
+
+
+def relatorio() -> str:
+    medido = sum(d for _, d, nivel in _fases if nivel == 0)
+    linhas = ["── Arranque ──────────────────────────────────────"]
+    linhas += [f"  {'  ' * nivel + nome:<32} {d * 1e3:8.1f} ms" for nome, d, nivel in _fases]
+    if _primeiro is not None:
+        linhas.append(f"  {'(resto)':<32} {(_primeiro - medido) * 1e3:8.1f} ms")
+        linhas.append(f"  {'primeiro frame':<32} {_primeiro * 1e3:8.1f} ms")
+    jogo = sorted(m for m in sys.modules if m == "game" or m.startswith("game."))
+    linhas.append(f"  módulos do jogo carregados: {len(jogo)}")
+    return "\n".join(linhas)
@@ -57,17 +57,18 @@ class GestorAssets:
             )
         return self._fontes[chave]
 
-    def obter_fonte_sistema(self, nome: str, tamanho: int):
-        chave = (f"sys_{nome}", tamanho)
+    def obter_fonte_sistema(self, nome: str, tamanho: int, negrito: bool = False):
+        chave = (f"sys_{nome}", tamanho, negrito)
         if chave not in self._fontes:
-            self._fontes[chave] = pygame.font.SysFont(nome, tamanho)
+            self._fontes[chave] = pygame.font.SysFont(nome, tamanho, bold=negrito)
         return self._fontes[chave]
 
     # Aliases retrocompativeis — o resto do codigo usa os nomes em ingles
     def get_image(self, nome, tamanho=None):  return self.obter_imagem(nome, tamanho)
     def get_sound(self, nome):                return self.obter_som(nome)
     def get_font(self, nome, tamanho):        return self.obter_fonte(nome, tamanho)
-    def get_sysfont(self, nome, tamanho):     return self.obter_fonte_sistema(nome, tamanho)
+    def get_sysfont(self, nome, tamanho, bold=False):
+        return self.obter_fonte_sistema(nome, tamanho, bold)
 
 
 # Alias retrocompativel
@@ -0,0 +1,95 @@
+# src/game/core/camara.py
+"""
+Câmara sobre o tabuleiro — sem pygame.
+
+O tabuleiro (mapa.cols × mapa.rows blocos) pode ser maior do que a área de
+jogo do ecrã; a câmara é o rectângulo do tabuleiro que se vê. Tudo o que
+é desenhado (fundo, mapa, cobras, itens, partículas) fica em coordenadas do
+tabuleiro e é deslocado por (-x, -y) no desenho, e só o que intersecta a
+vista é desenhado — o custo por frame depende do tamanho do ecrã, não do
+tabuleiro.
+
+A câmara segue um alvo (a cabeça do jogador) com uma zona morta ao centro:
+só se mexe quando o alvo sai dela e anda sempre em blocos inteiros, para a
+grelha e os dirty rects continuarem alinhados. Em tabuleiros que cabem no
+ecrã fica parada (centrada), como se não existisse.
+
+`versao` incrementa a cada movimento — quem guarda algo desenhado em
+coordenadas de ecrã (fundo, dirty rects) compara-a para saber se é preciso
+redesenhar tudo.
+"""
+from __future__ import annotations
+
+from typing import Tuple
+
+# Fracção da vista, em cada lado, onde o alvo empurra a câmara
+_MARGEM: float = 0.3
+
+
+class Camara:
+    """Vista de `largura` × `altura` píxeis sobre um tabuleiro de `mundo_w` × `mundo_h`."""
+
+    def __init__(self, largura: int, altura: int,
+                 mundo_w: int, mundo_h: int, block: int) -> None:
+        self.w       = largura
+        self.h       = altura
+        self.mundo_w = mundo_w
+        self.mundo_h = mundo_h
+        self.block   = block
+        self.x       = 0
+        self.y       = 0
+        self.versao  = 0
+        self.centrar((mundo_w // 2, mundo_h // 2))
+
+    # ── Movimento ─────────────────────────────────────────────────────────────
+
+    def centrar(self, pos: Tuple[int, int]) -> None:
+        """Põe `pos` (píxeis do tabuleiro) no centro da vista, dentro dos limites."""
+        self._mover(pos[0] - self.w // 2, pos[1] - self.h // 2)
+
+    def seguir(self, pos: Tuple[int, int]) -> None:
+        """Desloca a câmara o mínimo para `pos` voltar à zona morta central."""
+        mx = int(self.w * _MARGEM)
+        my = int(self.h * _MARGEM)
+        px, py = pos
+        x, y = self.x, self.y
+        if   px < x + mx:                        x = px - mx
+        elif px + self.block > x + self.w - mx:  x = px + self.block - self.w + mx
+        if   py < y + my:                        y = py - my
+        elif py + self.block > y + self.h - my:  y = py + self.block - self.h + my
+        self._mover(x, y)
+
+    def _mover(self, x: int, y: int) -> None:
+        x, y = self._limitar(x, self.w, self.mundo_w), self._limitar(y, self.h, self.mundo_h)
+        if (x, y) != (self.x, self.y):
+            self.x, self.y = x, y
+            self.versao += 1
+
+    def _limitar(self, v: int, vista: int, mundo: int) -> int:
+        if mundo <= vista:                        # cabe inteiro: centrado
+            return -((vista - mundo) // 2)
+        # Vista e tabuleiro são múltiplos do bloco → o limite também é
+        return max(0, min((v // self.block) * self.block, mundo - vista))
+
+    # ── Consultas ─────────────────────────────────────────────────────────────
+
+    @property
+    def rect(self) -> Tuple[int, int, int, int]:
+        """(x, y, w, h) da vista em píxeis do tabuleiro."""
+        return (self.x, self.y, self.w, self.h)
+
+    def visivel(self, x: int, y: int, w: int, h: int) -> bool:
+        """True se o rectângulo (píxeis do tabuleiro) intersecta a vista."""
+        return (x < self.x + self.w and x + w > self.x
+                and y < self.y + self.h and y + h > self.y)
+
+    def para_ecra(self, pos: Tuple[int, int]) -> Tuple[int, int]:
+        return (pos[0] - self.x, pos[1] - self.y)
+
+    def celulas_visiveis(self) -> Tuple[int, int, int, int]:
+        """(bx0, by0, bx1, by1) — blocos do tabuleiro na vista, bx1/by1 exclusivos."""
+        b = self.block
+        return (max(0, self.x // b),
+                max(0, self.y // b),
+                min(self.mundo_w // b, -(-(self.x + self.w) // b)),
+                min(self.mundo_h // b, -(-(self.y + self.h) // b)))
@@ -2,7 +2,7 @@
 """
 Configurações persistentes do utilizador.
 
-Guarda e lê um ficheiro JSON com as preferências de áudio.
+Guarda e lê um ficheiro JSON com as preferências de áudio e de render.
 Singleton — uma única instância partilhada por todo o jogo.
 
 Uso::
@@ -12,6 +12,8 @@ Uso::
     cfg_user.musica_volume   # float 0.0–1.0
     cfg_user.sfx_volume      # float 0.0–1.0
     cfg_user.musica_ativa    # bool
+    cfg_user.render_sujo     # bool — apresentar só as zonas alteradas
+    cfg_user.interpolar      # bool — deslizar as cobras entre ticks lógicos
     cfg_user.guardar()       # persiste para o ficheiro JSON
 """
 from __future__ import annotations
@@ -28,6 +30,8 @@ _DEFAULTS = {
     "musica_volume": 0.65,
     "sfx_volume":    1.0,
     "musica_ativa":  True,
+    "render_sujo":   False,
+    "interpolar":    True,
 }
 
 
@@ -77,6 +81,22 @@ class Configuracoes:
     def musica_ativa(self, v: bool) -> None:
         self._dados["musica_ativa"] = bool(v)
 
+    @property
+    def render_sujo(self) -> bool:
+        return bool(self._dados.get("render_sujo", _DEFAULTS["render_sujo"]))
+
+    @render_sujo.setter
+    def render_sujo(self, v: bool) -> None:
+        self._dados["render_sujo"] = bool(v)
+
+    @property
+    def interpolar(self) -> bool:
+        return bool(self._dados.get("interpolar", _DEFAULTS["interpolar"]))
+
+    @interpolar.setter
+    def interpolar(self, v: bool) -> None:
+        self._dados["interpolar"] = bool(v)
+
     # ── Persistência ──────────────────────────────────────────────────────────
 
     def guardar(self) -> None:
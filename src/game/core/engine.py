@@ -4,14 +4,29 @@ Motor principal do jogo.
 
 Responsabilidades:
   - Gestão da janela e superfície lógica (com sidebar).
-  - Loop principal com separação lógica / visual (60 FPS visuais, N FPS lógicos).
+  - Loop principal com separação lógica / visual (60 FPS visuais, N FPS lógicos),
+    com limite de passos de recuperação por frame e interpolação das cobras
+    entre ticks (fracção do acumulador em self.alfa).
   - Screen shake com decaimento linear.
+  - Render completo (flip) ou por dirty rects (display.update só das zonas
+    alteradas), com fallback para flip durante o shake ou após resize.
   - Orquestração de modos de jogo, HUD, partículas e música.
+  - Câmara: o tabuleiro pode ser maior do que a área de jogo; a câmara
+    segue o alvo do modo e só a vista é desenhada.
+  - Perfil de tempo por fase do loop (F3 mostra o overlay, F4 exporta CSV).
+  - Entrada (game.core.entrada): fila de eventos filtrada durante a partida,
+    comandos nos modos que os aceitam e latência entrada → movimento.
+  - Replays: cada partida é gravada (seed + entradas por tick) em
+    replays/ na pasta do utilizador; Game.de_replay() reprodu-la no ecrã.
 """
 from __future__ import annotations
 
+import math
+import os
 import random
 import sys
+import time
+from typing import List, Optional
 
 import pygame
 import game.config as cfg
@@ -22,17 +37,34 @@ from game.ui.hud              import HUD
 from game.core.score          import Score
 from game.maps.map            import Mapas
 from game.core.assets         import AssetsManager
-from game.entities.particulas import SistemaDeParticulas
+from game.core                import arranque
+from game.entities.particulas import SistemaDeParticulas, semear as semear_particulas
 from game.core.musica         import GestorMusica
-from game.modes.og_snake      import OgSnake
-from game.modes.modo_1v1      import Modo1v1
+from game.core.configuracoes  import Configuracoes
+from game.core.perfil         import PerfilFrames
+from game.core.entrada        import Entrada
+from game.core.caminhos       import caminho_dados_utilizador
+from game.core.camara         import Camara
 from game.maps.map_renderer   import MapRenderer
-from game.modes.player_vs_ai  import PlayerVsAI
+from game.ui.perfil_overlay   import OverlayPerfil
+from game.sim.replay          import GravadorReplay, Replay, ReprodutorReplay
 from game.ui                  import ui_utils
+from game.ui                  import fontes
 
 # FPS alvo para o ciclo visual (partículas, shake, animações do HUD)
 ALVO_FPS_VISUAIS: int = 60
 
+# Passos lógicos por frame no máximo: depois de um frame lento o atraso
+# acima disto é descartado em vez de correr uma rajada de ticks
+MAX_PASSOS_LOGICOS: int = 3
+
+# Replays guardados na pasta do utilizador (os mais antigos são apagados)
+MAX_REPLAYS: int = 30
+
+# Acima destes limites um frame parcial deixa de compensar → flip completo
+_MAX_RECTS_SUJOS:   int   = 400
+_FRACAO_MAX_SUJA:   float = 0.5
+
 
 # ── Screen Shake ──────────────────────────────────────────────────────────────
 
@@ -53,6 +85,10 @@ class TremidaEcra:
         if self._decorrido < self._duracao:
             self._decorrido += dt
 
+    @property
+    def ativa(self) -> bool:
+        return self._decorrido < self._duracao and self._intensidade > 0
+
     @property
     def deslocamento(self) -> tuple[int, int]:
         if self._decorrido >= self._duracao or self._intensidade <= 0:
@@ -62,6 +98,20 @@ class TremidaEcra:
         return (random.randint(-mag, mag), random.randint(-mag, mag))
 
 
+# ── Modos ─────────────────────────────────────────────────────────────────────
+
+def _classe_modo(modo: str):
+    """Classe do modo, importada só quando é escolhido (o bot só entra no Vs AI)."""
+    if modo == cfg.MODO_1V1:
+        from game.modes.modo_1v1 import Modo1v1
+        return Modo1v1
+    if modo == cfg.MODO_VS_AI:
+        from game.modes.player_vs_ai import PlayerVsAI
+        return PlayerVsAI
+    from game.modes.og_snake import OgSnake
+    return OgSnake
+
+
 # ── Motor principal ───────────────────────────────────────────────────────────
 
 class Game:
@@ -75,6 +125,10 @@ class Game:
         velocidade_mult: float = 1.0,
         mapa_tipo           = 1,
         player2_name: str   = "Player 2",
+        render_sujo: Optional[bool] = None,
+        interpolar: Optional[bool] = None,
+        seed: Optional[int] = None,
+        replay: Optional[Replay] = None,
     ) -> None:
         self.player_name     = player_name
         self.player2_name    = player2_name
@@ -83,8 +137,8 @@ class Game:
         self.velocidade_mult = velocidade_mult
         self.jogar_de_novo   = False
 
-        pygame.init()
-        pygame.mixer.init()
+        arranque.iniciar_pygame()
+        fontes.precarregar()
 
         # Reutiliza o tamanho da janela existente se possível;
         # verifica None antes de chamar get_size() para evitar crash no arranque.
@@ -112,13 +166,56 @@ class Game:
         self.clock         = pygame.time.Clock()
         self.running       = True
 
+        # ── Render por dirty rects ────────────────────────────────────────────
+        # None → usa a preferência guardada em Configuracoes
+        self.render_sujo = (Configuracoes().render_sujo
+                            if render_sujo is None else bool(render_sujo))
+        self._fundo:            Optional[pygame.Surface] = None
+        self._geometria:        Optional[tuple]          = None
+        self._rects_particulas: Optional[List[pygame.Rect]] = []
+        self._forcar_completo:  bool = True
+        self._tremia:           bool = False
+
+        # ── Interpolação entre ticks ──────────────────────────────────────────
+        # alfa ∈ [0, 1): fracção do intervalo lógico já decorrida; os modos
+        # passam-na às cobras. None → desenho no bloco exacto (sem deslizar)
+        self.interpolar = (Configuracoes().interpolar
+                           if interpolar is None else bool(interpolar))
+        self.alfa: Optional[float] = None
+        self.passos_descartados: int = 0
+
         self.records      = RecordsManager()
-        self.mapa         = Mapas(mapa_tipo, block_size=self.block, auto_scale=False)
+        # ── Seed ──────────────────────────────────────────────────────────────
+        # self.rng decide os spawns da simulação; random global e o gerador
+        # das partículas também são semeados para o replay ficar parecido.
+        if replay is not None:
+            seed = replay.seed
+        elif seed is None:
+            seed = random.SystemRandom().randrange(2 ** 63)
+        self.seed = seed
+        self.rng  = random.Random(seed)
+        random.seed(seed)
+        semear_particulas(seed)
+
+        self.mapa         = (replay.criar_mapa() if replay is not None
+                             else Mapas(mapa_tipo, block_size=self.block, auto_scale=False))
         self.map_renderer = MapRenderer(self.mapa, block_size=self.block)
+        _, _, mundo_w, mundo_h = self.mapa.area_pixels
+        self.camara       = Camara(cfg.SCREEN_WIDTH, cfg.SCREEN_HEIGHT,
+                                   mundo_w, mundo_h, self.block)
+        self._fundo_chave:  tuple = ()     # (versão da câmara, versão do mapa)
         self.assets       = AssetsManager()
         self.particulas   = SistemaDeParticulas()
         self.tremida      = TremidaEcra()
         self.musica       = GestorMusica()   # singleton — partilhado entre sessões
+        self.musica.precarregar_sfx()      # no-op se o menu já a lançou
+
+        # ── Perfil de frames ──────────────────────────────────────────────────
+        # Sempre a medir (custo de ~1 µs por frame); F3 só controla o overlay
+        self.perfil         = PerfilFrames()
+        self.entrada        = Entrada()
+        self.overlay_perfil = OverlayPerfil(
+            self.perfil, extras=(self._resumo_sfx, self.entrada.resumo))
 
         # ── Aliases de compatibilidade ────────────────────────────────────────
         # Os modos de jogo (player_vs_ai, modo_1v1, og_snake) acedem a estas
@@ -127,21 +224,40 @@ class Game:
         #self.particles = self.particulas
         self.shake     = self.tremida
 
-        mult           = cfg.DIFICULDADES.get(dificuldade, 1.0)
+        mult           = (replay.meta["multiplicador"] if replay is not None
+                          else cfg.DIFICULDADES.get(dificuldade, 1.0))
         self.score     = Score(multiplicador=mult)
         self.base_fps  = FPS
 
         self.hud = HUD(jogador=player_name, modo=modo, dificuldade=dificuldade)
         self.hud.atualizar_info(nome_p2=player2_name)
 
-        if   self.modo == cfg.MODO_1V1:   self.modo_atual = Modo1v1(self)
-        elif self.modo == cfg.MODO_VS_AI: self.modo_atual = PlayerVsAI(self)
-        else:                             self.modo_atual = OgSnake(self)
+        self.modo_atual = _classe_modo(self.modo)(self)
+        self.camara.centrar(self.modo_atual.alvo_camara())
+
+        # ── Gravação / reprodução ─────────────────────────────────────────────
+        self.gravador:   Optional[GravadorReplay]   = None
+        self.reprodutor: Optional[ReprodutorReplay] = None
+        if replay is not None:
+            self.reprodutor = ReprodutorReplay(replay, sim=self.modo_atual.sim)
+            self.modo_atual.iniciar_reproducao()
+        else:
+            self.gravador = GravadorReplay(seed, self._meta_replay())
+            self.modo_atual.sim.gravador = self.gravador
 
         # Música de jogo — 1v1 não tem dificuldade, usa "Normal" como fallback.
         dif_musica = dificuldade if modo != cfg.MODO_1V1 else "Normal"
         self.musica.tocar_jogo(dif_musica)
 
+    @classmethod
+    def de_replay(cls, replay: Replay) -> "Game":
+        """Jogo que reproduz `replay` no ecrã (o teclado só serve para sair)."""
+        m = replay.meta
+        return cls(player_name=m.get("jogador", "Player"), modo=m["modo"],
+                   dificuldade=m.get("dificuldade", "Normal"),
+                   velocidade_mult=m.get("velocidade_mult", 1.0),
+                   player2_name=m.get("jogador2", "Player 2"), replay=replay)
+
     # ── API pública para os modos ─────────────────────────────────────────────
 
     def disparar_tremida(self, intensity: float = 8.0, duration: float = 0.35) -> None:
@@ -152,6 +268,11 @@ class Game:
         """Atalho para os modos tocarem efeitos sonoros sem importar GestorMusica."""
         self.musica.tocar_sfx(nome)
 
+    def _resumo_sfx(self) -> str:
+        e = self.musica.estatisticas_sfx()
+        return (f"sfx: {e['acertos']} acertos  {e['falhas']} falhas  "
+                f"{e['roubados']} roubados  {e['descartados']} desc.")
+
     # ── Aliases de compatibilidade (nomes antigos usados nalguns modos) ───────
     trigger_shake = disparar_tremida
 
@@ -165,31 +286,124 @@ class Game:
             if ev.type == pygame.VIDEORESIZE:
                 self.screen = pygame.display.set_mode(
                     (ev.w, ev.h), pygame.RESIZABLE)
+                self._forcar_completo = True
             if ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE:
                 self.running = False
                 return
+            if ev.type == pygame.KEYDOWN and ev.key == pygame.K_F3:
+                self.overlay_perfil.alternar()
+                self._forcar_completo = True
+                continue
+            if ev.type == pygame.KEYDOWN and ev.key == pygame.K_F4:
+                self._exportar_perfil()
+                continue
+            if self.reprodutor is not None:      # as entradas vêm do replay
+                continue
             self.modo_atual.handle_event(ev)
 
+    def _exportar_perfil(self) -> None:
+        """Grava o buffer do perfil em CSV e mostra o caminho no overlay."""
+        try:
+            caminho = self.perfil.exportar_csv()
+            self.overlay_perfil.mensagem = f"CSV: {caminho}"
+            print(f"[PERFIL] {len(self.perfil)} frames exportados para {caminho}")
+        except OSError as e:
+            self.overlay_perfil.mensagem = "Erro ao exportar CSV"
+            print(f"[ERRO] Não foi possível exportar o perfil: {e}")
+
     def actualizar(self) -> None:
         self.modo_atual.update()
+        self.entrada.fim_tick(self.modo_atual.sim, self.modo_atual.started)
+        self.camara.seguir(self.modo_atual.alvo_camara())
+
+    # ── Replays ───────────────────────────────────────────────────────────────
+
+    def _meta_replay(self) -> dict:
+        """Tudo o que é preciso para recriar a simulação e o ecrã do tick 0."""
+        meta = {
+            "modo":            self.modo,
+            "dificuldade":     self.dificuldade,
+            "multiplicador":   self.score.multiplicador,
+            "jogador":         self.player_name,
+            "jogador2":        self.player2_name,
+            "velocidade_mult": self.velocidade_mult,
+            "base_fps":        self.base_fps,
+            "block":           self.block,
+            "area":            list(self.mapa.area_pixels),
+            "mapa":            self.mapa.para_dados(),
+            "data":            time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        if self.modo == cfg.MODO_1V1:
+            meta["nome_p1"] = self.player_name
+        return meta
+
+    def _guardar_replay(self) -> Optional[str]:
+        """
+        Grava a partida em replays/ (uma vez por sessão) e apaga os mais
+        antigos. Devolve o caminho do ficheiro, ou None se não gravou.
+        """
+        gravador, self.gravador = self.gravador, None
+        if gravador is None or gravador.n_ticks == 0:
+            return None
+        self.modo_atual.sim.gravador = None
+        pasta   = caminho_dados_utilizador("replays")
+        nome    = "{}_{}_{:04x}.snkr".format(time.strftime("%Y%m%d_%H%M%S"),
+                                             self.modo.replace(" ", "_"),
+                                             self.seed & 0xFFFF)
+        caminho = os.path.join(pasta, nome)
+        try:
+            os.makedirs(pasta, exist_ok=True)
+            gravador.para_replay().guardar(caminho)
+            antigos = sorted(f for f in os.listdir(pasta) if f.endswith(".snkr"))
+            for f in antigos[:-MAX_REPLAYS]:
+                os.remove(os.path.join(pasta, f))
+        except OSError as e:
+            print(f"[ERRO] Não foi possível guardar o replay: {e}")
+            return None
+        return caminho
+
+    def _obter_fundo(self) -> pygame.Surface:
+        """
+        Fundo estático (cor, grelha e mapa) da vista actual — composto uma vez
+        e reutilizado até a câmara mexer ou o mapa mudar.
+        """
+        cam = self.camara
+        if self._fundo is None or self._fundo_chave != self._chave_fundo():
+            if self._fundo is None:
+                self._fundo = pygame.Surface(self._logical_size)
+            fundo = self._fundo
+            fundo.fill(cfg.BG_DARK)
+
+            # Grelha só na parte do tabuleiro que está na vista (esquerda da sidebar)
+            bx0, by0, bx1, by1 = cam.celulas_visiveis()
+            b = self.block
+            x0, x1 = bx0 * b - cam.x, bx1 * b - cam.x
+            y0, y1 = by0 * b - cam.y, by1 * b - cam.y
+            fundo.set_clip(pygame.Rect(0, 0, cam.w, cam.h))
+            for x in range(x0, x1, b):
+                pygame.draw.line(fundo, cfg.GRID_LINE, (x, y0), (x, y1))
+            for y in range(y0, y1, b):
+                pygame.draw.line(fundo, cfg.GRID_LINE, (x0, y), (x1, y))
+
+            self.map_renderer.draw(fundo, camara=cam)
+            fundo.set_clip(None)
+            self._fundo_chave = self._chave_fundo()
+        return self._fundo
+
+    def _chave_fundo(self) -> tuple:
+        return (self.camara.versao, self.mapa.versao)
 
     def desenhar_logico(self) -> None:
         """Compõe a superfície lógica: fundo, grelha, mapa, entidades, partículas e HUD."""
-        self.surface.fill(cfg.BG_DARK)
-
-        # Grelha apenas na área de jogo (esquerda da sidebar)
-        for x in range(0, cfg.SCREEN_WIDTH, self.block):
-            pygame.draw.line(self.surface, cfg.GRID_LINE,
-                             (x, 0), (x, cfg.SCREEN_HEIGHT))
-        for y in range(0, cfg.SCREEN_HEIGHT, self.block):
-            pygame.draw.line(self.surface, cfg.GRID_LINE,
-                             (0, y), (cfg.SCREEN_WIDTH, y))
-
-        self.map_renderer.draw(self.surface)
+        perfil = self.perfil
+        self.surface.blit(self._obter_fundo(), (0, 0))
+        perfil.marcar("mapa")
         self.modo_atual.draw(self.surface)
+        perfil.marcar("modo")
 
         # Partículas por cima das entidades, antes do HUD
-        self.particulas.draw(self.surface)
+        self.particulas.draw(self.surface, self.camara)
+        perfil.marcar("part_desenho")
 
         # HUD sidebar — o modo fornece os dados via hud_info()
         self.hud.draw_sidebar(
@@ -197,12 +411,18 @@ class Game:
             self.modo_atual.hud_info(),
             self.modo,
         )
+        perfil.marcar("hud")
+
+        self.overlay_perfil.draw(self.surface)
+        perfil.marcar("overlay")
 
     def run(self) -> bool:
         """
         Loop com separação lógica / visual:
           - Visual a ALVO_FPS_VISUAIS (60 fps) — partículas, shake, animações do HUD.
-          - Lógica a base_fps × velocidade_mult — movimento da cobra.
+          - Lógica a base_fps × velocidade_mult — movimento da cobra, no
+            máximo MAX_PASSOS_LOGICOS por frame (o atraso a mais é descartado).
+          - As cobras são desenhadas interpoladas pela fracção do acumulador.
 
         Devolve True se o jogador escolheu jogar de novo.
         """
@@ -210,34 +430,64 @@ class Game:
             1.0, self.base_fps * self.velocidade_mult
         )
         acumulador: float = 0.0
+        perfil = self.perfil
+        self.entrada.ativar(comandos=self.modo_atual.usa_comandos())
 
         while self.running:
             dt_ms = self.clock.tick(ALVO_FPS_VISUAIS)
             dt    = min(dt_ms / 1000.0, 0.1)
+            perfil.inicio_frame()
 
-            eventos = pygame.event.get()
+            eventos = self.entrada.recolher()
             self.handle_events(eventos)
+            perfil.marcar("eventos")
             if not self.running:
                 break
 
-            # Passo lógico a timestep fixo
+            # Passo lógico a timestep fixo, com recuperação limitada
             acumulador += dt_ms
-            while acumulador >= intervalo_logico and self.running:
+            passos = 0
+            while (acumulador >= intervalo_logico and self.running
+                   and passos < MAX_PASSOS_LOGICOS):
                 self.actualizar()
                 acumulador -= intervalo_logico
+                passos     += 1
+            descartados = int(acumulador // intervalo_logico)
+            if descartados:
+                acumulador -= descartados * intervalo_logico
+                self.passos_descartados += descartados
+            if self.interpolar:
+                self.alfa = acumulador / intervalo_logico
+            perfil.contar("passos", passos)
+            perfil.contar("descartados", descartados)
+            perfil.contar("alfa", self.alfa or 0.0)
+            perfil.contar("latencia", self.entrada.latencia_do_frame())
+            perfil.marcar("logica")
 
             # Actualizações visuais a cada frame (60 fps)
             self.particulas.update(dt)
+            perfil.marcar("particulas")
             self.tremida.actualizar(dt)
             self.hud.update(dt)          # pop de pontuação e outras animações do HUD
 
             # visual_update é opcional — nem todos os modos o implementam
             if hasattr(self.modo_atual, "visual_update"):
                 self.modo_atual.visual_update(dt)
-
-            self.desenhar_logico()
-            self._blit_com_tremida()
-
+            perfil.marcar("visual")
+
+            rects = self._desenhar_sujo() if self.render_sujo else None
+            if rects is None:
+                self.desenhar_logico()
+                self._blit_com_tremida()
+            else:
+                self._apresentar_sujos(rects)
+            self._forcar_completo = False
+            self._tremia          = self.tremida.ativa
+            perfil.fim_frame()
+            arranque.primeiro_frame()
+
+        self.entrada.desativar()
+        self._guardar_replay()
         try:
             pygame.display.set_mode(
                 (cfg.SCREEN_WIDTH + cfg.SIDEBAR_W, cfg.SCREEN_HEIGHT),
@@ -248,42 +498,145 @@ class Game:
 
         return self.jogar_de_novo
 
-    def _blit_com_tremida(self) -> None:
-        """Escala a superfície lógica para a janela física com offset de screen shake."""
+    # ── Render por dirty rects ────────────────────────────────────────────────
+
+    def _desenhar_sujo(self) -> Optional[List[pygame.Rect]]:
+        """
+        Repõe o fundo e redesenha só nas zonas que mudaram (cobras que mexeram,
+        comida, partículas, sidebar se algum campo do HUD mudou).
+
+        Devolve os rects lógicos a apresentar, ou None quando é preciso um
+        frame completo (overlay, shake, resize ou demasiadas zonas sujas).
+        """
+        if self.overlay_perfil.visivel:
+            return None
+        rects_modo = self.modo_atual.rects_sujos()
+        # Com muitas partículas o frame vai ser completo de qualquer forma —
+        # None aqui também força o completo no frame seguinte (para as apagar)
+        part_agora = (self.particulas.rects(self.camara)
+                      if self.particulas.count <= _MAX_RECTS_SUJOS else None)
+        part_ant, self._rects_particulas = self._rects_particulas, part_agora
+        info = self.modo_atual.hud_info()
+
+        if (rects_modo is None or part_agora is None or part_ant is None
+                or self._forcar_completo or self.tremida.ativa or self._tremia
+                or self._fundo_chave != self._chave_fundo()):
+            return None
+
+        rects = rects_modo + part_ant + part_agora
+        sx    = cfg.SCREEN_WIDTH
+        hud_sujo = (self.hud.precisa_redesenho(info)
+                    or any(r.right >= sx - 2 for r in rects))
+        if hud_sujo:
+            rects.append(pygame.Rect(sx - 2, 0, cfg.SIDEBAR_W + 2, self.logical_h))
+
+        area = sum(r.w * r.h for r in rects)
+        if (len(rects) > _MAX_RECTS_SUJOS
+                or area > self.logical_w * self.logical_h * _FRACAO_MAX_SUJA):
+            return None
+
+        perfil = self.perfil
+        perfil.marcar("modo")
+        fundo = self._obter_fundo()
+        for r in rects:
+            self.surface.blit(fundo, r, r)
+        perfil.marcar("mapa")
+        self.modo_atual.draw(self.surface)
+        perfil.marcar("modo")
+        self.particulas.draw(self.surface, self.camara)
+        perfil.marcar("part_desenho")
+        if hud_sujo:
+            self.hud.draw_sidebar(self.surface, info, self.modo)
+        perfil.marcar("hud")
+        return rects
+
+    def _apresentar_sujos(self, rects: List[pygame.Rect]) -> None:
+        """Escala para a janela apenas os rects alterados e actualiza só essas zonas."""
         win_w, win_h = self.screen.get_size()
-        if win_w < 32 or win_h < 32:
-            pygame.event.pump()
-            pygame.time.wait(100)
+        geo = self._calcular_geometria(win_w, win_h)
+        if geo is None or geo != self._geometria:
+            self._blit_com_tremida()
             return
 
+        sw, sh, ox, oy = geo
+        log_w, log_h   = self._logical_size
+        ex, ey         = sw / log_w, sh / log_h
+        limites        = self.surface.get_rect()
+        janela: List[pygame.Rect] = []
+
+        for r in rects:
+            r = r.clip(limites)
+            if not r.w or not r.h:
+                continue
+            if (sw, sh) == (log_w, log_h):
+                wr = pygame.Rect(ox + r.x, oy + r.y, r.w, r.h)
+                self.screen.blit(self.surface, wr, r)
+            else:
+                x0, y0 = ox + int(r.x * ex), oy + int(r.y * ey)
+                wr = pygame.Rect(x0, y0,
+                                 max(1, ox + math.ceil(r.right  * ex) - x0),
+                                 max(1, oy + math.ceil(r.bottom * ey) - y0))
+                parte = self.surface.subsurface(r)
+                try:
+                    parte = pygame.transform.smoothscale(parte, wr.size)
+                except Exception:
+                    parte = pygame.transform.scale(parte, wr.size)
+                self.screen.blit(parte, wr)
+            janela.append(wr)
+        self.perfil.marcar("escala")
+
+        pygame.display.update(janela)
+        self.perfil.marcar("flip")
+
+    def _calcular_geometria(self, win_w: int, win_h: int) -> Optional[tuple]:
+        """(largura, altura, x, y) da superfície lógica escalada e centrada na janela."""
+        if win_w < 32 or win_h < 32:
+            return None
         log_w, log_h = self._logical_size
         escala = min(win_w / log_w, win_h / log_h)
         sw     = max(1, int(log_w * escala))
         sh     = max(1, int(log_h * escala))
+        return (sw, sh, (win_w - sw) // 2, (win_h - sh) // 2)
+
+    def _blit_com_tremida(self) -> None:
+        """Escala a superfície lógica para a janela física com offset de screen shake."""
+        win_w, win_h = self.screen.get_size()
+        geo = self._calcular_geometria(win_w, win_h)
+        if geo is None:
+            pygame.event.pump()
+            pygame.time.wait(100)
+            return
+        self._geometria = geo
+        sw, sh, ox, oy  = geo
 
         try:
             scaled = pygame.transform.smoothscale(self.surface, (sw, sh))
         except Exception:
             scaled = pygame.transform.scale(self.surface, (sw, sh))
 
-        ox = (win_w - sw) // 2
-        oy = (win_h - sh) // 2
         dox, doy = self.tremida.deslocamento
         ox += dox
         oy += doy
 
         self.screen.fill(cfg.BLACK)
         self.screen.blit(scaled, (ox, oy))
+        self.perfil.marcar("escala")
         pygame.display.flip()
+        self.perfil.marcar("flip")
 
     # ── Fim de jogo ───────────────────────────────────────────────────────────
 
+    def _guardar_pontuacao(self, *args) -> None:
+        """Recordes só contam em partidas a sério — um replay não grava nada."""
+        if self.reprodutor is None:
+            self.records.guardar_pontuacao(*args)
+
     def game_over(self) -> None:
         """Fim do modo OG Snake: guarda pontuação e encerra o loop."""
         self.musica.tocar_sfx("Morte")
         self.musica.fade_out(600)
         try:
-            self.records.guardar_pontuacao(
+            self._guardar_pontuacao(
                 self.hud.jogador, self.hud.modo,
                 self.hud.dificuldade, self.score.obter_pontuacao(),
             )
@@ -302,9 +655,9 @@ class Game:
                  if hasattr(self.modo_atual, "snake2") else 0
 
         try:
-            self.records.guardar_pontuacao(
+            self._guardar_pontuacao(
                 self.player_name,  "1v1", self.dificuldade, pts_p1)
-            self.records.guardar_pontuacao(
+            self._guardar_pontuacao(
                 self.player2_name, "1v1", self.dificuldade, pts_p2)
         except Exception:
             pass
@@ -316,15 +669,15 @@ class Game:
         self.musica.tocar_sfx("Morte")
         self.musica.fade_out(600)
         try:
-            self.records.guardar_pontuacao(
+            self._guardar_pontuacao(
                 self.player_name, "Vs AI", self.dificuldade, pts_jogador)
         except Exception:
             pass
 
-        f_titulo = pygame.font.SysFont("Consolas", 62, bold=True)
-        f_sub    = pygame.font.SysFont("Consolas", 28)
-        f_info   = pygame.font.SysFont("Consolas", 22)
-        f_btn    = pygame.font.SysFont("Consolas", 26)
+        f_titulo = fontes.fonte(62, negrito=True)
+        f_sub    = fontes.fonte(28)
+        f_info   = fontes.fonte(22)
+        f_btn    = fontes.fonte(26)
 
         if resultado == "vitoria":
             titulo_txt, titulo_cor = "Vitória!", cfg.RESULT_WIN
@@ -339,10 +692,12 @@ class Game:
         cx, cy   = self.logical_w // 2, self.logical_h // 2
         btn_rect = pygame.Rect(cx - 130, cy + 120, 260, 52)
         relogio  = pygame.time.Clock()
+        self.entrada.desativar()            # o ecrã de fim usa o rato
 
         while True:
             for ev in pygame.event.get():
                 if ev.type == pygame.QUIT:
+                    self._guardar_replay()
                     pygame.quit(); sys.exit()
                 if ev.type == pygame.VIDEORESIZE:
                     self.screen = pygame.display.set_mode(
@@ -370,16 +725,16 @@ class Game:
             pygame.draw.rect(ps, cfg.OVERLAY_PANEL_BORDER_VSAI, ps.get_rect(), 1, border_radius=14)
             self.surface.blit(ps, painel.topleft)
 
-            t = f_titulo.render(titulo_txt, True, titulo_cor)
+            t = fontes.texto(f_titulo, titulo_txt, titulo_cor)
             self.surface.blit(t, t.get_rect(center=(cx, cy - 120)))
-            sub = f_sub.render(sub_txt, True, (200, 210, 200))
+            sub = fontes.texto(f_sub, sub_txt, (200, 210, 200))
             self.surface.blit(sub, sub.get_rect(center=(cx, cy - 55)))
             pygame.draw.line(self.surface, (60, 80, 60),
                              (cx - 200, cy - 20), (cx + 200, cy - 20), 1)
-            s1 = f_info.render(
-                f"{self.player_name}:  {pts_jogador} pts", True, (120, 220, 140))
-            s2 = f_info.render(
-                f"Bot:  {pts_bot} pts", True, (220, 100, 100))
+            s1 = fontes.texto(
+                f_info, f"{self.player_name}:  {pts_jogador} pts", (120, 220, 140))
+            s2 = fontes.texto(
+                f_info, f"Bot:  {pts_bot} pts", (220, 100, 100))
             self.surface.blit(s1, s1.get_rect(center=(cx, cy + 20)))
             self.surface.blit(s2, s2.get_rect(center=(cx, cy + 55)))
 
@@ -388,9 +743,9 @@ class Game:
             bc = (50, 120, 70) if btn_rect.collidepoint(mlog) else (35, 90, 50)
             pygame.draw.rect(self.surface, bc, btn_rect, border_radius=8)
             pygame.draw.rect(self.surface, (80, 160, 100), btn_rect, 1, border_radius=8)
-            bt = f_btn.render("Voltar ao Menu", True, WHITE)
+            bt = fontes.texto(f_btn, "Voltar ao Menu", WHITE)
             self.surface.blit(bt, bt.get_rect(center=btn_rect.center))
-            dica = f_info.render("ENTER / ESC  ·  voltar", True, (90, 100, 90))
+            dica = fontes.texto(f_info, "ENTER / ESC  ·  voltar", (90, 100, 90))
             self.surface.blit(dica, dica.get_rect(center=(cx, btn_rect.bottom + 28)))
 
             ui_utils.blit_scaled(self.screen, self.surface, self._logical_size)
@@ -400,10 +755,10 @@ class Game:
 
     def _ecra_fim_1v1(self, resultado: str, pts_p1: int, pts_p2: int) -> None:
         """Mostra o ecrã de resultado do modo 1v1 e aguarda input do jogador."""
-        f_titulo = pygame.font.SysFont("Consolas", 56, bold=True)
-        f_sub    = pygame.font.SysFont("Consolas", 26)
-        f_info   = pygame.font.SysFont("Consolas", 20)
-        f_btn    = pygame.font.SysFont("Consolas", 24)
+        f_titulo = fontes.fonte(56, negrito=True)
+        f_sub    = fontes.fonte(26)
+        f_info   = fontes.fonte(20)
+        f_btn    = fontes.fonte(24)
 
         if "P2" in resultado or (
                 self.player2_name and self.player2_name in resultado):
@@ -419,10 +774,12 @@ class Game:
         cx, cy   = self.logical_w // 2, self.logical_h // 2
         btn_rect = pygame.Rect(cx - 130, cy + 120, 260, 52)
         relogio  = pygame.time.Clock()
+        self.entrada.desativar()            # o ecrã de fim usa o rato
 
         while True:
             for ev in pygame.event.get():
                 if ev.type == pygame.QUIT:
+                    self._guardar_replay()
                     pygame.quit(); sys.exit()
                 if ev.type == pygame.VIDEORESIZE:
                     self.screen = pygame.display.set_mode(
@@ -450,18 +807,18 @@ class Game:
             pygame.draw.rect(ps, cfg.OVERLAY_PANEL_BORDER_1V1, ps.get_rect(), 1, border_radius=14)
             self.surface.blit(ps, painel.topleft)
 
-            t = f_titulo.render(titulo_txt, True, titulo_cor)
+            t = fontes.texto(f_titulo, titulo_txt, titulo_cor)
             self.surface.blit(t, t.get_rect(center=(cx, cy - 120)))
             pygame.draw.line(self.surface, (50, 55, 75),
                              (cx - 200, cy - 60), (cx + 200, cy - 60), 1)
 
-            s1 = f_info.render(
-                f"{self.player_name}  {pts_p1} pts", True, cfg.SNAKE1_HEAD)
-            s2 = f_info.render(
-                f"{self.player2_name}  {pts_p2} pts", True, cfg.SNAKE2_HEAD)
+            s1 = fontes.texto(
+                f_info, f"{self.player_name}  {pts_p1} pts", cfg.SNAKE1_HEAD)
+            s2 = fontes.texto(
+                f_info, f"{self.player2_name}  {pts_p2} pts", cfg.SNAKE2_HEAD)
             self.surface.blit(s1, s1.get_rect(center=(cx - 110, cy - 20)))
             self.surface.blit(s2, s2.get_rect(center=(cx + 110, cy - 20)))
-            vs = f_sub.render("vs", True, (80, 80, 100))
+            vs = fontes.texto(f_sub, "vs", (80, 80, 100))
             self.surface.blit(vs, vs.get_rect(center=(cx, cy - 20)))
             pygame.draw.line(self.surface, (50, 55, 75),
                              (cx - 200, cy + 20), (cx + 200, cy + 20), 1)
@@ -471,9 +828,9 @@ class Game:
             bc = (40, 90, 160) if btn_rect.collidepoint(mlog) else (30, 65, 120)
             pygame.draw.rect(self.surface, bc, btn_rect, border_radius=8)
             pygame.draw.rect(self.surface, (70, 130, 210), btn_rect, 1, border_radius=8)
-            bt = f_btn.render("Voltar ao Menu", True, WHITE)
+            bt = fontes.texto(f_btn, "Voltar ao Menu", WHITE)
             self.surface.blit(bt, bt.get_rect(center=btn_rect.center))
-            dica = f_info.render("ENTER / ESC  ·  voltar", True, (80, 90, 110))
+            dica = fontes.texto(f_info, "ENTER / ESC  ·  voltar", (80, 90, 110))
             self.surface.blit(dica, dica.get_rect(center=(cx, btn_rect.bottom + 28)))
 
             ui_utils.blit_scaled(self.screen, self.surface, self._logical_size)
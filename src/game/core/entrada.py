@@ -0,0 +1,221 @@
+# src/game/core/entrada.py
+"""
+Entrada do jogador durante a partida: teclado e comandos (joysticks).
+
+  - Filtro de eventos: durante o jogo só entram na fila os tipos que o
+    jogo usa (pygame.event.set_allowed) — o MOUSEMOTION e os eventos de
+    janela deixam de encher a fila a cada frame. desativar() volta a
+    deixar passar tudo (ecrãs de fim e menu usam o rato).
+  - Comandos: ligados só quando o modo os usa (o joystick fica fora do
+    init selectivo do arranque). O d-pad (hat) e os eixos analógicos dão
+    direcções; um stick arcade aparece como um ou outro. O jogador de cada
+    comando é a ordem em que foi ligado (o 1.º é do P1, o 2.º do P2).
+  - Latência entrada → movimento: cada direcção aceite pela cobra leva o
+    instante em que o lote de eventos foi recolhido; quando um tick lógico
+    a consome do buffer, a diferença entra nas estatísticas (p50/p95 no
+    overlay F3, máximo por frame no contador "latencia" do perfil).
+
+As direcções continuam a passar por Simulacao.enfileirar() — os replays
+gravam-nas exactamente como antes.
+"""
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Dict, Optional, Sequence, Tuple
+
+import pygame
+
+from game.core        import arranque
+from game.core.perfil import percentil
+
+Direcao = Tuple[int, int]
+
+# Tipos de evento que o jogo trata durante a partida
+EVENTOS_JOGO: tuple = (pygame.QUIT, pygame.VIDEORESIZE, pygame.KEYDOWN)
+EVENTOS_COMANDO: tuple = (pygame.JOYHATMOTION, pygame.JOYAXISMOTION,
+                          pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED)
+
+# Eixo analógico acima disto (em módulo) conta como direcção
+ZONA_MORTA: float = 0.5
+
+_AMOSTRAS: int = 256     # latências guardadas para os percentis
+
+
+class Entrada:
+    """Recolhe, filtra e traduz os eventos de entrada de uma partida."""
+
+    def __init__(self) -> None:
+        self._ativa:        bool               = False
+        self._com_comandos: bool               = False
+        self._comandos:     Dict[int, object]  = {}   # instance_id → Joystick, por ordem de ligação
+        self._digital:      Dict[int, Direcao] = {}   # último (x, y) digital de cada comando
+        self._emitida:      Dict[int, Direcao] = {}   # última direcção dada (até voltar ao centro)
+        self._t_lote:       float              = 0.0
+
+        # quem → instantes das direcções ainda no buffer da cobra (mesma ordem);
+        # None = chegou antes do jogo começar, não conta para a latência
+        self._pendentes: Dict[str, deque] = {}
+        self.latencias:  deque = deque(maxlen=_AMOSTRAS)     # ms
+        self.aplicadas:  int   = 0
+        self._maior_frame: float = 0.0
+
+    # ── Filtro ────────────────────────────────────────────────────────────────
+
+    def ativar(self, comandos: bool = False) -> None:
+        """Só deixa entrar na fila os eventos do jogo (e dos comandos, se usados)."""
+        tipos = EVENTOS_JOGO
+        if comandos:
+            self._ligar_comandos()
+            tipos += EVENTOS_COMANDO
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(tipos))
+        self._ativa = True
+
+    def desativar(self) -> None:
+        """Volta a aceitar todos os eventos (ecrãs com rato)."""
+        if self._ativa:
+            pygame.event.set_allowed(None)
+            self._ativa = False
+
+    # ── Recolha ───────────────────────────────────────────────────────────────
+
+    def recolher(self) -> list:
+        """Eventos pendentes, já sem os de ligar/desligar comandos."""
+        eventos = pygame.event.get()
+        self._t_lote = time.perf_counter()
+        if not self._com_comandos:
+            return eventos
+        resto = []
+        for ev in eventos:
+            if ev.type == pygame.JOYDEVICEADDED:
+                self._abrir(ev.device_index)
+            elif ev.type == pygame.JOYDEVICEREMOVED:
+                self._comandos.pop(ev.instance_id, None)
+                self._digital.pop(ev.instance_id, None)
+                self._emitida.pop(ev.instance_id, None)
+            else:
+                resto.append(ev)
+        return resto
+
+    def traduzir(self, ev, teclas: Dict[str, dict],
+                 comandos: Sequence[str] = ()) -> Optional[Tuple[str, Direcao]]:
+        """
+        (jogador, direcção) de um evento, ou None se não é uma direcção.
+
+        `teclas` mapeia cada jogador para o seu dicionário tecla → direcção;
+        `comandos` diz de que jogador é cada comando, pela ordem de ligação.
+        """
+        if ev.type == pygame.KEYDOWN:
+            for quem, tabela in teclas.items():
+                if ev.key in tabela:
+                    return quem, tabela[ev.key]
+            return None
+        if ev.type not in (pygame.JOYHATMOTION, pygame.JOYAXISMOTION):
+            return None
+        ids = list(self._comandos)
+        if ev.instance_id not in ids or ids.index(ev.instance_id) >= len(comandos):
+            return None
+        direcao = self._direcao_comando(ev)
+        if direcao is None:
+            return None
+        return comandos[ids.index(ev.instance_id)], direcao
+
+    # ── Encaminhamento e latência ─────────────────────────────────────────────
+
+    def enfileirar(self, sim, quem: str, direcao: Direcao) -> bool:
+        """Passa a direcção à simulação e, se a cobra a aceitou, marca o instante."""
+        cobra  = sim.cobras[quem]
+        antes  = cobra.entradas_pendentes()
+        aceite = sim.enfileirar(quem, direcao)
+        if aceite:
+            pend = self._pendentes.setdefault(quem, deque())
+            if cobra.entradas_pendentes() == antes and pend:   # buffer cheio: saiu a mais antiga
+                pend.popleft()
+            pend.append(self._t_lote)
+        return aceite
+
+    def fim_tick(self, sim, em_jogo: bool) -> None:
+        """Depois de um tick lógico: as direcções consumidas contam para a latência."""
+        agora = time.perf_counter()
+        for quem, pend in self._pendentes.items():
+            if not em_jogo:                  # à espera/countdown: a cobra não mexe
+                n = len(pend)
+                pend.clear()
+                pend.extend([None] * n)
+                continue
+            for _ in range(len(pend) - sim.cobras[quem].entradas_pendentes()):
+                t = pend.popleft()
+                if t is None:
+                    continue
+                ms = (agora - t) * 1000.0
+                self.latencias.append(ms)
+                self.aplicadas    += 1
+                self._maior_frame  = max(self._maior_frame, ms)
+
+    def latencia_do_frame(self) -> float:
+        """Maior latência (ms) das direcções aplicadas desde a última chamada."""
+        ms, self._maior_frame = self._maior_frame, 0.0
+        return ms
+
+    def estatisticas(self) -> dict:
+        ordenados = sorted(self.latencias)
+        return {
+            "aplicadas": self.aplicadas,
+            "p50":       percentil(ordenados, 50),
+            "p95":       percentil(ordenados, 95),
+            "max":       ordenados[-1] if ordenados else 0.0,
+            "comandos":  len(self._comandos),
+        }
+
+    def resumo(self) -> str:
+        e = self.estatisticas()
+        return (f"entrada: p50 {e['p50']:.0f} ms  p95 {e['p95']:.0f} ms  "
+                f"máx {e['max']:.0f} ms  ({e['aplicadas']})  comandos {e['comandos']}")
+
+    # ── Comandos ──────────────────────────────────────────────────────────────
+
+    def _ligar_comandos(self) -> None:
+        if not pygame.joystick.get_init():
+            with arranque.fase("pygame.joystick.init"):
+                pygame.joystick.init()
+        for i in range(pygame.joystick.get_count()):
+            self._abrir(i)
+        self._com_comandos = True
+
+    def _abrir(self, indice: int) -> None:
+        try:
+            joy = pygame.joystick.Joystick(indice)
+        except pygame.error:
+            return
+        if joy.get_instance_id() not in self._comandos:
+            self._comandos[joy.get_instance_id()] = joy
+            self._digital[joy.get_instance_id()]  = (0, 0)
+
+    def _direcao_comando(self, ev) -> Optional[Direcao]:
+        """Direcção nova de um hat ou eixo; None se não mudou ou voltou ao centro."""
+        ant = self._digital.get(ev.instance_id, (0, 0))
+        if ev.type == pygame.JOYHATMOTION:
+            x, y = ev.value[0], -ev.value[1]          # hat: y = 1 é para cima
+        elif ev.axis in (0, 1):
+            v = 0 if abs(ev.value) < ZONA_MORTA else (1 if ev.value > 0 else -1)
+            x, y = (v, ant[1]) if ev.axis == 0 else (ant[0], v)
+        else:
+            return None
+        self._digital[ev.instance_id] = (x, y)
+        if (x, y) == ant:
+            return None
+        if x and y:                      # diagonal: vale o eixo que acabou de mudar
+            if x != ant[0] and y == ant[1]:
+                y = 0
+            elif y != ant[1] and x == ant[0]:
+                x = 0
+            else:
+                return None
+        if not (x or y):                 # de volta ao centro
+            self._emitida.pop(ev.instance_id, None)
+            return None
+        if self._emitida.get(ev.instance_id) == (x, y):
+            return None                  # ex.: saiu da diagonal para o eixo já dado
+        self._emitida[ev.instance_id] = (x, y)
+        return x, y
@@ -10,10 +10,35 @@ Mapeamento dificuldade → faixa:
   Rapido       → musica/rapido.ogg
   Muito Rapido → musica/muito_rapido.ogg
   (menu)       → musica/menu.ogg
+
+Música (_ControladorMusica):
+  - tocar_menu()/tocar_jogo()/fade_out() só registam a faixa desejada e
+    voltam logo; uma thread faz o fade-out por volume ao longo de vários
+    passos, troca de faixa já em silêncio e faz o fade-in. Nunca se usa
+    mixer.music.fadeout(): um load() durante esse fade bloqueia até ele
+    acabar, e era esse o soluço ao entrar numa partida e ao voltar ao menu;
+  - as faixas são lidas do disco pela thread (preparar_jogo() abre a
+    seguinte antes de ser precisa) e carregadas de memória;
+  - um pedido a meio de uma transição substitui o anterior — só conta o
+    último, e voltar à faixa que está a sair faz apenas fade-in.
+
+SFX:
+  - precarregar_sfx() descodifica todos os .ogg de efeitos_sonoros/ numa
+    thread em segundo plano (chamado com o menu no ecrã), para o primeiro
+    tocar_sfx de uma partida não parar o tick lógico a descodificar;
+  - os efeitos tocam num conjunto fixo de canais reservados (_N_CANAIS_SFX);
+    com todos ocupados, o novo efeito rouba o canal de menor prioridade
+    (o mais antigo entre iguais), se essa prioridade não for maior do que
+    a sua — uma rajada de "SomDeComer" nunca corta a "Morte";
+  - estatisticas_sfx(): acertos/falhas da cache, vozes roubadas e efeitos
+    descartados (todos os canais com prioridade maior).
 """
 
 from __future__ import annotations
+import io
 import os
+import threading
+import time
 import pygame
 
 from game.core.caminhos import caminho_recurso
@@ -26,7 +51,155 @@ _MUSICA_JOGO: dict[str, str] = {
     "Muito Rapido": "Kore",
 }
 
-_FADE_TROCA_MS: int = 600  # fade-out antes de trocar de faixa (ms)
+_FADE_TROCA_MS:   int   = 600    # fade-out antes de trocar de faixa (ms)
+_FADE_ENTRADA_MS: int   = 400    # fade-in da faixa nova (ms)
+_PASSO_FADE_S:    float = 0.015  # intervalo entre passos de volume da thread
+
+# Canais reservados para efeitos (Sound.play() automático nunca os usa)
+_N_CANAIS_SFX: int = 8
+
+# Prioridade de cada efeito — maior nunca é cortado por menor
+_PRIORIDADE_SFX: dict[str, int] = {
+    "Morte":        3,
+    "SomDeVitoria": 3,
+    "SomDeColisao": 2,
+    "SpeedBoost":   1,
+    "SomDeComer":   0,
+}
+_PRIORIDADE_OMISSAO: int = 1
+
+
+class _ControladorMusica:
+    """
+    Dono de pygame.mixer.music: pedir() regista a faixa desejada (None =
+    silêncio) e uma thread leva o mixer até lá, um passo de volume de cada
+    vez. Todas as chamadas ao mixer.music são feitas com _cond adquirido.
+    """
+
+    def __init__(self) -> None:
+        self._cond     = threading.Condition()
+        self._alvo:  "str | None" = None   # faixa desejada
+        self._atual: "str | None" = None   # faixa carregada no mixer
+        self._nivel    = 0.0               # 0..1 — posição do fade da faixa actual
+        self._volume   = 1.0               # volume da configuração
+        self._saida_ms = _FADE_TROCA_MS
+        self._abertas: dict[str, bytes] = {}
+        self._a_abrir: list[str] = []
+        self._thread: "threading.Thread | None" = None
+
+    # ── Pedidos (thread do jogo — nunca bloqueiam) ────────────────────────────
+
+    def pedir(self, caminho: "str | None", saida_ms: int = _FADE_TROCA_MS) -> None:
+        with self._cond:
+            self._alvo     = caminho
+            self._saida_ms = max(1, saida_ms)
+            self._acordar()
+
+    def preparar(self, caminho: str) -> None:
+        """Lê a faixa para memória em segundo plano, antes de ser pedida."""
+        with self._cond:
+            if caminho not in self._abertas and caminho not in self._a_abrir:
+                self._a_abrir.append(caminho)
+                self._acordar()
+
+    def parar(self) -> None:
+        """Silêncio imediato, sem fade."""
+        with self._cond:
+            self._alvo  = None
+            self._atual = None
+            self._nivel = 0.0
+            try:
+                pygame.mixer.music.stop()
+            except pygame.error:
+                pass
+
+    def definir_volume(self, volume: float) -> None:
+        with self._cond:
+            self._volume = volume
+            self._aplicar()
+
+    def em_transicao(self) -> bool:
+        with self._cond:
+            return self._tem_trabalho()
+
+    # ── Thread ────────────────────────────────────────────────────────────────
+
+    def _acordar(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._correr, name="musica", daemon=True)
+            self._thread.start()
+        self._cond.notify()
+
+    def _tem_trabalho(self) -> bool:
+        return bool(self._a_abrir or self._atual != self._alvo
+                    or (self._atual is not None and self._nivel < 1.0))
+
+    def _correr(self) -> None:
+        anterior = time.perf_counter()
+        while True:
+            with self._cond:
+                while not self._tem_trabalho():
+                    self._cond.wait()
+                    anterior = time.perf_counter()
+                a_abrir = self._a_abrir[:]
+                if self._alvo is not None and self._alvo not in self._abertas:
+                    a_abrir.append(self._alvo)
+
+            for caminho in a_abrir:                    # disco fora do lock
+                self._abrir(caminho)
+
+            time.sleep(_PASSO_FADE_S)
+            agora = time.perf_counter()
+            dt_ms, anterior = (agora - anterior) * 1000.0, agora
+            with self._cond:
+                try:
+                    self._passo(dt_ms)
+                except pygame.error as e:              # mixer fechado ou faixa inválida
+                    print(f"[ERRO pygame] {e}")
+                    self._alvo = self._atual = None
+
+    def _abrir(self, caminho: str) -> None:
+        try:
+            with open(caminho, "rb") as f:
+                dados = f.read()
+        except OSError as e:
+            print(f"[ERRO] Música ilegível: {e}")
+            dados = None
+        with self._cond:
+            if caminho in self._a_abrir:
+                self._a_abrir.remove(caminho)
+            if dados is not None:
+                self._abertas[caminho] = dados
+            elif self._alvo == caminho:
+                self._alvo = None
+
+    def _passo(self, dt_ms: float) -> None:
+        """Avança a transição um passo (chamado com _cond adquirido)."""
+        if self._atual != self._alvo:
+            if self._atual is not None and self._nivel > 0.0:
+                self._nivel = max(0.0, self._nivel - dt_ms / self._saida_ms)
+                self._aplicar()
+                return
+            # Em silêncio: trocar de faixa já não espera por nenhum fade
+            pygame.mixer.music.stop()
+            self._atual = None
+            dados = self._abertas.get(self._alvo) if self._alvo else None
+            if dados is not None:
+                pygame.mixer.music.load(io.BytesIO(dados), os.path.splitext(self._alvo)[1][1:])
+                self._nivel = 0.0
+                self._aplicar()
+                pygame.mixer.music.play(loops=-1)
+                self._atual = self._alvo
+        elif self._atual is not None and self._nivel < 1.0:
+            self._nivel = min(1.0, self._nivel + dt_ms / _FADE_ENTRADA_MS)
+            self._aplicar()
+
+    def _aplicar(self) -> None:
+        try:
+            pygame.mixer.music.set_volume(self._volume * self._nivel)
+        except pygame.error:
+            pass
 
 
 class GestorMusica:
@@ -48,7 +221,15 @@ class GestorMusica:
         self._inicializado = True
         self._cfg = Configuracoes()
         self._faixa_actual = ""
+        self._controlador  = _ControladorMusica()
         self._sfx_cache: dict[str, pygame.mixer.Sound] = {}
+        self._thread_sfx: "threading.Thread | None" = None
+
+        # Canais de efeitos — criados no primeiro uso (precisam do mixer)
+        self._canais: list[pygame.mixer.Channel] = []
+        self._prioridade_canal: list[int]   = []
+        self._inicio_canal:     list[float] = []
+        self._estatisticas = {"acertos": 0, "falhas": 0, "roubados": 0, "descartados": 0}
 
         # Caminhos base
         self._pasta_music = caminho_recurso("assets/musica")
@@ -70,14 +251,19 @@ class GestorMusica:
         nome = _MUSICA_JOGO.get(dificuldade, "normal")
         self._tocar(nome)
 
+    def preparar_jogo(self, dificuldade: str) -> None:
+        """Abre já a faixa da dificuldade, para a troca não esperar pelo disco."""
+        caminho = self._caminho(_MUSICA_JOGO.get(dificuldade, "normal"))
+        if os.path.exists(caminho) and pygame.mixer.get_init():
+            self._controlador.preparar(caminho)
+
     def fade_out(self, ms: int = 800) -> None:
-        """Fade-out suave."""
-        if pygame.mixer.music.get_busy():
-            pygame.mixer.music.fadeout(ms)
+        """Fade-out suave (não bloqueia)."""
+        self._controlador.pedir(None, ms)
 
     def parar(self) -> None:
         """Para imediatamente."""
-        pygame.mixer.music.stop()
+        self._controlador.parar()
         self._faixa_actual = ""
 
     def set_volume_musica(self, v: float) -> None:
@@ -91,8 +277,9 @@ class GestorMusica:
         self._cfg.sfx_volume = v
         self._cfg.guardar()
 
-        for som in self._sfx_cache.values():
-            som.set_volume(v)
+        # O volume dos efeitos vive nos canais — os Sound ficam a 1.0
+        for canal in self._canais:
+            canal.set_volume(v)
 
     def set_musica_ativa(self, ativa: bool) -> None:
         """Liga/desliga música."""
@@ -102,6 +289,8 @@ class GestorMusica:
         if not ativa:
             self.parar()
         else:
+            # Desligada desde o arranque o controlador ficou com volume 0
+            self._aplicar_volume_musica()
             if self._faixa_actual:
                 self._tocar_caminho(self._faixa_actual)
 
@@ -110,64 +299,79 @@ class GestorMusica:
     # ─────────────────────────────
 
     def tocar_sfx(self, nome: str) -> None:
-        """Toca um efeito sonoro."""
-        if self._cfg.sfx_volume <= 0.0:
+        """Toca um efeito sonoro num canal do conjunto reservado."""
+        if self._cfg.sfx_volume <= 0.0 or not pygame.mixer.get_init():
             return
 
         som = self._carregar_sfx(nome)
-        if som:
-            som.play()
+        if som is None:
+            return
+        prioridade = _PRIORIDADE_SFX.get(nome, _PRIORIDADE_OMISSAO)
+        i = self._escolher_canal(prioridade)
+        if i is None:
+            self._estatisticas["descartados"] += 1
+            return
+        canal = self._canais[i]
+        canal.play(som)
+        canal.set_volume(self._cfg.sfx_volume)
+        self._prioridade_canal[i] = prioridade
+        self._inicio_canal[i]     = time.perf_counter()
+
+    def precarregar_sfx(self) -> None:
+        """Descodifica todos os efeitos numa thread em segundo plano (uma vez)."""
+        if self._thread_sfx is not None or not pygame.mixer.get_init():
+            return
+        self._thread_sfx = threading.Thread(
+            target=self._precarregar_todos, name="precarregar-sfx", daemon=True)
+        self._thread_sfx.start()
+
+    def estatisticas_sfx(self) -> dict:
+        """Contadores: acertos/falhas da cache, vozes roubadas, efeitos descartados."""
+        return dict(self._estatisticas)
 
     # ─────────────────────────────
     # Internos
     # ─────────────────────────────
 
+    def _caminho(self, nome: str) -> str:
+        return os.path.join(self._pasta_music, f"{nome}.ogg")
+
     def _tocar(self, nome: str) -> None:
         """Toca música pelo nome."""
-        caminho = os.path.join(self._pasta_music, f"{nome}.ogg")
-
-        # DEBUG (podes remover depois)
-        # print("A tentar tocar:", caminho)
+        caminho = self._caminho(nome)
 
         if not os.path.exists(caminho):
             print(f"[ERRO] Música não encontrada: {caminho}")
             return
 
-        if caminho == self._faixa_actual and pygame.mixer.music.get_busy():
-            return
-
-        if pygame.mixer.music.get_busy():
-            pygame.mixer.music.fadeout(_FADE_TROCA_MS)
-
         self._tocar_caminho(caminho)
 
     def _tocar_caminho(self, caminho: str) -> None:
-        """Toca música por caminho absoluto."""
-        if not self._cfg.musica_ativa:
-            self._faixa_actual = caminho
-            return
-
-        try:
-            pygame.mixer.music.load(caminho)
-            pygame.mixer.music.set_volume(self._cfg.musica_volume)
-            pygame.mixer.music.play(loops=-1)
-            self._faixa_actual = caminho
-        except pygame.error as e:
-            print(f"[ERRO pygame] {e}")
+        """Pede a faixa ao controlador (a troca e os fades são em segundo plano)."""
+        self._faixa_actual = caminho
+        if self._cfg.musica_ativa and pygame.mixer.get_init():
+            self._controlador.pedir(caminho)
 
     def _aplicar_volume_musica(self) -> None:
         """Aplica volume atual."""
-        try:
-            volume = self._cfg.musica_volume if self._cfg.musica_ativa else 0.0
-            pygame.mixer.music.set_volume(volume)
-        except pygame.error:
-            pass
+        volume = self._cfg.musica_volume if self._cfg.musica_ativa else 0.0
+        self._controlador.definir_volume(volume)
 
     def _carregar_sfx(self, nome: str) -> "pygame.mixer.Sound | None":
-        """Carrega e guarda em cache."""
-        if nome in self._sfx_cache:
-            return self._sfx_cache[nome]
+        """Da cache; se a pré-carga ainda não lá chegou, descodifica já."""
+        som = self._sfx_cache.get(nome)
+        if som is not None:
+            self._estatisticas["acertos"] += 1
+            return som
 
+        self._estatisticas["falhas"] += 1
+        som = self._descodificar(nome)
+        if som is not None:
+            # A thread pode tê-lo acabado entretanto — fica o primeiro
+            som = self._sfx_cache.setdefault(nome, som)
+        return som
+
+    def _descodificar(self, nome: str) -> "pygame.mixer.Sound | None":
         caminho = os.path.join(self._pasta_sfx, f"{nome}.ogg")
 
         if not os.path.exists(caminho):
@@ -175,10 +379,46 @@ class GestorMusica:
             return None
 
         try:
-            som = pygame.mixer.Sound(caminho)
-            som.set_volume(self._cfg.sfx_volume)
-            self._sfx_cache[nome] = som
-            return som
+            return pygame.mixer.Sound(caminho)
         except pygame.error as e:
             print(f"[ERRO pygame SFX] {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def _precarregar_todos(self) -> None:
+        """Corpo da thread: o pygame liberta o GIL enquanto descodifica o .ogg."""
+        try:
+            nomes = sorted(os.path.splitext(f)[0] for f in os.listdir(self._pasta_sfx)
+                           if f.endswith(".ogg"))
+        except OSError:
+            return
+        for nome in nomes:
+            if nome not in self._sfx_cache:
+                som = self._descodificar(nome)
+                if som is not None:
+                    self._sfx_cache.setdefault(nome, som)
+
+    def _escolher_canal(self, prioridade: int) -> "int | None":
+        """
+        Índice de um canal livre; senão o de menor prioridade (o mais antigo
+        entre iguais) se não for mais prioritário do que o novo efeito.
+        """
+        if not self._canais:
+            n = _N_CANAIS_SFX
+            # Os primeiros n canais ficam reservados; os restantes continuam livres
+            pygame.mixer.set_num_channels(pygame.mixer.get_num_channels() + n)
+            pygame.mixer.set_reserved(n)
+            self._canais           = [pygame.mixer.Channel(i) for i in range(n)]
+            self._prioridade_canal = [0] * n
+            self._inicio_canal     = [0.0] * n
+
+        vitima = None
+        for i, canal in enumerate(self._canais):
+            if not canal.get_busy():
+                return i
+            if vitima is None or ((self._prioridade_canal[i], self._inicio_canal[i])
+                                  < (self._prioridade_canal[vitima], self._inicio_canal[vitima])):
+                vitima = i
+        if self._prioridade_canal[vitima] > prioridade:
+            return None
+        self._estatisticas["roubados"] += 1
+        return vitima
\ No newline at end of file
@@ -0,0 +1,174 @@
+# src/game/core/perfil.py
+"""
+Perfil de tempo por frame do loop principal (Game.run).
+
+Cada frame é dividido em fases medidas "por volta": marcar(fase) atribui à
+fase o tempo decorrido desde a marca anterior, com uma única chamada a
+perf_counter — barato o suficiente para ficar sempre ligado. Os tempos (ms)
+vão para um buffer circular com os últimos CAPACIDADE frames, de onde saem
+os percentis do overlay (F3) e o CSV exportado (F4).
+
+Além dos tempos, cada frame guarda CONTADORES — valores que não são
+durações (passos lógicos corridos, passos descartados pelo limite de
+recuperação, fracção de interpolação) — definidos com contar(nome, valor).
+
+Uso::
+
+    perfil = PerfilFrames()
+    perfil.inicio_frame()
+    ...; perfil.marcar("eventos")
+    ...; perfil.marcar("logica")
+    perfil.contar("passos", 2)
+    perfil.fim_frame()
+    perfil.exportar_csv()      # → ~/.snake/perfil_frames_AAAAMMDD_HHMMSS.csv
+"""
+from __future__ import annotations
+
+import csv
+import math
+import time
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+from game.core.caminhos import caminho_dados_utilizador
+
+# Fases do loop, pela ordem em que acontecem num frame
+FASES: tuple = (
+    "eventos",        # handle_events
+    "logica",         # ciclo de passos lógicos (actualizar)
+    "particulas",     # particulas.update
+    "visual",         # tremida, HUD e visual_update do modo
+    "mapa",           # fundo (grelha + mapa) — completo ou só nos rects sujos
+    "modo",           # modo_atual.draw
+    "part_desenho",   # particulas.draw
+    "hud",            # sidebar
+    "overlay",        # o próprio overlay de perfil
+    "escala",         # _blit_com_tremida / _apresentar_sujos (escala + blit)
+    "flip",           # display.flip / display.update
+)
+
+# Valores por frame que não são tempos (ficam a 0 se o frame não os definir)
+CONTADORES: tuple = (
+    "passos",         # passos lógicos corridos no frame
+    "descartados",    # passos em atraso deitados fora (limite de recuperação)
+    "alfa",           # fracção do intervalo lógico usada na interpolação (0–1)
+    "latencia",       # ms da entrada mais lenta aplicada pelos passos do frame
+)
+
+CAPACIDADE: int = 600   # ~10 s a 60 fps
+
+
+def percentil(ordenados: Sequence[float], p: float) -> float:
+    """Percentil p (0–100) por ordem mais próxima; 0.0 sem amostras."""
+    if not ordenados:
+        return 0.0
+    k = math.ceil(p / 100.0 * len(ordenados)) - 1
+    return ordenados[max(0, min(len(ordenados) - 1, k))]
+
+
+class PerfilFrames:
+    """Buffer circular de tempos por fase (ms) dos últimos frames."""
+
+    def __init__(self, capacidade: int = CAPACIDADE) -> None:
+        self.capacidade = capacidade
+        self.indices: Dict[str, int] = {f: i for i, f in enumerate(FASES)}
+
+        self.indices_contadores: Dict[str, int] = {c: i for i, c in enumerate(CONTADORES)}
+
+        n = len(FASES)
+        m = len(CONTADORES)
+        # Uma linha por frame: n fases + total + m contadores, num só array
+        self._largura  = n + 1 + m
+        self._linhas   = array("d", bytes(8 * self._largura * capacidade))
+        self._actual   = array("d", bytes(8 * n))
+        self._zeros    = array("d", bytes(8 * n))
+        self._cont     = array("d", bytes(8 * m))
+        self._cont0    = array("d", bytes(8 * m))
+        self._proximo  = 0      # posição de escrita no buffer
+        self._n        = 0      # frames guardados (≤ capacidade)
+        self._t        = 0.0
+        self._t0       = 0.0
+
+        self.frames_total: int = 0
+
+    # ── Medição ───────────────────────────────────────────────────────────────
+
+    def inicio_frame(self) -> None:
+        self._actual[:] = self._zeros
+        self._cont[:]   = self._cont0
+        self._t0 = self._t = time.perf_counter()
+
+    def marcar(self, fase: str) -> None:
+        """Atribui a `fase` o tempo desde a última marca (acumula no frame)."""
+        t = time.perf_counter()
+        self._actual[self.indices[fase]] += (t - self._t) * 1000.0
+        self._t = t
+
+    def contar(self, contador: str, valor: float) -> None:
+        """Define o valor de `contador` neste frame."""
+        self._cont[self.indices_contadores[contador]] = valor
+
+    def fim_frame(self) -> None:
+        n     = len(FASES)
+        base  = self._proximo * self._largura
+        self._linhas[base:base + n] = self._actual
+        self._linhas[base + n]      = (time.perf_counter() - self._t0) * 1000.0
+        self._linhas[base + n + 1:base + self._largura] = self._cont
+        self._proximo = (self._proximo + 1) % self.capacidade
+        self._n       = min(self._n + 1, self.capacidade)
+        self.frames_total += 1
+
+    # ── Consulta ──────────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return self._n
+
+    def linhas(self) -> List[array]:
+        """Frames guardados, do mais antigo ao mais recente (fases + total + contadores)."""
+        largura = self._largura
+        inicio  = (self._proximo - self._n) % self.capacidade
+        linhas  = []
+        for i in range(self._n):
+            b = ((inicio + i) % self.capacidade) * largura
+            linhas.append(self._linhas[b:b + largura])
+        return linhas
+
+    def serie(self, fase: Optional[str] = None, ultimos: Optional[int] = None) -> List[float]:
+        """Tempos de uma fase (ou do frame inteiro, com None), do mais antigo ao mais recente."""
+        col    = len(FASES) if fase is None else self.indices[fase]
+        linhas = self.linhas()
+        if ultimos is not None:
+            linhas = linhas[-ultimos:]
+        return [l[col] for l in linhas]
+
+    def serie_contador(self, contador: str, ultimos: Optional[int] = None) -> List[float]:
+        """Valores de um contador, do frame mais antigo ao mais recente."""
+        col    = len(FASES) + 1 + self.indices_contadores[contador]
+        linhas = self.linhas()
+        if ultimos is not None:
+            linhas = linhas[-ultimos:]
+        return [l[col] for l in linhas]
+
+    def percentis(self, ps: Sequence[float] = (50, 95, 99)) -> Dict[str, tuple]:
+        """{fase: (p50, p95, p99)} e "total" para o frame inteiro."""
+        linhas = self.linhas()
+        res = {}
+        for nome, col in list(self.indices.items()) + [("total", len(FASES))]:
+            ordenados = sorted(l[col] for l in linhas)
+            res[nome] = tuple(percentil(ordenados, p) for p in ps)
+        return res
+
+    # ── Exportação ────────────────────────────────────────────────────────────
+
+    def exportar_csv(self, nome_ficheiro: Optional[str] = None) -> str:
+        """Escreve o buffer em CSV na pasta de dados do utilizador; devolve o caminho."""
+        if nome_ficheiro is None:
+            nome_ficheiro = time.strftime("perfil_frames_%Y%m%d_%H%M%S.csv")
+        caminho  = caminho_dados_utilizador(nome_ficheiro)
+        primeiro = self.frames_total - self._n
+        with open(caminho, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(("frame",) + FASES + ("total",) + CONTADORES)
+            for i, linha in enumerate(self.linhas()):
+                w.writerow([primeiro + i] + [f"{v:.4f}" for v in linha])
+        return caminho
@@ -1,81 +1,260 @@
 # src/game/core/records.py
+"""
+Recordes guardados numa base SQLite na pasta do utilizador.
+
+  - Tabela indexada por (modo, dificuldade, pontuacao) — o top de qualquer
+    filtro é uma leitura de índice com LIMIT, independente do nº de linhas.
+  - Top-N em memória por (modo, dificuldade), actualizado a cada inserção e
+    invalidado quando o mtime da base muda (outra instância/processo escreveu).
+  - Importação única do formato antigo records.txt (colunas separadas por
+    tabs e '|'), feita automaticamente na primeira abertura.
+
+Funciona tanto em desenvolvimento como dentro de um .exe.
+"""
+from __future__ import annotations
+
 import os
+import sqlite3
+from bisect import insort
 from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
 from game.core.caminhos import caminho_dados_utilizador
 
+# Tamanho do top guardado em memória por filtro
+TOP_N: int = 10
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS recordes (
+    id          INTEGER PRIMARY KEY,
+    nome        TEXT    NOT NULL,
+    modo        TEXT    NOT NULL,
+    dificuldade TEXT    NOT NULL,
+    pontuacao   INTEGER NOT NULL,
+    data        TEXT    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pontuacao      ON recordes (pontuacao DESC, id);
+CREATE INDEX IF NOT EXISTS idx_modo           ON recordes (modo, pontuacao DESC, id);
+CREATE INDEX IF NOT EXISTS idx_modo_dif       ON recordes (modo, dificuldade, pontuacao DESC, id);
+CREATE INDEX IF NOT EXISTS idx_dificuldade    ON recordes (dificuldade, pontuacao DESC, id);
+CREATE INDEX IF NOT EXISTS idx_nome_modo      ON recordes (nome, modo);
+CREATE TABLE IF NOT EXISTS meta (
+    chave TEXT PRIMARY KEY,
+    valor TEXT
+);
+"""
+
+_COLUNAS = "id, nome, modo, dificuldade, pontuacao, data"
+
+Filtro = Tuple[Optional[str], Optional[str]]   # (modo, dificuldade); None = todos
+
+
+def _linha_para_dict(linha) -> dict:
+    _id, nome, modo, dificuldade, pontuacao, data = linha
+    return {
+        "nome":        nome,
+        "modo":        modo,
+        "dificuldade": dificuldade,
+        "pontuacao":   pontuacao,
+        "data":        data,
+    }
+
 
 class GestorRecordes:
     """
-    Guarda e lê pontuações num ficheiro .txt na pasta do utilizador.
-    Funciona tanto em desenvolvimento como dentro de um .exe.
+    Guarda e lê pontuações.
+
+    Uma instância por ficheiro (singleton por caminho) — pode ser criada em
+    qualquer sítio, inclusive dentro de um loop de desenho, sem reabrir a base.
     """
 
-    _CABECALHO = "\tnome\t|\tmodo\t|\tdificuldade\t|\tpontuacao\t|\tdata\t\n"
+    _instancias: Dict[str, "GestorRecordes"] = {}
+
+    def __new__(cls, nome_ficheiro: str = "records.db",
+                ficheiro_legado: Optional[str] = "records.txt"):
+        caminho = caminho_dados_utilizador(nome_ficheiro)
+        inst    = cls._instancias.get(caminho)
+        if inst is None:
+            inst = super().__new__(cls)
+            inst._inicializado = False
+            cls._instancias[caminho] = inst
+        return inst
+
+    def __init__(self, nome_ficheiro: str = "records.db",
+                 ficheiro_legado: Optional[str] = "records.txt"):
+        if self._inicializado:
+            return
+        self._inicializado = True
 
-    def __init__(self, nome_ficheiro: str = "records.txt"):
         self.caminho = caminho_dados_utilizador(nome_ficheiro)
+        self._con    = sqlite3.connect(self.caminho)
+        self._con.executescript(_ESQUEMA)
+        self._con.commit()
+
+        # (modo, dificuldade) → lista ordenada de (-pontuacao, id, dict)
+        self._top:   Dict[Filtro, List[tuple]] = {}
+        self._mtime: Optional[tuple] = None   # assinatura (mtime, tamanho)
 
-        if not os.path.exists(self.caminho):
-            with open(self.caminho, "w", encoding="utf-8") as f:
-                f.write(self._CABECALHO)
+        if ficheiro_legado:
+            legado = caminho_dados_utilizador(ficheiro_legado)
+            if os.path.exists(legado) and not self._meta("legado_importado"):
+                self.importar_legado(legado)
+
+    # ── Escrita ───────────────────────────────────────────────────────────────
 
     def guardar_pontuacao(self, nome: str, modo: str, dificuldade: str, pontuacao: int):
         """Acrescenta sempre um novo registo (modos normais)."""
         data = datetime.now().strftime("%Y-%m-%d %H:%M")
-        with open(self.caminho, "a", encoding="utf-8") as f:
-            f.write(f"\t{nome}\t|\t{modo}\t|\t{dificuldade}\t|\t{pontuacao}\t|\t{data}\t\n")
+        self._validar_cache()       # antes de escrever: apanha escritas alheias
+        with self._con:
+            cur = self._con.execute(
+                "INSERT INTO recordes (nome, modo, dificuldade, pontuacao, data) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (nome, modo, dificuldade, int(pontuacao), data))
+        self._inserir_no_top(cur.lastrowid, {
+            "nome":        nome,
+            "modo":        modo,
+            "dificuldade": dificuldade,
+            "pontuacao":   int(pontuacao),
+            "data":        data,
+        })
+        self._mtime = self._assinatura()
 
     def guardar_pontuacao_unica(self, nome: str, modo: str, dificuldade: str, pontuacao: int):
         """Guarda um único registo por jogador/modo.
         Só actualiza se a nova pontuação for MAIOR do que a existente."""
-        todas = self.ler_pontuacoes()
+        (melhor,) = self._con.execute(
+            "SELECT MAX(pontuacao) FROM recordes WHERE nome = ? AND modo = ?",
+            (nome, modo)).fetchone()
+        if melhor is not None and melhor >= pontuacao:
+            return
 
-        existente = next(
-            (s for s in todas if s["nome"] == nome and s["modo"] == modo), None)
+        data = datetime.now().strftime("%Y-%m-%d %H:%M")
+        with self._con:
+            self._con.execute(
+                "DELETE FROM recordes WHERE nome = ? AND modo = ?", (nome, modo))
+            self._con.execute(
+                "INSERT INTO recordes (nome, modo, dificuldade, pontuacao, data) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (nome, modo, dificuldade, int(pontuacao), data))
+        self._invalidar()
 
-        if existente is not None and existente["pontuacao"] >= pontuacao:
-            return
+    def limpar_registos(self):
+        with self._con:
+            self._con.execute("DELETE FROM recordes")
+        self._invalidar()
+
+    # ── Leitura ───────────────────────────────────────────────────────────────
+
+    def top(self, modo: Optional[str] = None, dificuldade: Optional[str] = None,
+            n: int = TOP_N) -> List[dict]:
+        """
+        As `n` melhores pontuações do filtro, da maior para a menor.
+        Até TOP_N vem da cache em memória; o custo não depende do nº de linhas.
+        """
+        if n > TOP_N:
+            return self._consultar(modo, dificuldade, n)
 
-        # Reescreve o ficheiro sem o registo antigo e adiciona o novo no fim
-        resto = [s for s in todas if not (s["nome"] == nome and s["modo"] == modo)]
-        data  = datetime.now().strftime("%Y-%m-%d %H:%M")
-
-        with open(self.caminho, "w", encoding="utf-8") as f:
-            f.write(self._CABECALHO)
-            for s in resto:
-                f.write(
-                    f"\t{s['nome']}\t|\t{s['modo']}\t|\t{s['dificuldade']}\t|"
-                    f"\t{s['pontuacao']}\t|\t{s['data']}\t\n"
-                )
-            f.write(
-                f"\t{nome}\t|\t{modo}\t|\t{dificuldade}\t|\t{pontuacao}\t|\t{data}\t\n")
-
-    def ler_pontuacoes(self, modo_filtrar: str = None) -> list:
-        pontuacoes = []
-        if not os.path.exists(self.caminho):
-            return pontuacoes
-
-        with open(self.caminho, "r", encoding="utf-8") as f:
-            for linha in f.readlines()[1:]:
+        self._validar_cache()
+        chave = (modo, dificuldade)
+        lista = self._top.get(chave)
+        if lista is None:
+            lista = [(-r["pontuacao"], rid, r)
+                     for rid, r in self._consultar_com_id(modo, dificuldade, TOP_N)]
+            self._top[chave] = lista
+        return [r for _, _, r in lista[:n]]
+
+    def ler_pontuacoes(self, modo_filtrar: str = None, limite: Optional[int] = None) -> list:
+        """Pontuações ordenadas (maior primeiro); todas, salvo `limite`."""
+        if limite is not None and limite <= TOP_N:
+            return self.top(modo_filtrar, None, limite)
+        return self._consultar(modo_filtrar, None, limite)
+
+    # ── Importação do formato antigo ──────────────────────────────────────────
+
+    def importar_legado(self, caminho_txt: str) -> int:
+        """
+        Importa um records.txt antigo (\\tnome\\t|\\tmodo\\t|...); linhas
+        inválidas são ignoradas. Só corre uma vez por base. Devolve o nº de
+        registos importados.
+        """
+        linhas = []
+        with open(caminho_txt, "r", encoding="utf-8") as f:
+            next(f, None)                                   # cabeçalho
+            for linha in f:
                 partes = [p.strip() for p in linha.split("|")]
-                if len(partes) == 5:
-                    nome, modo, dificuldade, pontuacao, data = partes
-                    if modo_filtrar is None or modo_filtrar == modo:
-                        pontuacoes.append({
-                            "nome":        nome,
-                            "modo":        modo,
-                            "dificuldade": dificuldade,
-                            "pontuacao":   int(pontuacao),
-                            "data":        data,
-                        })
-
-        pontuacoes.sort(key=lambda x: x["pontuacao"], reverse=True)
-        return pontuacoes
+                if len(partes) != 5:
+                    continue
+                nome, modo, dificuldade, pontuacao, data = partes
+                try:
+                    linhas.append((nome, modo, dificuldade, int(pontuacao), data))
+                except ValueError:
+                    continue
 
-    def limpar_registos(self):
-        with open(self.caminho, "w", encoding="utf-8") as f:
-            f.write(self._CABECALHO)
+        with self._con:
+            self._con.executemany(
+                "INSERT INTO recordes (nome, modo, dificuldade, pontuacao, data) "
+                "VALUES (?, ?, ?, ?, ?)", linhas)
+            self._con.execute(
+                "INSERT OR REPLACE INTO meta (chave, valor) VALUES (?, ?)",
+                ("legado_importado", caminho_txt))
+        self._invalidar()
+        return len(linhas)
+
+    # ── Interno ───────────────────────────────────────────────────────────────
+
+    def _consultar_com_id(self, modo, dificuldade, limite) -> List[tuple]:
+        condicoes, args = [], []
+        if modo is not None:
+            condicoes.append("modo = ?");        args.append(modo)
+        if dificuldade is not None:
+            condicoes.append("dificuldade = ?"); args.append(dificuldade)
+        sql = f"SELECT {_COLUNAS} FROM recordes"
+        if condicoes:
+            sql += " WHERE " + " AND ".join(condicoes)
+        sql += " ORDER BY pontuacao DESC, id"
+        if limite is not None:
+            sql += " LIMIT ?"; args.append(int(limite))
+        return [(l[0], _linha_para_dict(l)) for l in self._con.execute(sql, args)]
+
+    def _consultar(self, modo, dificuldade, limite) -> List[dict]:
+        return [r for _, r in self._consultar_com_id(modo, dificuldade, limite)]
+
+    def _inserir_no_top(self, rid: int, registo: dict) -> None:
+        """Mete o novo registo em cada top em cache a que pertence."""
+        for (modo, dificuldade), lista in self._top.items():
+            if modo is not None and modo != registo["modo"]:
+                continue
+            if dificuldade is not None and dificuldade != registo["dificuldade"]:
+                continue
+            # ids são únicos — a comparação nunca chega ao dict
+            insort(lista, (-registo["pontuacao"], rid, registo))
+            del lista[TOP_N:]
+
+    def _assinatura(self) -> Optional[tuple]:
+        """(mtime, tamanho) do ficheiro da base — muda a cada escrita."""
+        try:
+            st = os.stat(self.caminho)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _validar_cache(self) -> None:
+        """Descarta os tops em memória se a base mudou fora desta instância."""
+        assinatura = self._assinatura()
+        if assinatura != self._mtime:
+            self._top.clear()
+            self._mtime = assinatura
+
+    def _invalidar(self) -> None:
+        self._top.clear()
+        self._mtime = self._assinatura()
+
+    def _meta(self, chave: str) -> Optional[str]:
+        linha = self._con.execute(
+            "SELECT valor FROM meta WHERE chave = ?", (chave,)).fetchone()
+        return linha[0] if linha else None
 
 
 # Alias retrocompatível — o resto do código usa RecordsManager
-RecordsManager = GestorRecordes
\ No newline at end of file
+RecordsManager = GestorRecordes
@@ -11,6 +11,7 @@ Mapas gerados:
   assets/mapas/campo_livre.txt   — campo aberto sem obstáculos
   assets/mapas/obstaculos.txt    — campo com paredes interiores (sem bordas)
   assets/mapas/arena.txt         — arena fechada com paredes interiores
+  assets/mapas/arena_grande.txt  — arena fechada de 300×300 (câmara a seguir)
   assets/mapas/1v1_mapa1.txt     — cruzamentos
   assets/mapas/1v1_mapa2.txt     — labirinto
   assets/mapas/1v1_mapa3.txt     — corredores
@@ -23,13 +24,19 @@ Uso::
 from __future__ import annotations
 
 import os
+import random
 from typing import List
 
+import game.config as cfg
 from game.core.caminhos import caminho_recurso
 
-# ── Dimensões da grelha (devem coincidir com config.py) ──────────────────────
-COLS: int = 45
-ROWS: int = 30
+# ── Dimensões da grelha por omissão (o tamanho é de cada mapa) ───────────────
+COLS: int = cfg.GRID_COLS
+ROWS: int = cfg.GRID_ROWS
+
+# Arena grande — maior do que o ecrã; a câmara do engine segue o jogador
+COLS_GRANDE: int = 300
+ROWS_GRANDE: int = 300
 
 # Directório de destino — resolvido com caminho_recurso para ser independente
 # do directório de trabalho
@@ -38,33 +45,36 @@ _PASTA_MAPAS: str = caminho_recurso("assets/mapas")
 
 # ── Utilitários de construção de grelha ───────────────────────────────────────
 
-def _vazio() -> List[List[str]]:
-    """Grelha COLS×ROWS preenchida com '.'."""
-    return [["." for _ in range(COLS)] for _ in range(ROWS)]
+def _vazio(cols: int = COLS, rows: int = ROWS) -> List[List[str]]:
+    """Grelha cols×rows preenchida com '.'."""
+    return [["." for _ in range(cols)] for _ in range(rows)]
 
 
 def _h(grid: List[List[str]], y: int, x1: int, x2: int) -> None:
     """Traça uma parede horizontal de x1 a x2 na linha y."""
+    rows, cols = len(grid), len(grid[0])
     for x in range(x1, x2 + 1):
-        if 0 <= y < ROWS and 0 <= x < COLS:
+        if 0 <= y < rows and 0 <= x < cols:
             grid[y][x] = "#"
 
 
 def _v(grid: List[List[str]], x: int, y1: int, y2: int) -> None:
     """Traça uma parede vertical de y1 a y2 na coluna x."""
+    rows, cols = len(grid), len(grid[0])
     for y in range(y1, y2 + 1):
-        if 0 <= y < ROWS and 0 <= x < COLS:
+        if 0 <= y < rows and 0 <= x < cols:
             grid[y][x] = "#"
 
 
 def _bordas(grid: List[List[str]]) -> None:
     """Preenche as 4 bordas exteriores com '#'."""
-    for x in range(COLS):
+    rows, cols = len(grid), len(grid[0])
+    for x in range(cols):
         grid[0][x]      = "#"
-        grid[ROWS-1][x] = "#"
-    for y in range(ROWS):
+        grid[rows-1][x] = "#"
+    for y in range(rows):
         grid[y][0]      = "#"
-        grid[y][COLS-1] = "#"
+        grid[y][cols-1] = "#"
 
 
 def _escrever(grid: List[List[str]], nome: str) -> str:
@@ -128,6 +138,31 @@ def _gerar_arena() -> None:
     _escrever(grid, "arena.txt")
 
 
+def _gerar_arena_grande() -> None:
+    """
+    Arena fechada de COLS_GRANDE×ROWS_GRANDE com paredes soltas — sempre a
+    mesma (seed fixa) para os recordes serem comparáveis.
+    """
+    rng  = random.Random(300)
+    grid = _vazio(COLS_GRANDE, ROWS_GRANDE)
+    _bordas(grid)
+
+    cx, cy = COLS_GRANDE // 2, ROWS_GRANDE // 2
+    for _ in range(COLS_GRANDE * ROWS_GRANDE // 180):
+        x, y = rng.randrange(2, COLS_GRANDE - 2), rng.randrange(2, ROWS_GRANDE - 2)
+        if abs(x - cx) < 8 and abs(y - cy) < 8:
+            continue                      # zona de arranque desimpedida
+        comprimento = rng.randint(3, 14)
+        if rng.random() < 0.5:
+            _h(grid, y, x, min(x + comprimento, COLS_GRANDE - 3))
+        else:
+            _v(grid, x, y, min(y + comprimento, ROWS_GRANDE - 3))
+
+    grid[cy][cx]     = "S"
+    grid[cy][cx + 5] = "P"
+    _escrever(grid, "arena_grande.txt")
+
+
 # ── Mapas 1v1 ─────────────────────────────────────────────────────────────────
 
 def _gerar_1v1_mapa1() -> None:
@@ -217,6 +252,7 @@ _GERADORES = {
     "campo_livre.txt": _gerar_campo_livre,
     "obstaculos.txt":  _gerar_obstaculos,
     "arena.txt":       _gerar_arena,
+    "arena_grande.txt": _gerar_arena_grande,
     "1v1_mapa1.txt":   _gerar_1v1_mapa1,
     "1v1_mapa2.txt":   _gerar_1v1_mapa2,
     "1v1_mapa3.txt":   _gerar_1v1_mapa3,
@@ -236,10 +272,11 @@ def garantir_mapas(forcar: bool = False) -> list[str]:
     """
     os.makedirs(_PASTA_MAPAS, exist_ok=True)
     criados: list[str] = []
+    # Uma listagem da pasta em vez de um stat por mapa
+    existentes = set() if forcar else set(os.listdir(_PASTA_MAPAS))
 
     for nome, gerador in _GERADORES.items():
-        caminho = os.path.join(_PASTA_MAPAS, nome)
-        if forcar or not os.path.exists(caminho):
+        if nome not in existentes:
             gerador()
             criados.append(nome)
 
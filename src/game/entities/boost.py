@@ -1,95 +1,84 @@
 # src/game/entities/boost.py
-import random
+from functools import lru_cache
+
 import pygame
 
+from game.entities.sprites import para_ecra, superficie_com_chave
+from game.sim.itens        import BoostLogica
+
 
-# Cores e durações por tipo
+# Cores por tipo (a duração vive em game.sim.itens.DURACOES_BOOST)
 _TIPOS = {
     "velocidade": {
         "cor":       (255, 200, 40),
         "cor_borda": (180, 140, 20),
         "cor_brilho":(255, 230, 120),
-        "duracao":   90,
     },
     "imunidade": {
         "cor":       (60,  180, 255),
         "cor_borda": (30,  110, 180),
         "cor_brilho":(140, 220, 255),
-        "duracao":   60,
     },
 }
 
 
-class Boost:
+class Boost(BoostLogica):
     """
     Item colecionavel no mapa (velocidade ou imunidade).
     Visual: diamante com brilho, distinto da comida redonda.
     """
 
-    def __init__(self, tipo: str, area_rect, block_size):
-        if tipo not in _TIPOS:
-            raise ValueError(f"Tipo de boost desconhecido: '{tipo}'. Use: {list(_TIPOS)}")
-
-        self.tipo     = tipo
-        self.area     = area_rect
-        self.block    = block_size
-        self.duracao  = _TIPOS[tipo]["duracao"]
+    def __init__(self, tipo: str, area_rect, block_size, rng=None):
+        super().__init__(tipo, area_rect, block_size, rng)
 
         self._cor       = _TIPOS[tipo]["cor"]
         self._cor_borda = _TIPOS[tipo]["cor_borda"]
         self._cor_brilho= _TIPOS[tipo]["cor_brilho"]
 
-        self.pos = None  # (x_px, y_px) — definido pelo spawn
+    # ── Desenho ───────────────────────────────────────────────────────────────
+    def draw(self, surface, camara=None):
+        if self.pos is None:
+            return
+        pos = self.pos
+        if camara is not None:
+            if not camara.visivel(pos[0], pos[1], self.block, self.block):
+                return
+            pos = camara.para_ecra(pos)
+        surface.blit(_sprite(self.tipo, self.block), pos)
+
 
-    # ── Posicionamento ────────────────────────────────────────────────────────
-    def spawn(self, occupied_positions, obstaculos_pixels=None):
-        """Coloca o boost numa posição aleatória livre da grelha."""
-        if obstaculos_pixels is None:
-            obstaculos_pixels = set()
+# ── Sprite ────────────────────────────────────────────────────────────────────
 
-        x0, y0, w, h = self.area
-        cols = w // self.block
-        rows = h // self.block
+@lru_cache(maxsize=None)
+def _sprite(tipo: str, b: int) -> pygame.Surface:
+    """Diamante b×b de um tipo, rasterizado uma vez e partilhado."""
+    cores = _TIPOS[tipo]
+    surf  = superficie_com_chave(b, b, cores.values())
+    _pintar_diamante(surf, 0, 0, b, cores["cor"], cores["cor_borda"], cores["cor_brilho"])
+    return para_ecra(surf)
 
-        tentativas = 0
-        while True:
-            x = x0 + random.randint(0, cols - 1) * self.block
-            y = y0 + random.randint(0, rows - 1) * self.block
-            if (x, y) not in occupied_positions and (x, y) not in obstaculos_pixels:
-                self.pos = (x, y)
-                return
-            tentativas += 1
-            if tentativas > 500:
-                self.pos = (x, y)
-                return
 
-    # ── Desenho ───────────────────────────────────────────────────────────────
-    def draw(self, surface):
-        if self.pos is None:
-            return
+def _pintar_diamante(surface, x, y, b, cor, cor_borda, cor_brilho):
+    m    = max(2, b // 6)
+    cx   = x + b // 2
+    cy   = y + b // 2
+    r    = b // 2 - m  # raio do diamante
+
+    # Diamante (4 pontos: cima, direita, baixo, esquerda)
+    pontos = [
+        (cx,     cy - r),
+        (cx + r, cy    ),
+        (cx,     cy + r),
+        (cx - r, cy    ),
+    ]
+    pygame.draw.polygon(surface, cor, pontos)
+    pygame.draw.polygon(surface, cor_borda, pontos, 1)
 
-        x, y = self.pos
-        b    = self.block
-        m    = max(2, b // 6)
-        cx   = x + b // 2
-        cy   = y + b // 2
-        r    = b // 2 - m  # raio do diamante
-
-        # Diamante (4 pontos: cima, direita, baixo, esquerda)
-        pontos = [
-            (cx,     cy - r),
-            (cx + r, cy    ),
-            (cx,     cy + r),
-            (cx - r, cy    ),
-        ]
-        pygame.draw.polygon(surface, self._cor, pontos)
-        pygame.draw.polygon(surface, self._cor_borda, pontos, 1)
-
-        # Brilho no canto superior
-        br = max(1, r // 3)
-        pygame.draw.polygon(surface, self._cor_brilho, [
-            (cx,      cy - r    ),
-            (cx + br, cy - r + br),
-            (cx,      cy - r + br * 2),
-            (cx - br, cy - r + br),
-        ])
+    # Brilho no canto superior
+    br = max(1, r // 3)
+    pygame.draw.polygon(surface, cor_brilho, [
+        (cx,      cy - r    ),
+        (cx + br, cy - r + br),
+        (cx,      cy - r + br * 2),
+        (cx - br, cy - r + br),
+    ])
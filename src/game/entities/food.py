@@ -5,16 +5,23 @@ Comida com:
   - Sparkles orbitais (5 pontos que giram e fazem twinkle)
 
 update(dt) deve ser chamado a ~60 fps pelo modo de jogo (visual_update).
+
+A animação completa (uma volta dos sparkles) é pré-rasterizada numa tira de
+_FRAMES_ANIMACAO frames, partilhada por todas as comidas com a mesma cor e
+tamanho de bloco — draw() é um único blit do frame de `_phase`.
 """
 from __future__ import annotations
 
 import math
 import random
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Tuple
 
 import pygame
 
-from game.config import FOOD_COLOR, FOOD_BORDER, FOOD_HIGHLIGHT
+from game.config           import FOOD_COLOR, FOOD_BORDER, FOOD_HIGHLIGHT
+from game.entities.sprites import para_ecra, superficie_com_chave
+from game.sim.itens        import ComidaLogica
 
 # ── Constantes visuais ────────────────────────────────────────────────────────
 _PULSE_SPEED:   float = 3.2   # ciclos de pulso por segundo
@@ -22,9 +29,11 @@ _SPARKLE_COUNT: int   = 5     # número de pontos orbitais
 _SPARKLE_SPEED: float = 1.6   # rotações por segundo (rad/s × 2π)
 _SPARKLE_ORBIT: float = 0.90  # raio da órbita como fracção de (block/2)
 _SPARKLE_ALPHA: float = 0.70  # brilho máximo dos sparkles (0–1)
+_SPARKLE_SIZE:  float = 2.5   # raio máximo de um sparkle
+_FRAMES_ANIMACAO: int = 60    # frames pré-rasterizados por volta completa
 
 
-class Food:
+class Food(ComidaLogica):
     """
     Item de comida renderizado como elipse pulsante com sparkles orbitais.
 
@@ -33,40 +42,26 @@ class Food:
         block_size   — tamanho de um bloco em píxeis
         color        — cor principal (por omissão: FOOD_COLOR)
         border_color — cor da borda (por omissão: FOOD_BORDER)
+        rng          — gerador aleatório do spawn (por omissão: módulo `random`)
     """
 
     def __init__(self, area_rect, block_size: int,
-                 color=None, border_color=None) -> None:
-        self.area         = area_rect
-        self.block        = block_size
+                 color=None, border_color=None, rng=None) -> None:
         self.color        = color        or FOOD_COLOR
         self.border_color = border_color or FOOD_BORDER
-        self.pos: Optional[Tuple[int, int]] = None
 
         # Fase de animação — aleatória por instância para variedade visual
         # quando há vários itens de comida em simultâneo
         self._phase: float = random.uniform(0.0, math.tau)
-        self.spawn([])
+        super().__init__(area_rect, block_size, rng)
 
     # ── Posicionamento ────────────────────────────────────────────────────────
 
-    def spawn(self, occupied_positions, obstaculos_pixels=None) -> None:
-        """Coloca a comida num bloco livre da grelha."""
-        if obstaculos_pixels is None:
-            obstaculos_pixels = []
-        x0, y0, w, h = self.area
-        cols = max(1, w // self.block)
-        rows = max(1, h // self.block)
-        last = None
-        for _ in range(500):
-            x    = x0 + random.randint(0, cols - 1) * self.block
-            y    = y0 + random.randint(0, rows - 1) * self.block
-            last = (x, y)
-            if (x, y) not in occupied_positions and (x, y) not in obstaculos_pixels:
-                self.pos    = (x, y)
-                self._phase = random.uniform(0.0, math.tau)
-                return
-        self.pos = last   # fallback de segurança
+    def colocar(self, pos) -> None:
+        """Move a comida para `pos` e reinicia a fase da animação."""
+        super().colocar(pos)
+        # Fase visual usa o `random` global para não consumir o rng da simulação
+        self._phase = random.uniform(0.0, math.tau)
 
     # ── Animação ──────────────────────────────────────────────────────────────
 
@@ -79,43 +74,93 @@ class Food:
 
     # ── Desenho ───────────────────────────────────────────────────────────────
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw(self, surface: pygame.Surface, camara=None) -> None:
         if self.pos is None:
             return
-
+        tira, areas, margem = _tira_animacao(tuple(self.color),
+                                             tuple(self.border_color), self.block)
         x, y = self.pos
-        b    = self.block
-        m    = max(1, b // 6)
-
-        # ── Pulso do raio ─────────────────────────────────────────────────
-        pulse  = 1.0 + 0.12 * math.sin(self._phase * (_PULSE_SPEED / _SPARKLE_SPEED))
-        base_r = max(2.0, b / 2.0 - m)
-        r      = max(2, int(base_r * pulse))
-        cx, cy = x + b // 2, y + b // 2
-
-        # ── Corpo principal ───────────────────────────────────────────────
-        outer = pygame.Rect(cx - r, cy - r, r * 2, r * 2)
-        pygame.draw.ellipse(surface, self.color, outer)
-
-        # Brilho no canto superior esquerdo
-        hs = max(2, r // 2)
-        pygame.draw.ellipse(surface, FOOD_HIGHLIGHT,
-                            pygame.Rect(cx - r // 4 - hs // 2,
-                                        cy - r // 4 - hs // 2, hs, hs))
-        pygame.draw.ellipse(surface, self.border_color, outer, 1)
-
-        # ── Sparkles orbitais ─────────────────────────────────────────────
-        orbit_r = max(3, int(b * _SPARKLE_ORBIT * 0.5))
-        for i in range(_SPARKLE_COUNT):
-            # Ângulo base + offset por sparkle
-            angle  = self._phase + (math.tau / _SPARKLE_COUNT) * i
-            sx     = cx + int(math.cos(angle) * orbit_r)
-            sy     = cy + int(math.sin(angle) * orbit_r)
-
-            # Twinkle: brilho varia sinusoidalmente por sparkle
-            twinkle = (math.sin(angle * 2.0 + self._phase * 0.7) + 1.0) * 0.5
-            alpha   = _SPARKLE_ALPHA * (0.35 + 0.65 * twinkle)
-            col     = tuple(max(0, min(255, int(c * alpha))) for c in self.color)
-            size    = max(1, int(2.5 * (0.5 + 0.5 * twinkle)))
-
-            pygame.draw.circle(surface, col, (sx, sy), size)
\ No newline at end of file
+        if camara is not None:
+            lado = self.block + 2 * margem
+            if not camara.visivel(x - margem, y - margem, lado, lado):
+                return
+            x, y = x - camara.x, y - camara.y
+        # Frame mais próximo da fase actual
+        frame = round((self._phase % math.tau) * (_FRAMES_ANIMACAO / math.tau))
+        surface.blit(tira, (x - margem, y - margem), areas[frame % _FRAMES_ANIMACAO])
+
+
+# ── Tira de animação ──────────────────────────────────────────────────────────
+
+def _margem(b: int) -> int:
+    """Quanto os sparkles saem do bloco, para cada lado."""
+    orbit_r = max(3, int(b * _SPARKLE_ORBIT * 0.5))
+    return max(0, orbit_r + int(_SPARKLE_SIZE) + 1 - b // 2)
+
+
+@lru_cache(maxsize=None)
+def _tira_animacao(color: tuple, border_color: tuple,
+                   b: int) -> Tuple[pygame.Surface, Tuple[pygame.Rect, ...], int]:
+    """(tira, área de cada frame, margem) para uma cor e tamanho de bloco."""
+    margem = _margem(b)
+    lado   = b + 2 * margem
+    cores  = {color, border_color, tuple(FOOD_HIGHLIGHT)}
+    frames = [math.tau * f / _FRAMES_ANIMACAO for f in range(_FRAMES_ANIMACAO)]
+    cores.update(_cor_sparkle(color, t) for fase in frames
+                 for t in _twinkles(fase))
+
+    tira  = superficie_com_chave(lado * _FRAMES_ANIMACAO, lado, cores)
+    areas = []
+    for f, fase in enumerate(frames):
+        area = pygame.Rect(f * lado, 0, lado, lado)
+        _pintar_frame(tira, area.x + margem, margem, b, fase, color, border_color)
+        areas.append(area)
+    return para_ecra(tira), tuple(areas), margem
+
+
+def _twinkles(fase: float):
+    # Multiplicador inteiro de `fase` → a animação fecha ao fim de uma volta
+    for i in range(_SPARKLE_COUNT):
+        angle = fase + (math.tau / _SPARKLE_COUNT) * i
+        yield (math.sin(angle * 2.0 + fase) + 1.0) * 0.5
+
+
+def _cor_sparkle(color: tuple, twinkle: float) -> tuple:
+    alpha = _SPARKLE_ALPHA * (0.35 + 0.65 * twinkle)
+    return tuple(max(0, min(255, int(c * alpha))) for c in color)
+
+
+def _pintar_frame(surface: pygame.Surface, x: int, y: int, b: int,
+                  fase: float, color: tuple, border_color: tuple) -> None:
+    """Desenha a comida do bloco (x, y) na fase `fase`."""
+    m = max(1, b // 6)
+
+    # ── Pulso do raio ─────────────────────────────────────────────────────
+    pulse  = 1.0 + 0.12 * math.sin(fase * (_PULSE_SPEED / _SPARKLE_SPEED))
+    base_r = max(2.0, b / 2.0 - m)
+    r      = max(2, int(base_r * pulse))
+    cx, cy = x + b // 2, y + b // 2
+
+    # ── Corpo principal ───────────────────────────────────────────────────
+    outer = pygame.Rect(cx - r, cy - r, r * 2, r * 2)
+    pygame.draw.ellipse(surface, color, outer)
+
+    # Brilho no canto superior esquerdo
+    hs = max(2, r // 2)
+    pygame.draw.ellipse(surface, FOOD_HIGHLIGHT,
+                        pygame.Rect(cx - r // 4 - hs // 2,
+                                    cy - r // 4 - hs // 2, hs, hs))
+    pygame.draw.ellipse(surface, border_color, outer, 1)
+
+    # ── Sparkles orbitais ─────────────────────────────────────────────────
+    orbit_r = max(3, int(b * _SPARKLE_ORBIT * 0.5))
+    for i, twinkle in enumerate(_twinkles(fase)):
+        # Ângulo base + offset por sparkle
+        angle = fase + (math.tau / _SPARKLE_COUNT) * i
+        sx    = cx + int(math.cos(angle) * orbit_r)
+        sy    = cy + int(math.sin(angle) * orbit_r)
+
+        # Twinkle: brilho varia sinusoidalmente por sparkle
+        col  = _cor_sparkle(color, twinkle)
+        size = max(1, int(_SPARKLE_SIZE * (0.5 + 0.5 * twinkle)))
+        pygame.draw.circle(surface, col, (sx, sy), size)
@@ -8,32 +8,123 @@ Emissores disponíveis:
   emit_death        — explosão distribuída ao morrer
 
 O sistema é criado uma vez no Engine e partilhado por todos os modos.
+
+Armazenamento em estrutura-de-arrays: cada campo (x, y, vx, vy, life, decay,
+radius, gravity, cor) é um array NumPy paralelo e as partículas vivas ocupam
+sempre as primeiras `count` posições. Os emissores escrevem em bloco, a
+integração e o atrito são operações vectoriais e as mortas são compactadas
+com uma máscara — dezenas de milhares de partículas cabem num frame.
+Sem NumPy os mesmos campos vivem em listas e o limite volta aos 500 de antes.
+
+Desenho: cada cor da paleta tem um atlas com os discos já rasterizados para
+cada raio (1.._R_MAX) × nível de fade (_NIVEIS_FADE). draw() só calcula qual
+a célula do atlas de cada partícula e pinta tudo com um único
+Surface.blits(). Com brilho=True usa-se um atlas de halos em gradiente
+pintados com BLEND_ADD (aditivo — partículas sobrepostas somam luz).
+
+As partículas vivem em coordenadas do tabuleiro; draw()/rects() com uma
+câmara deslocam-nas para o ecrã e descartam (em bloco, no NumPy) as que
+estão fora da vista.
 """
 from __future__ import annotations
 
 import math
 import random
-from dataclasses import dataclass
-from typing import List, Tuple
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple
 
 import pygame
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover — dependência opcional
+    np = None
+
 Color = Tuple[int, int, int]
 
-# ── Dataclass de partícula individual ─────────────────────────────────────────
+_rng = np.random.default_rng() if np is not None else None
+
+
+def semear(seed: int) -> None:
+    """Fixa o gerador NumPy dos emissores (o resto usa o módulo `random`)."""
+    global _rng
+    if np is not None:
+        _rng = np.random.default_rng(seed)
+
+# Limite de segurança — com arrays o custo por partícula é pequeno
+_MAX_COM_NUMPY: int = 50_000
+_MAX_SEM_NUMPY: int = 500
+
+# Campos de cada partícula (cor é um índice na paleta do sistema)
+_CAMPOS = ("x", "y", "vx", "vy", "life", "decay", "radius", "gravity", "cor")
+
+# Origens de emissão na morte — sem NumPy fica como antes (~18 por cobra)
+_ORIGENS_MORTE_SEM_NUMPY: int = 18
+
+# Atlas de sprites: raios 1.._R_MAX (maiores são limitados) × níveis de fade
+_R_MAX:         int = 12
+_NIVEIS_FADE:   int = 32
+_ESCALA_BRILHO: int = 2     # raio do halo = raio do disco × isto
+
+
+# ── Atlas de sprites ───────────────────────────────────────────────────────────
+
+class _AtlasParticulas:
+    """
+    Discos (ou halos) de uma cor, pré-renderizados numa única Surface.
+
+    Colunas = raio, linhas = nível de fade; `areas[r * _NIVEIS_FADE + nivel]`
+    é o rect da célula e `extensao(r)` a distância do centro ao canto.
+    """
+
+    def __init__(self, cor: Color, brilho: bool = False) -> None:
+        self.brilho = brilho
+        esc         = _ESCALA_BRILHO if brilho else 1
+        lados       = [2 * r * esc + 1 for r in range(_R_MAX + 1)]
+        x_col       = [0] * (_R_MAX + 1)
+        for r in range(2, _R_MAX + 1):
+            x_col[r] = x_col[r - 1] + lados[r - 1]
+        alt_linha   = lados[_R_MAX]
+        largura     = x_col[_R_MAX] + lados[_R_MAX]
+
+        niveis = [self._cor_no_nivel(cor, q) for q in range(_NIVEIS_FADE)]
+        self.surface = pygame.Surface((largura, alt_linha * _NIVEIS_FADE))
+        if not brilho:
+            # Chave: uma cor que nenhum nível produz (o preto do fade é pintado)
+            chave = next(k for k in ((255 - cor[0], 255 - cor[1], 255 - cor[2]),
+                                     (255, 0, 255), (0, 255, 0), (1, 2, 3))
+                         if k not in niveis)
+            self.surface.fill(chave)
+            self.surface.set_colorkey(chave)
+
+        self.areas: List[Optional[pygame.Rect]] = [None] * ((_R_MAX + 1) * _NIVEIS_FADE)
+        for r in range(1, _R_MAX + 1):
+            ext = r * esc
+            for q, col in enumerate(niveis):
+                area = pygame.Rect(x_col[r], q * alt_linha, lados[r], lados[r])
+                if brilho:
+                    self._halo(area, col, ext)
+                else:
+                    pygame.draw.circle(self.surface, col, (area.x + r, area.y + r), r)
+                self.areas[r * _NIVEIS_FADE + q] = area
+
+        # Mesmo formato do ecrã → blits sem conversão de píxeis
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
 
-@dataclass
-class _Particle:
-    """Estado de uma partícula — uso interno ao módulo."""
-    x:       float
-    y:       float
-    vx:      float          # velocidade horizontal (px/s)
-    vy:      float          # velocidade vertical   (px/s)
-    life:    float          # 1.0 → 0.0 (morta quando < 0)
-    decay:   float          # diminuição de life por segundo
-    radius:  float          # raio base em píxeis
-    color:   Color
-    gravity: float = 0.0   # aceleração vertical adicional (px/s²)
+    @staticmethod
+    def _cor_no_nivel(cor: Color, q: int) -> Color:
+        t = q / (_NIVEIS_FADE - 1)
+        return (int(cor[0] * t), int(cor[1] * t), int(cor[2] * t))
+
+    def _halo(self, area: pygame.Rect, col: Color, ext: int) -> None:
+        """Gradiente radial: anéis concêntricos, mais intensos ao centro."""
+        centro = (area.x + ext, area.y + ext)
+        for raio in range(ext, 0, -1):
+            k = (1.0 - (raio - 1) / ext) ** 2
+            pygame.draw.circle(self.surface,
+                               (int(col[0] * k), int(col[1] * k), int(col[2] * k)),
+                               centro, raio)
 
 
 # ── Sistema público ────────────────────────────────────────────────────────────
@@ -52,10 +143,24 @@ class SistemaDeParticulas:
         self.particulas.draw(surface)
     """
 
-    _MAX: int = 500  # limite para evitar lag em casos extremos
+    _MAX:            int = _MAX_COM_NUMPY if np is not None else _MAX_SEM_NUMPY
+    _CAPACIDADE_INI: int = 1024
 
-    def __init__(self) -> None:
-        self._pool: List[_Particle] = []
+    def __init__(self, brilho: bool = False) -> None:
+        self._n = 0
+        # Geometria do estado actual — rects() e draw() partilham-na
+        self._geo_cache = None
+        self._geo_vista = None
+        self._brilho    = brilho
+        self._atlas:    Dict[Tuple[int, bool], _AtlasParticulas] = {}
+        self._paleta:     List[Color]      = []
+        self._indice_cor: Dict[Color, int] = {}
+        if np is not None:
+            self._cap    = self._CAPACIDADE_INI
+            self._campos = {c: np.zeros(self._cap, dtype=np.float64) for c in _CAMPOS}
+            self._campos["cor"] = np.zeros(self._cap, dtype=np.int32)
+        else:
+            self._campos = {c: [] for c in _CAMPOS}
 
     # ── Emissores ─────────────────────────────────────────────────────────────
 
@@ -63,100 +168,251 @@ class SistemaDeParticulas:
                         block: int, count: int = 14) -> None:
         """Explosão radial ao comer comida."""
         cx, cy = pos_px[0] + block // 2, pos_px[1] + block // 2
-        for _ in range(count):
-            angle = random.uniform(0, math.tau)
-            speed = random.uniform(55, 165)
-            self._emit(_Particle(
-                x=float(cx), y=float(cy),
-                vx=math.cos(angle) * speed,
-                vy=math.sin(angle) * speed,
-                life=1.0,
-                decay=random.uniform(2.0, 3.5),
-                radius=random.uniform(2.0, max(3.0, block / 4.0)),
-                color=color,
-                gravity=95.0,
-            ))
+        self._emitir_radial(
+            [(cx, cy)], count, color,
+            angulos=None, velocidade=(55, 165), decay=(2.0, 3.5),
+            raio=(2.0, max(3.0, block / 4.0)), gravidade=95.0,
+        )
 
     def emit_boost_pickup(self, pos_px: Tuple[int, int], color: Color,
                           block: int) -> None:
         """Anel de partículas ao apanhar um boost."""
         cx, cy = pos_px[0] + block // 2, pos_px[1] + block // 2
         n = 18
-        for i in range(n):
-            angle = (math.tau / n) * i
-            speed = random.uniform(70, 120)
-            self._emit(_Particle(
-                x=float(cx), y=float(cy),
-                vx=math.cos(angle) * speed,
-                vy=math.sin(angle) * speed,
-                life=1.0,
-                decay=random.uniform(1.5, 2.5),
-                radius=random.uniform(2.0, 4.0),
-                color=color,
-                gravity=0.0,
-            ))
+        self._emitir_radial(
+            [(cx, cy)], n, color,
+            angulos=[(math.tau / n) * i for i in range(n)],
+            velocidade=(70, 120), decay=(1.5, 2.5),
+            raio=(2.0, 4.0), gravidade=0.0,
+        )
 
     def emit_death(self, segments: list, color: Color, block: int) -> None:
         """Explosão distribuída ao longo do corpo da cobra."""
-        step = max(1, len(segments) // 18)   # máx ~18 origens de emissão
-        for seg in segments[::step]:
-            cx, cy = seg[0] + block // 2, seg[1] + block // 2
-            for _ in range(5):
-                angle = random.uniform(0, math.tau)
-                speed = random.uniform(30, 105)
-                self._emit(_Particle(
-                    x=float(cx), y=float(cy),
-                    vx=math.cos(angle) * speed,
-                    vy=math.sin(angle) * speed,
-                    life=1.0,
-                    decay=random.uniform(1.2, 2.2),
-                    radius=random.uniform(2.0, max(3.0, block / 3.0)),
-                    color=color,
-                    gravity=130.0,
-                ))
+        if np is None:
+            # Sem NumPy: máx ~18 origens de emissão, como sempre foi
+            step     = max(1, len(segments) // _ORIGENS_MORTE_SEM_NUMPY)
+            segments = segments[::step]
+        origens = [(s[0] + block // 2, s[1] + block // 2) for s in segments]
+        self._emitir_radial(
+            origens, 5, color,
+            angulos=None, velocidade=(30, 105), decay=(1.2, 2.2),
+            raio=(2.0, max(3.0, block / 3.0)), gravidade=130.0,
+        )
 
     # ── Loop visual ───────────────────────────────────────────────────────────
 
     def update(self, dt: float) -> None:
         """Avança física de todas as partículas e remove as expiradas."""
+        n = self._n
+        if not n:
+            return
+        self._geo_cache = None
         friction = 1.0 - 4.5 * dt    # atrito suave independente de FPS
-        live: List[_Particle] = []
-        for p in self._pool:
-            p.x    += p.vx * dt
-            p.y    += p.vy * dt
-            p.vy   += p.gravity * dt
-            p.vx   *= friction
-            p.life -= p.decay * dt
-            if p.life > 0.0:
-                live.append(p)
-        self._pool = live
-
-    def draw(self, surface: pygame.Surface) -> None:
+        c = self._campos
+
+        if np is None:
+            xs, ys, vxs, vys = c["x"], c["y"], c["vx"], c["vy"]
+            for i in range(n):
+                xs[i]  += vxs[i] * dt
+                ys[i]  += vys[i] * dt
+                vys[i] += c["gravity"][i] * dt
+                vxs[i] *= friction
+                c["life"][i] -= c["decay"][i] * dt
+            vivas = [i for i in range(n) if c["life"][i] > 0.0]
+            if len(vivas) != n:
+                for nome in _CAMPOS:
+                    coluna = c[nome]
+                    coluna[:] = [coluna[i] for i in vivas]
+                self._n = len(vivas)
+            return
+
+        x, y, vx, vy = c["x"][:n], c["y"][:n], c["vx"][:n], c["vy"][:n]
+        life         = c["life"][:n]
+        x    += vx * dt
+        y    += vy * dt
+        vy   += c["gravity"][:n] * dt
+        vx   *= friction
+        life -= c["decay"][:n] * dt
+
+        vivas = life > 0.0
+        k     = int(np.count_nonzero(vivas))
+        if k != n:
+            for coluna in c.values():
+                coluna[:k] = coluna[:n][vivas]
+            self._n = k
+
+    def draw(self, surface: pygame.Surface, camara=None) -> None:
         """
-        Renderiza partículas na surface.
+        Renderiza partículas na surface com um único blits().
         A cor é escurecida proporcionalmente à vida (fade → preto),
         o que funciona nativamente em fundos escuros sem precisar de
         superfícies alpha separadas — muito mais rápido.
+        Com `camara`, só as que estão na vista, em coordenadas de ecrã.
         """
-        for p in self._pool:
-            t   = max(0.0, p.life)
-            r   = max(1, int(p.radius * (0.35 + 0.65 * t)))
-            col = (int(p.color[0] * t),
-                   int(p.color[1] * t),
-                   int(p.color[2] * t))
-            pygame.draw.circle(surface, col, (int(p.x), int(p.y)), r)
+        if not self._n:
+            return
+        esq, topo, _lado, celula, cor = self._geometria(camara)
+        if not esq:
+            return
+        atlas  = [self._obter_atlas(i) for i in range(len(self._paleta))]
+        # A disposição das células é igual em todos os atlas do mesmo tipo
+        areas  = map(atlas[0].areas.__getitem__, celula)
+        fontes = map([a.surface for a in atlas].__getitem__, cor)
+        if self._brilho:
+            sequencia = zip(fontes, zip(esq, topo), areas, repeat(pygame.BLEND_ADD))
+        else:
+            sequencia = zip(fontes, zip(esq, topo), areas)
+        surface.blits(sequencia, doreturn=False)
+
+    def rects(self, camara=None) -> List[pygame.Rect]:
+        """Rectângulos ocupados pelas partículas tal como draw() as pinta agora."""
+        Rect = pygame.Rect
+        esq, topo, lado, _celula, _cor = self._geometria(camara)
+        return [Rect(x, y, l, l) for x, y, l in zip(esq, topo, lado)]
+
+    @property
+    def brilho(self) -> bool:
+        """Halos aditivos (BLEND_ADD) em vez de discos sólidos."""
+        return self._brilho
+
+    @brilho.setter
+    def brilho(self, valor: bool) -> None:
+        self._brilho    = bool(valor)
+        self._geo_cache = None
 
     def clear(self) -> None:
         """Remove todas as partículas — útil ao reiniciar a sessão."""
-        self._pool.clear()
+        self._n         = 0
+        self._geo_cache = None
+        if np is None:
+            for coluna in self._campos.values():
+                coluna.clear()
 
     @property
     def count(self) -> int:
         """Número de partículas activas (útil para debug/profiling)."""
-        return len(self._pool)
+        return self._n
 
     # ── Interno ───────────────────────────────────────────────────────────────
 
-    def _emit(self, p: _Particle) -> None:
-        if len(self._pool) < self._MAX:
-            self._pool.append(p)
\ No newline at end of file
+    def _cor(self, color: Color) -> int:
+        """Índice da cor na paleta (acrescenta-a na primeira vez)."""
+        color = tuple(color)
+        i = self._indice_cor.get(color)
+        if i is None:
+            i = len(self._paleta)
+            self._paleta.append(color)
+            self._indice_cor[color] = i
+        return i
+
+    def _emitir_radial(self, origens, por_origem: int, color: Color, *,
+                       angulos, velocidade, decay, raio, gravidade) -> None:
+        """`por_origem` partículas em cada origem — ângulos fixos ou aleatórios."""
+        k = min(len(origens) * por_origem, self._MAX - self._n)
+        if k <= 0:
+            return
+        cor = self._cor(color)
+
+        if np is None:
+            for i in range(k):
+                ox, oy = origens[i // por_origem]
+                ang = (angulos[i % por_origem] if angulos is not None
+                       else random.uniform(0, math.tau))
+                vel = random.uniform(*velocidade)
+                for nome, valor in (
+                    ("x", float(ox)), ("y", float(oy)),
+                    ("vx", math.cos(ang) * vel), ("vy", math.sin(ang) * vel),
+                    ("life", 1.0), ("decay", random.uniform(*decay)),
+                    ("radius", random.uniform(*raio)), ("gravity", gravidade),
+                    ("cor", cor),
+                ):
+                    self._campos[nome].append(valor)
+            self._n        += k
+            self._geo_cache = None
+            return
+
+        origens = np.repeat(np.asarray(origens, dtype=np.float64), por_origem, axis=0)[:k]
+        if angulos is not None:
+            ang = np.resize(np.asarray(angulos, dtype=np.float64), k)
+        else:
+            ang = _rng.uniform(0.0, math.tau, k)
+        vel = _rng.uniform(velocidade[0], velocidade[1], k)
+        self._escrever(k,
+                       x=origens[:, 0], y=origens[:, 1],
+                       vx=np.cos(ang) * vel, vy=np.sin(ang) * vel,
+                       life=1.0, decay=_rng.uniform(decay[0], decay[1], k),
+                       radius=_rng.uniform(raio[0], raio[1], k),
+                       gravity=gravidade, cor=cor)
+
+    def _escrever(self, k: int, **valores) -> None:
+        """Copia `k` partículas novas para o fim dos arrays (cresce se preciso)."""
+        n = self._n
+        if n + k > self._cap:
+            cap = self._cap
+            while cap < n + k:
+                cap *= 2
+            for nome, coluna in self._campos.items():
+                nova = np.zeros(cap, dtype=coluna.dtype)
+                nova[:n] = coluna[:n]
+                self._campos[nome] = nova
+            self._cap = cap
+        for nome, valor in valores.items():
+            self._campos[nome][n:n + k] = valor
+        self._n         = n + k
+        self._geo_cache = None
+
+    def _obter_atlas(self, indice_cor: int) -> _AtlasParticulas:
+        chave = (indice_cor, self._brilho)
+        atlas = self._atlas.get(chave)
+        if atlas is None:
+            atlas = _AtlasParticulas(self._paleta[indice_cor], self._brilho)
+            self._atlas[chave] = atlas
+        return atlas
+
+    def _geometria(self, camara=None):
+        """
+        Listas paralelas (esq, topo, lado, célula do atlas, cor) de cada
+        partícula tal como é pintada agora (só as visíveis, com câmara).
+        """
+        vista = camara.rect if camara is not None else None
+        if self._geo_cache is None or vista != self._geo_vista:
+            self._geo_cache = self._calcular_geometria(vista)
+            self._geo_vista = vista
+        return self._geo_cache
+
+    def _calcular_geometria(self, vista=None):
+        n, c = self._n, self._campos
+        esc  = _ESCALA_BRILHO if self._brilho else 1
+        vx, vy, vw, vh = vista if vista is not None else (0, 0, 0, 0)
+        if np is None:
+            esq, topo, lado, celula, cor = [], [], [], [], []
+            for i in range(n):
+                t = max(0.0, c["life"][i])
+                r = min(_R_MAX, max(1, int(c["radius"][i] * (0.35 + 0.65 * t))))
+                e = r * esc
+                x = int(c["x"][i]) - e - vx
+                y = int(c["y"][i]) - e - vy
+                if vista is not None and not (-2 * e - 1 < x < vw and -2 * e - 1 < y < vh):
+                    continue
+                esq.append(x)
+                topo.append(y)
+                lado.append(2 * e + 1)
+                celula.append(r * _NIVEIS_FADE + int(t * (_NIVEIS_FADE - 1) + 0.5))
+                cor.append(c["cor"][i])
+            return esq, topo, lado, celula, cor
+
+        t = np.minimum(np.maximum(c["life"][:n], 0.0), 1.0)
+        r = (c["radius"][:n] * (0.35 + 0.65 * t)).astype(np.int64)
+        np.clip(r, 1, _R_MAX, out=r)
+        e      = r * esc
+        nivel  = np.rint(t * (_NIVEIS_FADE - 1)).astype(np.int64)
+        x      = c["x"][:n].astype(np.int64) - e - vx
+        y      = c["y"][:n].astype(np.int64) - e - vy
+        lado   = 2 * e + 1
+        celula = r * _NIVEIS_FADE + nivel
+        cor    = c["cor"][:n]
+        if vista is not None:
+            dentro = (x > -lado) & (x < vw) & (y > -lado) & (y < vh)
+            if not dentro.all():
+                x, y, lado, celula, cor = (a[dentro] for a in (x, y, lado, celula, cor))
+        return x.tolist(), y.tolist(), lado.tolist(), celula.tolist(), cor.tolist()
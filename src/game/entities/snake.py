@@ -5,21 +5,44 @@ Cobra com:
   - Rasto (ghost trail) de 6 posições
   - Highlight na cabeça e olho orientado
   - Flash de morte antes do game_over
+
+Desenho em cache: cada aspecto (segmento de uma dada cor, cabeça numa dada
+direcção, quadrado do rasto) é rasterizado uma vez num tile com colorkey.
+A cor de cada índice do corpo vem de uma tabela refeita só quando o
+comprimento muda, e a lista de blits da cobra só é remontada quando ela
+muda de aspecto (tick lógico, flash) — entre ticks, cada frame são uns
+poucos Surface.blits() (rasto, corpo, e cabeça/cauda à parte).
+
+Com câmara (tabuleiros maiores do que o ecrã), a lista de blits só leva os
+blocos dentro da vista, já deslocados — é remontada quando a câmara mexe.
+
+Interpolação: com `alfa` (fracção do intervalo lógico, vinda do engine) a
+cabeça e a ponta da cauda deslizam ao longo do caminho que fizeram no
+último tick, em vez de saltarem um bloco de cada vez. O corpo continua na
+lista em cache; só esses dois blits são calculados a cada frame. Caminhos
+que não são contíguos (teleporte nas bordas, respawn) não deslizam.
+
+As regras de movimento vivem em game.sim.cobra.CobraLogica (sem pygame);
+esta classe acrescenta apenas o estado e o desenho visuais.
 """
 from __future__ import annotations
 
 from collections import deque
-from typing import Tuple
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
 
 import pygame
 
-from game.config import BLOCK_SIZE, SNAKE1_HEAD, SNAKE1_BODY, SNAKE1_BORDER
+from game.config           import BLOCK_SIZE, SNAKE1_HEAD, SNAKE1_BODY, SNAKE1_BORDER
+from game.entities.sprites import para_ecra, superficie_com_chave
+from game.sim.cobra        import CobraLogica
 
 _TRAIL_LEN:         int = 6
 _DEATH_FLASH_TICKS: int = 6
+_COR_OLHO:          Tuple[int, int, int] = (200, 232, 212)
 
 
-class Snake:
+class Snake(CobraLogica):
     """
     Cobra do jogo.
 
@@ -32,87 +55,66 @@ class Snake:
     def __init__(self, start_pos: Tuple[int, int] = (100, 100),
                  block_size: int = BLOCK_SIZE,
                  color=None, head_color=None, border_color=None) -> None:
-        self.block        = block_size
+        super().__init__(start_pos, block_size)
         self.head_color   = head_color   or (_brighten(color, 35) if color else SNAKE1_HEAD)
         self.body_color   = color        or SNAKE1_BODY
         self.border_color = border_color or SNAKE1_BORDER
 
-        self.segments:  list            = [start_pos]
-        self.direction: Tuple[int, int] = (1, 0)
-        self.grow_next: int             = 0
-
         # Rasto visual — posições recentes da cabeça
         self._trail: deque = deque(maxlen=_TRAIL_LEN)
 
-        # ── Input buffer ───────────────────────────────────────────────────
-        # Guarda até 2 direcções pendentes para que inputs rápidos não se
-        # percam entre ticks de lógica. Validação anti-180° feita no enqueue.
-        self._dir_buffer: deque[Tuple[int, int]] = deque(maxlen=2)
-
         # Flash de morte
         self._dying:       bool = False
         self._flash_tick:  int  = 0
         self._flash_state: bool = True
 
-    # ── Input ─────────────────────────────────────────────────────────────────
+        # Incrementa sempre que o aspecto muda (render por dirty rects)
+        self.versao_desenho: int = 0
 
-    def set_direction(self, dx: int, dy: int) -> None:
-        """
-        Enfileira uma nova direcção no buffer.
+        # Interpolação: movimentos no tick actual e blocos largados pela cauda
+        self._passos: int  = 0
+        self._caudas: list = []
 
-        Rejeita:
-          - Inversão de 180° em relação à última direcção confirmada (ou em fila)
-          - Duplicado do último item já em fila (evita spam de inputs iguais)
-        """
-        # Referência para validar 180°: último em fila ou direcção actual
-        ref = self._dir_buffer[-1] if self._dir_buffer else self.direction
-
-        if (dx, dy) == (-ref[0], -ref[1]):        # inversão directa → ignorar
-            return
-        if self._dir_buffer and self._dir_buffer[-1] == (dx, dy):  # duplicado
-            return
-
-        self._dir_buffer.append((dx, dy))
+        # Cache de desenho: tiles por aspecto, cor por índice, lista de blits
+        self._tiles:       Dict[tuple, pygame.Surface] = {}
+        self._lut_chave:   tuple                       = ()
+        self._lut_corpo:   List[pygame.Surface]        = []
+        self._blits_chave: tuple                       = ()
+        self._blits_rasto: list                        = []
+        self._blits:       list                        = []
 
     def update(self) -> None:
-        """
-        Avança a cobra um bloco.
-        Consome o próximo input do buffer (se existir) antes de mover.
-        """
-        if self._dir_buffer:
-            next_dir = self._dir_buffer.popleft()
-            # Segurança extra: não inverter para o segmento seguinte
-            if len(self.segments) > 1:
-                hx, hy  = self.segments[0]
-                ndx, ndy = next_dir
-                if (hx + ndx * self.block, hy + ndy * self.block) != self.segments[1]:
-                    self.direction = next_dir
-            else:
-                self.direction = next_dir
-
+        """Regista a cabeça no rasto e avança a cobra um bloco."""
+        cauda = self.segments[-1]
+        n     = len(self.segments)
         self._trail.appendleft(self.segments[0])
-        hx, hy = self.segments[0]
-        dx, dy = self.direction
-        self.segments.insert(0, (hx + dx * self.block, hy + dy * self.block))
-        if self.grow_next > 0:
-            self.grow_next -= 1
-        else:
-            self.segments.pop()
+        super().update()
+        self._passos += 1
+        if len(self.segments) == n:          # não cresceu: a cauda largou `cauda`
+            self._caudas.append(cauda)
+        self.versao_desenho += 1
+
+    def novo_tick(self) -> None:
+        """Início de um tick lógico: o caminho do tick anterior deixa de deslizar."""
+        if self._passos or self._caudas:
+            self._passos = 0
+            self._caudas = []
+            self.versao_desenho += 1
 
-    def grow(self, amount: int = 1) -> None:
-        """Agenda crescimento para os próximos `amount` ticks."""
-        self.grow_next += amount
-
-    # ── Colisões ──────────────────────────────────────────────────────────────
-
-    def collides_self(self) -> bool:
-        return self.segments[0] in self.segments[1:]
+    def set_head_pos(self, pos: Tuple[int, int]) -> None:
+        super().set_head_pos(pos)
+        self.versao_desenho += 1
 
-    def head_pos(self) -> Tuple[int, int]:
-        return self.segments[0]
+    def celulas_desenho(self) -> set:
+        """Blocos onde draw() pinta alguma coisa (corpo + rasto + cauda a deslizar)."""
+        return self.celulas() | set(self._trail) | set(self._caudas)
 
-    def set_head_pos(self, pos: Tuple[int, int]) -> None:
-        self.segments[0] = pos
+    def celulas_interpoladas(self) -> set:
+        """Blocos por onde a cabeça e a cauda deslizam (mudam a cada frame)."""
+        if not self._passos:
+            return set()
+        return ({self.segments[0], self.segments[-1]}
+                | set(islice(self._trail, self._passos)) | set(self._caudas))
 
     # ── Flash de morte ────────────────────────────────────────────────────────
 
@@ -121,6 +123,7 @@ class Snake:
         self._dying       = True
         self._flash_tick  = 0
         self._flash_state = True
+        self.versao_desenho += 1
 
     def tick_death_flash(self) -> bool:
         """Avança o flash; devolve True quando a animação termina."""
@@ -128,22 +131,51 @@ class Snake:
             return False
         self._flash_tick  += 1
         self._flash_state  = (self._flash_tick % 2 == 0)
+        self.versao_desenho += 1
         return self._flash_tick >= _DEATH_FLASH_TICKS
 
     # ── Desenho ───────────────────────────────────────────────────────────────
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw(self, surface: pygame.Surface, camara=None,
+             alfa: Optional[float] = None) -> None:
+        """Rasto, ponta da cauda, corpo e cabeça; com `alfa` a cabeça e a cauda deslizam."""
         if self._dying and not self._flash_state:
             return
-        self._draw_trail(surface)
-        self._draw_body(surface)
-        self._draw_head(surface)
-
-    def _draw_trail(self, surface: pygame.Surface) -> None:
+        vista = camara.rect if camara is not None else None
+        chave = (self.versao_desenho, len(self.segments), self.direction,
+                 self.head_color, self.body_color, self.border_color, vista)
+        if chave != self._blits_chave:
+            self._blits_rasto = self._montar_rasto()
+            self._blits       = list(zip(self._tabela_corpo(), self.segments[1:]))
+            if vista is not None:
+                self._blits_rasto = _recortar(self._blits_rasto, vista, self.block)
+                self._blits       = _recortar(self._blits, vista, self.block)
+            self._blits_chave = chave
+
+        cabeca = self.segments[0]
+        ponta  = None
+        if alfa is not None and self._passos:
+            caminho = list(islice(self._trail, self._passos))[::-1] + [cabeca]
+            cabeca  = _ao_longo(caminho, alfa, self.block) or cabeca
+            if self._caudas and len(self.segments) > 1:
+                ponta = _ao_longo(self._caudas + [self.segments[-1]], alfa, self.block)
+
+        surface.blits(self._blits_rasto, doreturn=False)
+        if ponta is not None:
+            surface.blits(self._na_vista([(self._tabela_corpo()[-1], ponta)], vista),
+                          doreturn=False)
+        surface.blits(self._blits, doreturn=False)
+        tile = self._tile(("cabeca", self.head_color, self.border_color,
+                           self.direction), _pintar_cabeca)
+        surface.blits(self._na_vista([(tile, cabeca)], vista), doreturn=False)
+
+    def _na_vista(self, blits: list, vista) -> list:
+        return blits if vista is None else _recortar(blits, vista, self.block)
+
+    def _montar_rasto(self) -> list:
         b = self.block
         n = len(self._trail)
-        if n == 0:
-            return
+        seq = []
         for i, (tx, ty) in enumerate(self._trail):
             t    = 1.0 - (i + 1) / (n + 1)
             size = max(2, int(b * t * 0.72))
@@ -152,40 +184,94 @@ class Snake:
             col  = (int(self.head_color[0] * t * 0.5),
                     int(self.head_color[1] * t * 0.5),
                     int(self.head_color[2] * t * 0.5))
-            pygame.draw.rect(
-                surface, col,
-                pygame.Rect(cx - size // 2, cy - size // 2, size, size),
-                border_radius=max(1, size // 3),
-            )
-
-    def _draw_body(self, surface: pygame.Surface) -> None:
-        b     = self.block
-        pad   = max(1, b // 8)
+            seq.append((self._tile(("rasto", size, col), _pintar_rasto),
+                        (cx - size // 2, cy - size // 2)))
+        return seq
+
+    def _tabela_corpo(self) -> List[pygame.Surface]:
+        """Tile de cada índice do corpo (1..n-1) — só muda com o comprimento."""
         total = max(len(self.segments), 1)
-        for i, (x, y) in enumerate(self.segments[1:], start=1):
-            t     = 1.0 - (i / total) * 0.45
-            col   = tuple(max(0, int(c * t)) for c in self.body_color)
-            inner = pygame.Rect(x + pad, y + pad, b - pad * 2, b - pad * 2)
-            pygame.draw.rect(surface, col, inner, border_radius=2)
-            pygame.draw.rect(surface, self.border_color,
-                             pygame.Rect(x, y, b, b), 1)
-
-    def _draw_head(self, surface: pygame.Surface) -> None:
-        b     = self.block
-        pad   = max(1, b // 8)
-        x, y  = self.segments[0]
-        inner = pygame.Rect(x + pad, y + pad, b - pad * 2, b - pad * 2)
-        pygame.draw.rect(surface, self.head_color, inner, border_radius=4)
-        hi_col  = _brighten(self.head_color, 28)
-        hi_rect = pygame.Rect(inner.x, inner.y, inner.w, max(2, inner.h // 3))
-        pygame.draw.rect(surface, hi_col, hi_rect, border_radius=4)
-        pygame.draw.rect(surface, self.border_color,
-                         pygame.Rect(x, y, b, b), 1)
-        _draw_eye(surface, x, y, b, self.direction)
+        chave = (total, self.body_color, self.border_color)
+        if chave != self._lut_chave:
+            self._lut_corpo = []
+            for i in range(1, total):
+                t   = 1.0 - (i / total) * 0.45
+                col = tuple(max(0, int(c * t)) for c in self.body_color)
+                self._lut_corpo.append(
+                    self._tile(("corpo", col, self.border_color), _pintar_segmento))
+            self._lut_chave = chave
+        return self._lut_corpo
+
+    def _tile(self, chave: tuple, pintar) -> pygame.Surface:
+        tile = self._tiles.get(chave)
+        if tile is None:
+            tile = pintar(self, *chave[1:])
+            self._tiles[chave] = tile
+        return tile
+
+
+# ── Tiles ──────────────────────────────────────────────────────────────────────
+
+def _pintar_rasto(cobra: Snake, size: int, col: tuple) -> pygame.Surface:
+    tile = superficie_com_chave(size, size, (col,))
+    pygame.draw.rect(tile, col, pygame.Rect(0, 0, size, size),
+                     border_radius=max(1, size // 3))
+    return para_ecra(tile)
+
+
+def _pintar_segmento(cobra: Snake, col: tuple, borda: tuple) -> pygame.Surface:
+    b    = cobra.block
+    pad  = max(1, b // 8)
+    tile = superficie_com_chave(b, b, (col, borda))
+    inner = pygame.Rect(pad, pad, b - pad * 2, b - pad * 2)
+    pygame.draw.rect(tile, col, inner, border_radius=2)
+    pygame.draw.rect(tile, borda, pygame.Rect(0, 0, b, b), 1)
+    return para_ecra(tile)
+
+
+def _pintar_cabeca(cobra: Snake, cor: tuple, borda: tuple,
+                   direction: Tuple[int, int]) -> pygame.Surface:
+    b      = cobra.block
+    pad    = max(1, b // 8)
+    hi_col = _brighten(cor, 28)
+    tile   = superficie_com_chave(b, b, (cor, hi_col, borda, _COR_OLHO))
+    inner  = pygame.Rect(pad, pad, b - pad * 2, b - pad * 2)
+    pygame.draw.rect(tile, cor, inner, border_radius=4)
+    hi_rect = pygame.Rect(inner.x, inner.y, inner.w, max(2, inner.h // 3))
+    pygame.draw.rect(tile, hi_col, hi_rect, border_radius=4)
+    pygame.draw.rect(tile, borda, pygame.Rect(0, 0, b, b), 1)
+    _draw_eye(tile, 0, 0, b, direction)
+    return para_ecra(tile)
 
 
 # ── Utilitários de módulo ──────────────────────────────────────────────────────
 
+def _ao_longo(caminho: list, alfa: float, b: int) -> Optional[Tuple[int, int]]:
+    """
+    Ponto a `alfa` (0–1) do caminho de blocos; None se algum passo não for
+    entre blocos vizinhos (teleporte) — aí não há nada a interpolar.
+    """
+    n = len(caminho) - 1
+    if n < 1:
+        return None
+    for (x0, y0), (x1, y1) in zip(caminho, caminho[1:]):
+        if abs(x1 - x0) + abs(y1 - y0) != b:
+            return None
+    s = min(max(alfa, 0.0), 1.0) * n
+    i = min(int(s), n - 1)
+    f = s - i
+    (x0, y0), (x1, y1) = caminho[i], caminho[i + 1]
+    return (x0 + round((x1 - x0) * f), y0 + round((y1 - y0) * f))
+
+
+def _recortar(blits: list, vista: tuple, b: int) -> list:
+    """Só os blits dentro da vista (x, y, w, h), em coordenadas de ecrã."""
+    vx, vy, vw, vh = vista
+    x0, y0, x1, y1 = vx - b, vy - b, vx + vw, vy + vh
+    return [(tile, (x - vx, y - vy)) for tile, (x, y) in blits
+            if x0 < x < x1 and y0 < y < y1]
+
+
 def _brighten(color: tuple, amt: int) -> tuple:
     return tuple(min(c + amt, 255) for c in color)
 
@@ -197,6 +283,6 @@ def _draw_eye(surface: pygame.Surface, x: int, y: int,
     off    = b // 3
     ex, ey = cx + dx * off, cy + dy * off
     r = max(1, b // 7)
-    pygame.draw.rect(surface, (200, 232, 212),
+    pygame.draw.rect(surface, _COR_OLHO,
                      pygame.Rect(ex - r, ey - r, r * 2, r * 2),
                      border_radius=1)
\ No newline at end of file
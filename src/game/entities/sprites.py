@@ -0,0 +1,31 @@
+# src/game/entities/sprites.py
+"""
+Utilitários para sprites pré-rasterizados das entidades.
+
+Os desenhos do jogo usam só cores sólidas (rect/ellipse/polygon/circle sem
+anti-aliasing), por isso uma Surface com colorkey reproduz ao píxel o que
+as chamadas pygame.draw pintariam directamente no ecrã.
+"""
+from __future__ import annotations
+
+from typing import Iterable
+
+import pygame
+
+# Candidatas a colorkey, por ordem de preferência
+_CHAVES = ((255, 0, 255), (0, 255, 255), (1, 2, 3), (254, 1, 253))
+
+
+def superficie_com_chave(w: int, h: int, cores: Iterable[tuple]) -> pygame.Surface:
+    """Surface w×h transparente (colorkey numa cor que não está em `cores`)."""
+    usadas = {tuple(c) for c in cores}
+    chave  = next(k for k in _CHAVES if k not in usadas)
+    surf   = pygame.Surface((w, h))
+    surf.fill(chave)
+    surf.set_colorkey(chave)
+    return surf
+
+
+def para_ecra(surf: pygame.Surface) -> pygame.Surface:
+    """Converte para o formato do ecrã, se já houver um (blits sem conversão)."""
+    return surf.convert() if pygame.display.get_surface() is not None else surf
@@ -5,10 +5,27 @@ Otimizacoes vs versao original:
   - _obst_set: set() para lookup O(1) em vez de O(n) na lista
   - has_full_borders: propriedade com cache — calcula uma vez, nao por frame
   - obstaculos_pixels(): cache invalidado ao recarregar obstaculos
+  - celulas_livres(): indice de celulas sem obstaculo, sorteio O(1) no spawn
+  - para_dados()/de_dados(): copia exacta do mapa embutida nos replays
+  - definir_obstaculo(): edicao de um bloco com os caches actualizados no
+    sitio; `versao` + alteracoes_desde() dizem ao MapRenderer o que mudou
+  - _load_from_file(): le o formato compilado (mapa_compilado) — os .txt sao
+    compilados uma vez e ficam em cache pelo hash do conteudo; as bordas e
+    as mascaras de vizinhos (mascaras_vizinhos) ja vem calculadas
+
+Tamanho do tabuleiro: e uma propriedade de cada mapa — um .txt tem as
+dimensoes das suas linhas (pode ser muito maior do que o ecra; a camara do
+engine segue o jogador). Os mapas gerados por tipo usam a grelha por
+omissao cfg.GRID_COLS x cfg.GRID_ROWS.
 """
 import os
 import random
 import game.config as cfg
+from game.maps import mapa_compilado
+from game.sim.celulas_livres import IndiceCelulasLivres
+
+# Edicoes guardadas para alteracoes_desde() antes de se pedir redesenho total
+_MAX_ALTERACOES = 4096
 
 
 class Mapas:
@@ -17,13 +34,21 @@ class Mapas:
         self.source     = path_or_tipo
         self.auto_scale = auto_scale
         self.block      = block_size or cfg.BLOCK_SIZE
-        self.cols       = max(1, cfg.SCREEN_WIDTH  // max(1, self.block))
-        self.rows       = max(1, cfg.SCREEN_HEIGHT // max(1, self.block))
+        self.cols       = cfg.GRID_COLS
+        self.rows       = cfg.GRID_ROWS
 
         self.obstaculos = []
         self._obst_set           = set()   # lookup O(1)
         self._has_full_borders   = None    # cache
         self._obst_pixels_cache  = None    # cache de pixels
+        self._livres_cache       = None    # IndiceCelulasLivres sem obstaculos
+        self._vizinhos           = None    # bloco → mascara VIZ_* dos vizinhos
+
+        # Versao do conteudo: +1 a cada recarga ou edicao. _alteracoes guarda
+        # os blocos editados desde _versao_base (a ultima recarga completa).
+        self.versao        = 0
+        self._versao_base  = 0
+        self._alteracoes   = []
 
         self.spawn_snake_block   = None
         self.spawn_snake2_block  = None
@@ -45,6 +70,11 @@ class Mapas:
         self._obst_set          = set(self.obstaculos)
         self._has_full_borders  = None
         self._obst_pixels_cache = None
+        self._livres_cache      = None
+        self._vizinhos          = None
+        self.versao            += 1
+        self._versao_base       = self.versao
+        self._alteracoes        = []
 
     @property
     def has_full_borders(self):
@@ -81,44 +111,28 @@ class Mapas:
         if self.spawn_food_block is None:
             self.spawn_food_block = (max(1, self.cols // 2 - 1), max(1, self.rows // 2))
 
-    # ── Loader .txt ───────────────────────────────────────────────────────────
+    # ── Loader (.txt ou .snkm) ────────────────────────────────────────────────
     def _load_from_file(self, filepath):
-        with open(filepath, "r", encoding="utf-8") as f:
-            raw_lines = [
-                line.rstrip("\n")
-                for line in f
-                if line.rstrip("\n") != "" and not line.lstrip().startswith(";")
-            ]
-        if not raw_lines:
-            raise ValueError("Ficheiro de mapa vazio: " + filepath)
-
-        maxw = max(len(l) for l in raw_lines)
-        grid = [list(l.ljust(maxw, ".")) for l in raw_lines]
-
-        self.rows = len(grid)
-        self.cols = maxw
-        self.obstaculos          = []
-        self.spawn_snake_block   = None
-        self.spawn_snake2_block  = None
-        self.spawn_food_block    = None
+        mc = mapa_compilado.carregar(filepath)
 
-        for gy, row in enumerate(grid):
-            for gx, ch in enumerate(row):
-                if   ch == "#": self.obstaculos.append((gx, gy))
-                elif ch == "S": self.spawn_snake_block  = (gx, gy)
-                elif ch == "P": self.spawn_snake2_block = (gx, gy)
-                elif ch == "F": self.spawn_food_block   = (gx, gy)
+        self.rows = mc.rows
+        self.cols = mc.cols
+        self.obstaculos          = mc.obstaculos
+        self.spawn_snake_block   = mc.spawn_snake
+        self.spawn_snake2_block  = mc.spawn_snake2
+        self.spawn_food_block    = mc.spawn_food
 
         self.source   = filepath
         self.filepath = filepath
         self._rebuild_cache()
+        self._has_full_borders = mc.bordas
+        self._vizinhos         = mc.mascaras()
 
     # ── Generator por tipo ────────────────────────────────────────────────────
     def _generate_by_type(self, tipo):
         t = tipo if isinstance(tipo, int) else 1
         self.obstaculos = []
-        self.cols = max(1, cfg.SCREEN_WIDTH  // self.block)
-        self.rows = max(1, cfg.SCREEN_HEIGHT // self.block)
+        # cols/rows: grelha por omissao (__init__) ou ajustada ao ecra (update_grid)
 
         if t == 2:
             ranges = [
@@ -154,7 +168,98 @@ class Mapas:
         self.spawn_food_block   = (self.cols // 2,     self.rows // 2)
         self._rebuild_cache()
 
+    # ── Edicao ────────────────────────────────────────────────────────────────
+    def definir_obstaculo(self, bx, by, ativo=True):
+        """
+        Poe (ativo=True) ou tira um obstaculo no bloco (bx, by), actualizando
+        os caches no sitio em vez de os reconstruir. Devolve True se mudou.
+        """
+        pos = (bx, by)
+        if not (0 <= bx < self.cols and 0 <= by < self.rows):
+            return False
+        if (pos in self._obst_set) == ativo:
+            return False
+        px = (bx * self.block, by * self.block)
+        if ativo:
+            self.obstaculos.append(pos)
+            self._obst_set.add(pos)
+            if self._obst_pixels_cache is not None:
+                self._obst_pixels_cache.add(px)
+            if self._livres_cache is not None:
+                self._livres_cache.ocupar(px)
+        else:
+            self.obstaculos.remove(pos)
+            self._obst_set.discard(pos)
+            if self._obst_pixels_cache is not None:
+                self._obst_pixels_cache.discard(px)
+            if self._livres_cache is not None:
+                self._livres_cache.libertar(px)
+        self._has_full_borders = None
+        if self._vizinhos is not None:
+            # So as mascaras da vizinhanca 3x3 dependem deste bloco
+            for vx in (bx - 1, bx, bx + 1):
+                for vy in (by - 1, by, by + 1):
+                    if (vx, vy) in self._obst_set:
+                        self._vizinhos[(vx, vy)] = mapa_compilado.mascara(self._obst_set, vx, vy)
+                    else:
+                        self._vizinhos.pop((vx, vy), None)
+        self.versao += 1
+        self._alteracoes.append(pos)
+        if len(self._alteracoes) > _MAX_ALTERACOES:
+            # Registo demasiado longo: quem estiver atrasado redesenha tudo
+            self._versao_base = self.versao
+            self._alteracoes  = []
+        return True
+
+    def alteracoes_desde(self, versao):
+        """
+        Blocos editados depois de `versao` (pela ordem das edicoes), ou None
+        se entretanto o mapa foi recarregado e e preciso redesenhar tudo.
+        """
+        if versao < self._versao_base:
+            return None
+        return self._alteracoes[len(self._alteracoes) - (self.versao - versao):]
+
+    # ── Serializacao (replays) ────────────────────────────────────────────────
+    def para_dados(self):
+        """
+        Dict JSON com grelha, obstaculos e spawns. A ordem dos obstaculos e
+        mantida: o indice de celulas livres (e portanto cada spawn) depende dela.
+        """
+        def bloco(b):
+            return list(b) if b else None
+        return {
+            "origem":       str(self.source),
+            "cols":         self.cols,
+            "rows":         self.rows,
+            "obstaculos":   [list(p) for p in self.obstaculos],
+            "spawn_snake":  bloco(self.spawn_snake_block),
+            "spawn_snake2": bloco(self.spawn_snake2_block),
+            "spawn_food":   bloco(self.spawn_food_block),
+        }
+
+    @classmethod
+    def de_dados(cls, dados, block_size=None):
+        """Reconstroi exactamente o mapa guardado por para_dados()."""
+        def bloco(b):
+            return tuple(b) if b else None
+        mapa = cls(1, block_size=block_size, auto_scale=False)
+        mapa.source     = dados.get("origem", mapa.source)
+        mapa.cols       = dados["cols"]
+        mapa.rows       = dados["rows"]
+        mapa.obstaculos = [tuple(p) for p in dados["obstaculos"]]
+        mapa.spawn_snake_block  = bloco(dados.get("spawn_snake"))
+        mapa.spawn_snake2_block = bloco(dados.get("spawn_snake2"))
+        mapa.spawn_food_block   = bloco(dados.get("spawn_food"))
+        mapa._rebuild_cache()
+        return mapa
+
     # ── Utilitarios ───────────────────────────────────────────────────────────
+    @property
+    def area_pixels(self):
+        """(0, 0, largura, altura) do tabuleiro inteiro em pixeis."""
+        return (0, 0, self.cols * self.block, self.rows * self.block)
+
     def obstaculos_pixels(self):
         """Set (x_px, y_px) dos obstaculos — com cache."""
         if self._obst_pixels_cache is None:
@@ -163,21 +268,34 @@ class Mapas:
             }
         return self._obst_pixels_cache
 
+    def mascaras_vizinhos(self):
+        """Dict bloco → mascara VIZ_* dos 8 vizinhos de cada obstaculo — com cache."""
+        if self._vizinhos is None:
+            s = self._obst_set
+            self._vizinhos = {(bx, by): mapa_compilado.mascara(s, bx, by)
+                              for bx, by in self.obstaculos}
+        return self._vizinhos
+
     def obter_spawn_player(self, player_num):
         def bpx(b):
             return (b[0] * self.block, b[1] * self.block) if b else (self.block, self.block)
         return bpx(self.spawn_snake_block if player_num == 1 else self.spawn_snake2_block)
 
+    def celulas_livres(self):
+        """IndiceCelulasLivres da grelha com os obstaculos ja retirados — com cache."""
+        if self._livres_cache is None or self._livres_cache.block != self.block:
+            idx = IndiceCelulasLivres(
+                (0, 0, self.cols * self.block, self.rows * self.block), self.block)
+            idx.ocupar_varios(self.obstaculos_pixels())
+            self._livres_cache = idx
+        return self._livres_cache
+
     def spawn_seguro(self, ocupados_pixels, tries=2000):
-        obst_px = self.obstaculos_pixels()
-        livres = [
-            (gx * self.block, gy * self.block)
-            for gy in range(self.rows)
-            for gx in range(self.cols)
-            if (gx * self.block, gy * self.block) not in ocupados_pixels
-            and (gx * self.block, gy * self.block) not in obst_px
-        ]
-        return random.choice(livres) if livres else (self.block, self.block)
+        """Bloco livre uniforme fora de `ocupados_pixels` (sem enumerar a grelha)."""
+        pos = self.celulas_livres().sortear(random, excluir=ocupados_pixels)
+        if pos is None or pos in ocupados_pixels:
+            return (self.block, self.block)
+        return pos
 
     # ── Colisoes ──────────────────────────────────────────────────────────────
     def verificar_colisao(self, pos_px):
@@ -2,57 +2,151 @@
 """
 Renderizador de mapas — estilo dark UI clean.
 Paredes com efeito 3D discreto: highlight em cima/esquerda, sombra em baixo/direita.
-Usa cache interno — so reconstroi se o mapa mudar.
+
+A camada das paredes esta dividida em chunks de CHUNK×CHUNK blocos, cada
+um numa Surface com colorkey ja no formato do ecra e com o seu carimbo de
+versao:
+  - o mapa diz que blocos mudaram (Mapas.alteracoes_desde); cada bloco
+    editado suja os chunks da sua vizinhanca 3×3, porque _draw_block le os
+    vizinhos para os chanfros e cantos;
+  - so os chunks sujos sao re-rasterizados, e so quando sao precisos;
+  - com camara so os chunks que intersectam a vista sao blitados, e so os
+    ultimos _MAX_CHUNKS usados ficam em memoria (nunca ha uma Surface do
+    tamanho do tabuleiro);
+  - uma recarga do mapa (ou outro mapa/bloco) descarta tudo.
 """
+from collections import OrderedDict
+
 import pygame
 import game.config as cfg
+from game.entities.sprites import para_ecra, superficie_com_chave
+from game.maps.mapa_compilado import (VIZ_CIMA, VIZ_BAIXO, VIZ_ESQ, VIZ_DIR,
+                                      VIZ_CE, VIZ_CD, VIZ_BE, VIZ_BD)
+
+# Lado de um chunk, em blocos (160 px com blocos de 20)
+CHUNK = 8
+
+# Chunks rasterizados guardados (LRU) — a vista usa no maximo ~35
+_MAX_CHUNKS = 128
+
+# Todas as cores que _draw_block pinta (a colorkey tem de ser outra)
+_CORES_PAREDE = (cfg.WALL_FACE, cfg.WALL_HIGHLIGHT, cfg.WALL_SHADOW, cfg.WALL_CORNER_HI,
+                 cfg.WALL_INNER, cfg.WALL_OUTER_FACE, cfg.WALL_OUTER_HI)
 
 
 class MapRenderer:
     def __init__(self, mapa, block_size=None):
         self.mapa      = mapa
         self.block     = block_size or mapa.block
-        self._surface  = None
-        self._last_key = None
-
-    def _cache_key(self):
-        return (id(self.mapa), len(self.mapa.obstaculos), self.block)
+        # (cx, cy) → [Surface ou None se vazio, versao com que foi rasterizado]
+        self._chunks   = OrderedDict()
+        # (cx, cy) → versao actual; chunks ausentes estao na versao 0
+        self._versoes  = {}
+        self._chave    = None   # (id(mapa), block) da cache actual
+        self._versao_mapa = None
 
-    def _rebuild(self):
-        key = self._cache_key()
-        if key == self._last_key:
+    # ── Sincronizacao com o mapa ──────────────────────────────────────────────
+    def _sincronizar(self):
+        """Traz os carimbos dos chunks para a versao actual do mapa."""
+        mapa  = self.mapa
+        chave = (id(mapa), self.block)
+        if chave == self._chave and self._versao_mapa == mapa.versao:
+            return
+        alteracoes = (mapa.alteracoes_desde(self._versao_mapa)
+                      if chave == self._chave else None)
+        self._chave       = chave
+        self._versao_mapa = mapa.versao
+        if alteracoes is None:
+            self.invalidate()
             return
-        self._last_key = key
-        obst_set = self.mapa._obst_set   # reutiliza o set ja existente no mapa
-        w = self.mapa.cols * self.block
-        h = self.mapa.rows * self.block
-        self._surface = pygame.Surface((w, h), pygame.SRCALPHA)
-        self._surface.fill((0, 0, 0, 0))
-        for (bx, by) in self.mapa.obstaculos:
-            self._draw_block(self._surface, bx, by, obst_set)
-
-    def draw(self, target, offset=(0, 0)):
-        self._rebuild()
-        target.blit(self._surface, offset)
+        sujos = {((bx + dx) // CHUNK, (by + dy) // CHUNK)
+                 for bx, by in alteracoes
+                 for dx in (-1, 0, 1) for dy in (-1, 0, 1)}
+        for c in sujos:
+            self._versoes[c] = self._versoes.get(c, 0) + 1
 
     def invalidate(self):
-        self._last_key = None
+        """Descarta todos os chunks (serao re-rasterizados quando precisos)."""
+        self._chunks.clear()
+        self._versoes.clear()
+
+    # ── Chunks ────────────────────────────────────────────────────────────────
+    def _chunk(self, cx, cy):
+        """Surface do chunk (cx, cy) na versao actual, ou None se nao tem paredes."""
+        c       = (cx, cy)
+        versao  = self._versoes.get(c, 0)
+        entrada = self._chunks.get(c)
+        if entrada is not None and entrada[1] == versao:
+            self._chunks.move_to_end(c)
+            return entrada[0]
+
+        self._chunks[c] = [self._rasterizar(cx, cy), versao]
+        self._chunks.move_to_end(c)
+        while len(self._chunks) > _MAX_CHUNKS:
+            self._chunks.popitem(last=False)
+        return self._chunks[c][0]
+
+    def _rasterizar(self, cx, cy):
+        b   = self.block
+        viz = self.mapa.mascaras_vizinhos()
+        bx0, by0 = cx * CHUNK, cy * CHUNK
+        blocos = [(bx, by)
+                  for bx in range(bx0, min(bx0 + CHUNK, self.mapa.cols))
+                  for by in range(by0, min(by0 + CHUNK, self.mapa.rows))
+                  if (bx, by) in viz]
+        if not blocos:
+            return None
+        lado = CHUNK * b
+        surf = superficie_com_chave(lado, lado, _CORES_PAREDE)
+        for bx, by in blocos:
+            self._draw_block(surf, bx, by, viz[(bx, by)], -bx0 * b, -by0 * b)
+        return para_ecra(surf)
+
+    def _n_chunks(self):
+        return (-(-self.mapa.cols // CHUNK), -(-self.mapa.rows // CHUNK))
+
+    # ── Desenho ───────────────────────────────────────────────────────────────
+    def draw(self, target, offset=(0, 0), camara=None):
+        """
+        Sem camara desenha o mapa inteiro em `offset`; com camara desenha so
+        os chunks na vista, com o canto da vista em `offset`.
+        """
+        self._sincronizar()
+        ncx, ncy = self._n_chunks()
+        ox, oy   = offset
+        if camara is None:
+            cx0, cy0, cx1, cy1 = 0, 0, ncx, ncy
+        else:
+            ox, oy = ox - camara.x, oy - camara.y
+            bx0, by0, bx1, by1 = camara.celulas_visiveis()
+            cx0, cy0 = bx0 // CHUNK, by0 // CHUNK
+            cx1, cy1 = min(ncx, -(-bx1 // CHUNK)), min(ncy, -(-by1 // CHUNK))
+
+        lado  = CHUNK * self.block
+        blits = []
+        for cx in range(cx0, cx1):
+            for cy in range(cy0, cy1):
+                surf = self._chunk(cx, cy)
+                if surf is not None:
+                    blits.append((surf, (ox + cx * lado, oy + cy * lado)))
+        target.blits(blits, doreturn=False)
 
-    def _draw_block(self, surf, bx, by, obst):
+    def _draw_block(self, surf, bx, by, viz, ox=0, oy=0):
         b  = self.block
-        x  = bx * b
-        y  = by * b
+        x  = bx * b + ox
+        y  = by * b + oy
         cols, rows = self.mapa.cols, self.mapa.rows
         is_outer = (bx == 0 or bx == cols - 1 or by == 0 or by == rows - 1)
 
-        top    = (bx,     by - 1) in obst
-        bottom = (bx,     by + 1) in obst
-        left   = (bx - 1, by    ) in obst
-        right  = (bx + 1, by    ) in obst
-        tl     = (bx - 1, by - 1) in obst
-        tr     = (bx + 1, by - 1) in obst
-        bl     = (bx - 1, by + 1) in obst
-        br     = (bx + 1, by + 1) in obst
+        # viz: mascara VIZ_* dos vizinhos que sao parede (Mapas.mascaras_vizinhos)
+        top    = viz & VIZ_CIMA
+        bottom = viz & VIZ_BAIXO
+        left   = viz & VIZ_ESQ
+        right  = viz & VIZ_DIR
+        tl     = viz & VIZ_CE
+        tr     = viz & VIZ_CD
+        bl     = viz & VIZ_BE
+        br     = viz & VIZ_BD
 
         face = cfg.WALL_OUTER_FACE if is_outer else cfg.WALL_FACE
         hi   = cfg.WALL_OUTER_HI   if is_outer else cfg.WALL_HIGHLIGHT
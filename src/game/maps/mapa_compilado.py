@@ -0,0 +1,258 @@
+# src/game/maps/mapa_compilado.py
+"""
+Formato binario compilado dos mapas (.snkm) — sem pygame.
+
+Um .txt e lido, validado e percorrido caracter a caracter em cada carga;
+o .snkm guarda o resultado desse trabalho e le-se com um unico mmap:
+
+    cabecalho   "<4sHHH6HBI"  magic b"SNKM", versao, cols, rows,
+                              spawns S/P/F em blocos (SEM_SPAWN se ausente),
+                              flags (FLAG_BORDAS), n de obstaculos
+    obstaculos  ceil(cols*rows / 8) bytes — bitset por linhas, bit
+                (gy*cols + gx) com o bit 0 de cada byte primeiro
+    vizinhos    n bytes — mascara VIZ_* dos 8 vizinhos de cada obstaculo,
+                pela ordem do bitset
+
+A ordem do bitset (linha a linha, da esquerda para a direita) e a ordem em
+que o .txt lista os obstaculos — o indice de celulas livres, e portanto
+cada spawn, depende dela.
+
+Os .txt continuam a ser a fonte: carregar() compila-os na primeira vez e
+guarda o .snkm em mapas_cache/ na pasta do utilizador, com o nome do hash
+do conteudo (um .txt editado gera outro ficheiro, o antigo deixa de ser
+usado). Um .snkm tambem pode ser carregado directamente.
+"""
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+from typing import Dict, List, Optional, Set, Tuple
+
+from game.core.caminhos import caminho_dados_utilizador
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover — dependência opcional
+    np = None
+
+MAGIC  = b"SNKM"
+VERSAO = 1
+
+EXTENSAO = ".snkm"
+
+_CABECALHO = struct.Struct("<4sHHH6HBI")
+
+SEM_SPAWN   = 0xFFFF
+
+FLAG_BORDAS = 0x01
+
+# Bits da mascara de vizinhos (os que MapRenderer._draw_block consulta)
+VIZ_CIMA, VIZ_BAIXO, VIZ_ESQ, VIZ_DIR = 0x01, 0x02, 0x04, 0x08
+VIZ_CE,   VIZ_CD,    VIZ_BE,  VIZ_BD  = 0x10, 0x20, 0x40, 0x80
+
+_VIZINHOS = ((0, -1, VIZ_CIMA), (0, 1, VIZ_BAIXO), (-1, 0, VIZ_ESQ), (1, 0, VIZ_DIR),
+             (-1, -1, VIZ_CE), (1, -1, VIZ_CD), (-1, 1, VIZ_BE), (1, 1, VIZ_BD))
+
+# Posicoes dos bits a 1 de cada valor de byte (descodificacao do bitset)
+_BITS = tuple(tuple(i for i in range(8) if v >> i & 1) for v in range(256))
+
+Bloco = Tuple[int, int]
+
+
+class MapaInvalido(ValueError):
+    """Ficheiro que nao e um mapa compilado ou de uma versao desconhecida."""
+
+
+class MapaCompilado:
+    """Dimensoes, spawns, obstaculos e mascaras de vizinhos de um mapa."""
+
+    def __init__(self, cols: int, rows: int, obstaculos: List[Bloco],
+                 spawn_snake: Optional[Bloco] = None,
+                 spawn_snake2: Optional[Bloco] = None,
+                 spawn_food: Optional[Bloco] = None,
+                 bordas: Optional[bool] = None,
+                 vizinhos: Optional[bytes] = None) -> None:
+        self.cols         = cols
+        self.rows         = rows
+        self.obstaculos   = obstaculos
+        self.spawn_snake  = spawn_snake
+        self.spawn_snake2 = spawn_snake2
+        self.spawn_food   = spawn_food
+        if bordas is None or vizinhos is None:          # vindo do texto: calcula
+            conjunto = set(obstaculos)
+            if bordas is None:
+                bordas = tem_bordas(conjunto, cols, rows)
+            if vizinhos is None:
+                vizinhos = bytes(mascara(conjunto, bx, by) for bx, by in obstaculos)
+        self.bordas   = bordas
+        self.vizinhos = vizinhos
+
+    def mascaras(self) -> Dict[Bloco, int]:
+        """Bloco do obstaculo → mascara VIZ_* dos seus vizinhos."""
+        return dict(zip(self.obstaculos, self.vizinhos))
+
+    # ── Texto ─────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def de_texto(cls, texto: str, origem: str = "mapa") -> "MapaCompilado":
+        """Interpreta um mapa .txt ('#' obstaculo, S/P/F spawns, ';' comentario)."""
+        linhas = [l for l in texto.splitlines()
+                  if l != "" and not l.lstrip().startswith(";")]
+        if not linhas:
+            raise ValueError("Ficheiro de mapa vazio: " + origem)
+
+        obstaculos: List[Bloco] = []
+        spawns: Dict[str, Bloco] = {}
+        for gy, linha in enumerate(linhas):
+            gx = linha.find("#")
+            while gx != -1:
+                obstaculos.append((gx, gy))
+                gx = linha.find("#", gx + 1)
+            for ch in "SPF":
+                gx = linha.rfind(ch)
+                if gx != -1:
+                    spawns[ch] = (gx, gy)       # a ultima ocorrencia ganha
+        return cls(max(len(l) for l in linhas), len(linhas), obstaculos,
+                   spawns.get("S"), spawns.get("P"), spawns.get("F"))
+
+    # ── Binario ───────────────────────────────────────────────────────────────
+
+    def para_bytes(self) -> bytes:
+        bits = bytearray((self.cols * self.rows + 7) // 8)
+        for bx, by in self.obstaculos:
+            i = by * self.cols + bx
+            bits[i >> 3] |= 1 << (i & 7)
+        spawns = []
+        for s in (self.spawn_snake, self.spawn_snake2, self.spawn_food):
+            spawns.extend(s if s else (SEM_SPAWN, SEM_SPAWN))
+        cabecalho = _CABECALHO.pack(MAGIC, VERSAO, self.cols, self.rows, *spawns,
+                                    FLAG_BORDAS if self.bordas else 0,
+                                    len(self.obstaculos))
+        return b"".join((cabecalho, bits, self.vizinhos))
+
+    @classmethod
+    def de_bytes(cls, dados) -> "MapaCompilado":
+        """Descodifica um .snkm a partir de bytes, memoryview ou mmap."""
+        try:
+            (magic, versao, cols, rows, sx, sy, px, py, fx, fy,
+             flags, n) = _CABECALHO.unpack_from(dados, 0)
+        except struct.error as e:
+            raise MapaInvalido("Mapa compilado truncado") from e
+        if magic != MAGIC:
+            raise MapaInvalido("Nao e um mapa compilado")
+        if versao != VERSAO:
+            raise MapaInvalido(f"Versao de mapa compilado nao suportada: {versao}")
+
+        inicio = _CABECALHO.size
+        n_bits = (cols * rows + 7) // 8
+        if len(dados) != inicio + n_bits + n:
+            raise MapaInvalido("Mapa compilado com tamanho inconsistente")
+
+        obstaculos = _descodificar_bitset(dados[inicio:inicio + n_bits], cols, rows)
+        if len(obstaculos) != n:
+            raise MapaInvalido("Mapa compilado corrompido (obstaculos)")
+
+        def bloco(x, y):
+            return (x, y) if x != SEM_SPAWN else None
+        return cls(cols, rows, obstaculos,
+                   bloco(sx, sy), bloco(px, py), bloco(fx, fy),
+                   bordas=bool(flags & FLAG_BORDAS),
+                   vizinhos=bytes(dados[inicio + n_bits:]))
+
+    @classmethod
+    def ler(cls, caminho: str) -> "MapaCompilado":
+        with open(caminho, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise MapaInvalido("Mapa compilado vazio: " + caminho)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                return cls.de_bytes(m)
+
+    def gravar(self, caminho: str) -> None:
+        """Escreve o .snkm de forma atomica (nunca fica meio ficheiro)."""
+        tmp = f"{caminho}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(self.para_bytes())
+        os.replace(tmp, caminho)
+
+
+def _descodificar_bitset(bits: bytes, cols: int, rows: int) -> List[Bloco]:
+    """Blocos com o bit a 1, por ordem (linha a linha)."""
+    if np is not None:
+        i = np.flatnonzero(np.unpackbits(np.frombuffer(bits, dtype=np.uint8),
+                                         count=cols * rows, bitorder="little"))
+        return list(zip((i % cols).tolist(), (i // cols).tolist()))
+
+    obstaculos: List[Bloco] = []
+    tabela = _BITS
+    base   = 0
+    for byte in bits:
+        if byte:
+            for b in tabela[byte]:
+                gy, gx = divmod(base + b, cols)
+                obstaculos.append((gx, gy))
+        base += 8
+    return obstaculos
+
+
+# ── Vizinhos / bordas ─────────────────────────────────────────────────────────
+
+def mascara(obst: Set[Bloco], bx: int, by: int) -> int:
+    """Mascara VIZ_* dos vizinhos de (bx, by) que sao obstaculos."""
+    m = 0
+    for dx, dy, bit in _VIZINHOS:
+        if (bx + dx, by + dy) in obst:
+            m |= bit
+    return m
+
+
+def tem_bordas(obst: Set[Bloco], cols: int, rows: int) -> bool:
+    """True se as 4 bordas exteriores sao obstaculos em toda a extensao."""
+    return (all((x, 0) in obst and (x, rows - 1) in obst for x in range(cols))
+            and all((0, y) in obst and (cols - 1, y) in obst for y in range(rows)))
+
+
+# ── Cache de .txt compilados ──────────────────────────────────────────────────
+
+def pasta_cache() -> str:
+    pasta = caminho_dados_utilizador("mapas_cache")
+    os.makedirs(pasta, exist_ok=True)
+    return pasta
+
+
+def _hash_conteudo(dados: bytes) -> str:
+    h = hashlib.sha1(MAGIC + struct.pack("<H", VERSAO))
+    h.update(dados)
+    return h.hexdigest()
+
+
+def carregar(caminho: str) -> MapaCompilado:
+    """
+    Mapa compilado de `caminho`: um .snkm e lido directamente; um .txt vem
+    da cache (compilado e guardado na primeira vez, ou se a cache falhar).
+    """
+    if caminho.endswith(EXTENSAO):
+        return MapaCompilado.ler(caminho)
+
+    with open(caminho, "rb") as f:
+        dados = f.read()
+    try:
+        cache = os.path.join(pasta_cache(), _hash_conteudo(dados) + EXTENSAO)
+    except OSError:
+        cache = None                                  # sem pasta de utilizador
+
+    if cache and os.path.exists(cache):
+        try:
+            return MapaCompilado.ler(cache)
+        except (OSError, ValueError):
+            pass                                      # corrompido: recompila
+
+    mapa = MapaCompilado.de_texto(dados.decode("utf-8"), origem=caminho)
+    if cache:
+        try:
+            mapa.gravar(cache)
+        except OSError:
+            pass                                      # so fica sem cache
+    return mapa
+
@@ -3,119 +3,168 @@
 Classe base para todos os modos de jogo.
 
 Centraliza:
-  - Countdown com renderização
-  - Spawn seguro com zona de exclusão por distância Manhattan
+  - Countdown com renderização (contado em ticks lógicos, sem relógio de parede)
+  - Tradução dos eventos da simulação em partículas, HUD e screen shake
+  - Input: handle_event() traduz teclas e comandos (via engine.entrada)
+    pelas tabelas _TECLAS/_COMANDOS do modo e enfileira a direcção
   - Hook visual_update(dt) para animações a 60 fps
   - Morte com flash antes do game_over
   - hud_info() → dict com dados para o HUD lateral
+  - rects_sujos() → zonas que mudaram desde o último frame (render parcial)
+  - alvo_camara() → ponto do tabuleiro que a câmara do engine segue
+  - Reprodução de replays: com engine.reprodutor, as entradas de cada tick
+    vêm do replay em vez do teclado
+
+As regras do jogo vivem em game.sim.simulacao; cada modo guarda a sua
+simulação em self.sim e chama self.sim.step() a cada tick lógico.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional
 
 import pygame
 
+from game.sim.simulacao import EV_BOOST, EV_COMER, EV_MORTE
+from game.config        import FOOD_COLOR
+from game.ui            import fontes
+
 _DEATH_DELAY_TICKS: int = 4
-_SPAWN_MIN_DIST:    int = 4
+
+# Cor das partículas ao apanhar cada tipo de boost
+_COR_BOOST: dict = {
+    "velocidade": (255, 200, 40),
+    "imunidade":  (60, 180, 255),
+}
 
 
 class BaseModo:
     """
     Superclasse de OgSnake, Modo1v1 e PlayerVsAI.
 
-    Subclasses devem sobrepor:
-        _segmentos_ocupados() → set
-        _snake_heads()        → list
+    Subclasses devem criar self.sim, definir _TECLAS (e _COMANDOS, se
+    aceitam comandos) e sobrepor:
         hud_info()            → dict
         visual_update(dt)
-        handle_event(event)
+        _jogador_pronto(quem)
         update()
         draw(surface)
     """
 
+    # Jogador → {tecla: direcção}
+    _TECLAS: Dict[str, dict] = {}
+    # Jogador de cada comando (joystick), pela ordem em que foram ligados
+    _COMANDOS: tuple = ()
+
+    # Cobras cujos eventos geram partículas/HUD (o bot não tem efeitos de comer)
+    _COM_EFEITOS: tuple = ("p1", "p2")
+    # (intensidade, duração) do screen shake ao morrer
+    _TREMIDA_MORTE: tuple = (8.0, 0.35)
+
     def __init__(self, engine) -> None:
         self.engine    = engine
+        self.sim       = None
         self.started   = False
         self.terminado = False
 
         self.countdown_active: bool = False
         self.countdown_val:    int  = 3
-        self.last_tick:        int  = 0
+        self._countdown_ticks: int  = 0
 
         self._dying:       bool = False
         self._death_timer: int  = 0
+        self._mortos:      list = []
+
+        # id(entidade) → último estado desenhado, para rects_sujos()
+        self._desenhado: Dict[int, tuple] = {}
+        self._overlay_desenhado: bool = True
+        self._camara_desenhada:  int  = -1
 
     # ── Countdown ─────────────────────────────────────────────────────────────
 
+    def _ticks_por_segundo(self) -> int:
+        return max(1, round(self.engine.base_fps * self.engine.velocidade_mult))
+
     def _iniciar_countdown(self) -> None:
         self.countdown_active = True
-        self.last_tick = pygame.time.get_ticks()
+        self._countdown_ticks = 0
 
     def _tick_countdown(self) -> None:
+        """Chamado uma vez por tick lógico; cada número dura um segundo de ticks."""
         if not self.countdown_active:
             return
-        agora = pygame.time.get_ticks()
-        if agora - self.last_tick >= 1000:
+        self._countdown_ticks += 1
+        if self._countdown_ticks >= self._ticks_por_segundo():
             self.countdown_val -= 1
-            self.last_tick = agora
+            self._countdown_ticks = 0
             if self.countdown_val <= 0:
                 self.countdown_active = False
                 self.started          = True
 
     def _draw_countdown(self, surface: pygame.Surface) -> None:
-        f   = pygame.font.SysFont(None, 80)
+        f   = fontes.fonte(80, face=None)
         cx  = surface.get_width()  // 2
         cy  = surface.get_height() // 2
-        num = f.render(str(self.countdown_val), True, (255, 200, 0))
+        num = fontes.texto(f, str(self.countdown_val), (255, 200, 0))
         surface.blit(num, num.get_rect(center=(cx, cy)))
 
     # ── Morte com flash ────────────────────────────────────────────────────────
 
-    def _iniciar_morte(self, cobra) -> None:
-        if self._dying:
-            return
-        self._dying       = True
-        self._death_timer = 0
-        cobra.start_death_flash()
-
-    def _tick_morte(self, cobra, callback) -> None:
+    def _tick_morte(self, callback) -> None:
+        """Avança o flash das cobras mortas; chama `callback` quando termina."""
         if not self._dying:
             return
-        done = cobra.tick_death_flash()
+        self._novo_tick()
+        flashes = [self.sim.cobras[q].tick_death_flash() for q in self._mortos]
         self._death_timer += 1
-        if done or self._death_timer >= _DEATH_DELAY_TICKS:
+        if all(flashes) or self._death_timer >= _DEATH_DELAY_TICKS:
             self._dying    = False
             self.terminado = True
             callback()
 
-    # ── Spawn seguro ──────────────────────────────────────────────────────────
-
-    def _segmentos_ocupados(self) -> set:
-        raise NotImplementedError
-
-    def _snake_heads(self) -> List[Tuple[int, int]]:
-        return []
-
-    def _zona_exclusao(self) -> set:
-        """Blocos a menos de _SPAWN_MIN_DIST Manhattan de qualquer cabeça."""
-        b    = self.engine.block
-        dist = _SPAWN_MIN_DIST
-        zona: set = set()
-        for hx, hy in self._snake_heads():
-            for dx in range(-dist, dist + 1):
-                for dy in range(-dist, dist + 1):
-                    if abs(dx) + abs(dy) <= dist:
-                        zona.add((hx + dx * b, hy + dy * b))
-        return zona
-
-    def food_spawn_safe(self, food_obj, foods_list) -> None:
-        """Spawn que evita cobras, zona de exclusão, outros itens e obstáculos."""
-        occupied  = self._segmentos_ocupados()
-        occupied |= self._zona_exclusao()
-        for f in foods_list:
-            if f is not food_obj and f.pos:
-                occupied.add(f.pos)
-        food_obj.spawn(occupied, set(self.engine.mapa.obstaculos_pixels()))
+    # ── Eventos da simulação ──────────────────────────────────────────────────
+
+    def _step(self, entradas=None) -> list:
+        """Avança a simulação um tick e aplica os efeitos visuais dos eventos."""
+        rep = self.engine.reprodutor
+        if rep is not None:
+            if rep.fim:                 # replay gravado até aqui (ex.: ESC a meio)
+                self.engine.running = False
+                return []
+            rep.enfileirar_proximo()
+        self._novo_tick()
+        eventos = self.sim.step(entradas)
+        if rep is not None:
+            rep.verificar()
+        for ev in eventos:
+            self._on_evento(ev)
+        if self.sim.terminado and not self._dying:
+            self._dying       = True
+            self._death_timer = 0
+            self.engine.trigger_shake(*self._TREMIDA_MORTE)
+        return eventos
+
+    def _novo_tick(self) -> None:
+        """As cobras que não mexerem neste tick deixam de deslizar."""
+        for cobra in self.sim.cobras.values():
+            cobra.novo_tick()
+
+    def _on_evento(self, ev) -> None:
+        block = self.engine.block
+        if ev.tipo == EV_COMER and ev.quem in self._COM_EFEITOS:
+            self.engine.particulas.emit_food_burst(ev.pos, FOOD_COLOR, block)
+            self.engine.tocar_sfx("SomDeComer")
+            if ev.quem == "p1":
+                self.engine.hud.set_score(self.engine.score.obter_pontuacao())
+        elif ev.tipo == EV_BOOST and ev.quem in self._COM_EFEITOS:
+            self.engine.particulas.emit_boost_pickup(
+                ev.pos, _COR_BOOST[ev.extra], block)
+            self.engine.tocar_sfx("SpeedBoost")
+        elif ev.tipo == EV_MORTE:
+            self.engine.tocar_sfx("SomDeColisao")
+            cobra = self.sim.cobras[ev.quem]
+            self.engine.particulas.emit_death(cobra.segments, cobra.body_color, block)
+            cobra.start_death_flash()
+            self._mortos.append(ev.quem)
 
     # ── HUD info ──────────────────────────────────────────────────────────────
 
@@ -138,12 +187,96 @@ class BaseModo:
                                      * self.engine.velocidade_mult)),
         }
 
+    # ── Câmara ────────────────────────────────────────────────────────────────
+
+    def alvo_camara(self) -> tuple:
+        """Posição (píxeis do tabuleiro) que a câmara segue — a cabeça do P1."""
+        return self.sim.cobras["p1"].segments[0]
+
+    # ── Dirty rects ───────────────────────────────────────────────────────────
+
+    def _overlay_ativo(self) -> bool:
+        """True enquanto houver texto por cima do tabuleiro (espera/countdown)."""
+        return not self.started
+
+    def rects_sujos(self) -> Optional[List[pygame.Rect]]:
+        """
+        Rectângulos (coordenadas lógicas) cujo conteúdo mudou desde a última
+        chamada: blocos antigos e novos das cobras que mexeram (e, com
+        interpolação, os do caminho da cabeça e da cauda), itens que
+        mudaram de sítio e a comida (animada a cada frame). Só entra o que
+        está na vista da câmara, já em coordenadas de ecrã.
+
+        Devolve None enquanto há overlay no ecrã, no frame em que desaparece
+        e quando a câmara mexeu — o engine redesenha tudo.
+        Deve ser chamado uma vez por frame para o estado anterior ficar certo.
+        """
+        b      = self.engine.block
+        cam    = self.engine.camara
+        celulas: set = set()
+        rects:  List[pygame.Rect] = []
+
+        for cobra in self.sim.cobras.values():
+            versao = getattr(cobra, "versao_desenho", None)
+            ant    = self._desenhado.get(id(cobra))
+            if ant is not None and ant[0] == versao:
+                continue
+            agora = cobra.celulas_desenho()
+            if ant is not None:
+                celulas |= ant[1]
+            celulas |= agora
+            self._desenhado[id(cobra)] = (versao, agora)
+
+        # Entre ticks, cabeça e cauda interpoladas mexem em todos os frames
+        if self.engine.alfa is not None:
+            for cobra in self.sim.cobras.values():
+                celulas |= cobra.celulas_interpoladas()
+
+        for item in self.sim.itens():
+            ant = self._desenhado.get(id(item))
+            self._desenhado[id(item)] = (item.pos,)
+            animado = hasattr(item, "update")
+            if ant is not None and ant[0] == item.pos and not animado:
+                continue
+            for pos in {item.pos, ant[0] if ant else None} - {None}:
+                # Pulso e sparkles da comida saem ligeiramente do bloco
+                if cam.visivel(pos[0] - 2, pos[1] - 2, b + 4, b + 4):
+                    rects.append(pygame.Rect(pos[0] - 2 - cam.x, pos[1] - 2 - cam.y,
+                                             b + 4, b + 4))
+
+        rects.extend(pygame.Rect(x - cam.x, y - cam.y, b, b) for x, y in celulas
+                     if cam.visivel(x, y, b, b))
+
+        overlay, self._overlay_desenhado = (self._overlay_desenhado,
+                                            self._overlay_ativo())
+        moveu, self._camara_desenhada = (self._camara_desenhada != cam.versao,
+                                         cam.versao)
+        return None if overlay or self._overlay_desenhado or moveu else rects
+
     # ── Hooks de subclasse ────────────────────────────────────────────────────
 
     def visual_update(self, dt: float) -> None:
         pass
 
+    def iniciar_reproducao(self) -> None:
+        """Replay no ecrã: arranca como se os jogadores já tivessem escolhido direcção."""
+        pass
+
     def handle_event(self, event: pygame.event.Event) -> None:
+        """Tecla ou comando → direcção no buffer da cobra do jogador."""
+        entrada = self.engine.entrada
+        acao    = entrada.traduzir(event, self._TECLAS, self._COMANDOS)
+        if acao is None:
+            return
+        quem, direcao = acao
+        entrada.enfileirar(self.sim, quem, direcao)
+        self._jogador_pronto(quem)
+
+    def usa_comandos(self) -> bool:
+        return bool(self._COMANDOS)
+
+    def _jogador_pronto(self, quem: str) -> None:
+        """`quem` escolheu uma direcção (arranque do modo / countdown)."""
         pass
 
     def update(self) -> None:
@@ -1,6 +1,7 @@
 # src/game/modes/modo_1v1.py
 """
 Modo multijogador local (2 humanos) com partículas, flash de morte e screen shake.
+Cada jogador usa o teclado (WASD / setas) ou um comando (d-pad ou stick).
 """
 from __future__ import annotations
 
@@ -8,8 +9,9 @@ import pygame
 
 from game.entities.snake  import Snake
 from game.entities.food   import Food
-from game.modes.base_mode import BaseModo, _DEATH_DELAY_TICKS
-from game.config          import FOOD_COLOR
+from game.modes.base_mode import BaseModo
+from game.sim.simulacao   import Simulacao1v1
+from game.ui              import fontes
 import game.config as cfg
 
 _KEYS_P1: dict = {
@@ -25,44 +27,31 @@ _KEYS_P2: dict = {
 class Modo1v1(BaseModo):
     """Modo multijogador local (2 humanos)."""
 
+    _TECLAS   = {"p1": _KEYS_P1, "p2": _KEYS_P2}
+    # Máquinas com sticks arcade: 1.º comando ligado → P1, 2.º → P2
+    _COMANDOS = ("p1", "p2")
+
     def __init__(self, engine) -> None:
         super().__init__(engine)
         self.p1_ready = False
         self.p2_ready = False
-        self._p1_dead_pending = False
-        self._p2_dead_pending = False
-        self._death_result    = ""
-
-        ocupado = set()
 
-        self.snake = Snake(
-            start_pos=self.engine.mapa.obter_spawn_player(1),
-            block_size=self.engine.block,
-        )
-        ocupado.update(self.snake.segments)
-
-        self.snake2 = Snake(
-            start_pos=self.engine.mapa.obter_spawn_player(2),
-            block_size=self.engine.block,
-            color=cfg.SNAKE2_BODY,
-            head_color=cfg.SNAKE2_HEAD,
-            border_color=cfg.SNAKE2_BORDER,
+        self.sim = Simulacao1v1(
+            self.engine.mapa,
+            nome_p1=self.engine.player_name,
+            area_rect=self.engine.mapa.area_pixels,
+            block=self.engine.block,
+            score=self.engine.score,
+            rng=self.engine.rng,
+            fabrica_cobra=Snake,
+            fabrica_comida=Food,
         )
-        ocupado.update(self.snake2.segments)
-
-        obst = set(self.engine.mapa.obstaculos_pixels())
-        self.foods = []
-        for _ in range(2):
-            f = Food(self.engine.play_rect, self.engine.block)
-            outras = {fd.pos for fd in self.foods if fd.pos}
-            f.spawn(ocupado | outras, obst)
-            self.foods.append(f)
-
-    def _segmentos_ocupados(self) -> set:
-        return set(self.snake.segments) | set(self.snake2.segments)
-
-    def _snake_heads(self) -> list:
-        return [self.snake.head_pos(), self.snake2.head_pos()]
+        self.snake  = self.sim.snake
+        self.snake2 = self.sim.snake2
+        self.snake2.body_color   = cfg.SNAKE2_BODY
+        self.snake2.head_color   = cfg.SNAKE2_HEAD
+        self.snake2.border_color = cfg.SNAKE2_BORDER
+        self.foods = self.sim.foods
 
     def hud_info(self) -> dict:
         return {
@@ -75,25 +64,26 @@ class Modo1v1(BaseModo):
             "p2_ready":  self.p2_ready,
         }
 
-    def handle_event(self, event: pygame.event.Event) -> None:
-        if event.type != pygame.KEYDOWN:
-            return
-        if event.key in _KEYS_P1:
-            self.snake.set_direction(*_KEYS_P1[event.key])
+    def _jogador_pronto(self, quem: str) -> None:
+        if quem == "p1":
             self.p1_ready = True
-        if event.key in _KEYS_P2:
-            self.snake2.set_direction(*_KEYS_P2[event.key])
+        else:
             self.p2_ready = True
 
+    def iniciar_reproducao(self) -> None:
+        self.p1_ready = self.p2_ready = True
+
+    def alvo_camara(self) -> tuple:
+        """Ponto médio entre as duas cabeças — em ecrã partilhado vêem-se ambas."""
+        (x1, y1), (x2, y2) = self.snake.segments[0], self.snake2.segments[0]
+        b = self.engine.block
+        return (((x1 + x2) // 2) // b * b, ((y1 + y2) // 2) // b * b)
+
     def update(self) -> None:
         if self._dying:
-            done1 = self.snake.tick_death_flash()  if self._p1_dead_pending else True
-            done2 = self.snake2.tick_death_flash() if self._p2_dead_pending else True
-            self._death_timer += 1
-            if (done1 and done2) or self._death_timer >= _DEATH_DELAY_TICKS:
-                self._dying    = False
-                self.terminado = True
-                self.engine.game_over_1v1(self._death_result)
+            self._tick_morte(lambda: self.engine.game_over_1v1(self.sim.resultado))
+            return
+        if self.terminado:
             return
 
         if self.p1_ready and self.p2_ready and not self.countdown_active and not self.started:
@@ -102,92 +92,36 @@ class Modo1v1(BaseModo):
         if not self.started:
             return
 
-        self.snake.update()
-        self.snake2.update()
-        h1, h2 = self.snake.head_pos(), self.snake2.head_pos()
-
-        r1, r2  = (self.engine.mapa.verificar_colisao(h1),
-                   self.engine.mapa.verificar_colisao(h2))
-        p1_dead = r1 is True
-        p2_dead = r2 is True
-        if isinstance(r1, tuple): self.snake.set_head_pos(r1)
-        if isinstance(r2, tuple): self.snake2.set_head_pos(r2)
-
-        if h1 == h2:
-            self._trigger_death(True, True, "Empate (Choque Frontal)"); return
-        if h1 in self.snake2.segments:  p1_dead = True
-        if h2 in self.snake.segments:   p2_dead = True
-        if self.snake.collides_self():  p1_dead = True
-        if self.snake2.collides_self(): p2_dead = True
-
-        if p1_dead or p2_dead:
-            resultado = ("Empate" if p1_dead and p2_dead
-                         else "Vitoria P2" if p1_dead
-                         else f"Vitoria {self.engine.player_name}")
-            self._trigger_death(p1_dead, p2_dead, resultado)
-            return
-
-        for comida in self.foods:
-            if h1 == comida.pos:
-                self.snake.grow()
-                self.engine.particles.emit_food_burst(
-                    comida.pos, FOOD_COLOR, self.engine.block
-                )
-                self.food_spawn_safe(comida, self.foods)
-            if h2 == comida.pos:
-                self.snake2.grow()
-                self.engine.particles.emit_food_burst(
-                    comida.pos, FOOD_COLOR, self.engine.block
-                )
-                self.food_spawn_safe(comida, self.foods)
-
-    def _trigger_death(self, p1: bool, p2: bool, resultado: str) -> None:
-        self._dying           = True
-        self._death_timer     = 0
-        self._death_result    = resultado
-        self._p1_dead_pending = p1
-        self._p2_dead_pending = p2
-        self.engine.trigger_shake(intensity=8.0, duration=0.35)
-        if p1:
-            self.engine.particles.emit_death(
-                self.snake.segments, self.snake.body_color, self.engine.block
-            )
-            self.snake.start_death_flash()
-        if p2:
-            self.engine.particles.emit_death(
-                self.snake2.segments, self.snake2.body_color, self.engine.block
-            )
-            self.snake2.start_death_flash()
+        self._step()
 
     def visual_update(self, dt: float) -> None:
         for f in self.foods:
             f.update(dt)
 
     def draw(self, surface: pygame.Surface) -> None:
-        self.snake.draw(surface)
-        self.snake2.draw(surface)
+        cam = self.engine.camara
+        self.snake.draw(surface, cam, self.engine.alfa)
+        self.snake2.draw(surface, cam, self.engine.alfa)
         for f in self.foods:
             try:
-                f.draw(surface)
+                f.draw(surface, cam)
             except Exception:
                 pass
 
-        f_p = pygame.font.SysFont(None, 30)
+        f_p = fontes.fonte(30, face=None)
         lw  = surface.get_width()
         cx  = lw // 2
         cy  = surface.get_height() // 2
 
         if not self.p1_ready or not self.p2_ready:
-            msg = f_p.render("Escolham a vossa direção!", True, (255, 255, 255))
+            msg = fontes.texto(f_p, "Escolham a vossa direção!", (255, 255, 255))
             surface.blit(msg, (cx - msg.get_width() // 2, cy - 80))
-            s1 = f_p.render(
-                "PRONTO!" if self.p1_ready else "P1 (WASD): Espera...",
-                True, (0, 255, 0),
-            )
+            p1t = "PRONTO!" if self.p1_ready else "P1 (WASD): Espera..."
+            s1 = fontes.texto(f_p, p1t, (0, 255, 0))
             surface.blit(s1, (lw // 4 - s1.get_width() // 2, cy + 20))
             p2t = ("PRONTO!" if self.p2_ready
                    else f"{self.engine.player2_name} (Setas): Espera...")
-            s2 = f_p.render(p2t, True, (0, 150, 255))
+            s2 = fontes.texto(f_p, p2t, (0, 150, 255))
             surface.blit(s2, (3 * lw // 4 - s2.get_width() // 2, cy + 20))
         elif self.countdown_active:
-            self._draw_countdown(surface)
\ No newline at end of file
+            self._draw_countdown(surface)
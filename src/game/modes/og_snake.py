@@ -7,7 +7,7 @@ import pygame
 from game.entities.snake  import Snake
 from game.entities.food   import Food
 from game.modes.base_mode import BaseModo
-from game.config          import FOOD_COLOR
+from game.sim.simulacao   import SimulacaoOg
 
 _KEYS: dict = {
     pygame.K_w:     (0, -1), pygame.K_UP:    (0, -1),
@@ -19,25 +19,25 @@ _KEYS: dict = {
 
 class OgSnake(BaseModo):
 
+    _TREMIDA_MORTE = (7.0, 0.32)
+    _TECLAS        = {"p1": _KEYS}
+
     def __init__(self, engine) -> None:
         super().__init__(engine)
-        self.snake = Snake(
-            start_pos=engine.mapa.obter_spawn_player(1),
-            block_size=engine.block,
+        self.sim = SimulacaoOg(
+            engine.mapa,
+            area_rect=engine.mapa.area_pixels,
+            block=engine.block,
+            score=engine.score,
+            rng=engine.rng,
+            fabrica_cobra=Snake,
+            fabrica_comida=Food,
         )
-        obst = set(engine.mapa.obstaculos_pixels())
-        f    = Food(engine.play_rect, engine.block)
-        f.spawn(set(self.snake.segments), obst)
-        self.foods = [f]
+        self.snake = self.sim.snake
+        self.foods = self.sim.foods
 
     # ── BaseModo ──────────────────────────────────────────────────────────────
 
-    def _segmentos_ocupados(self) -> set:
-        return set(self.snake.segments)
-
-    def _snake_heads(self) -> list:
-        return [self.snake.head_pos()]
-
     def hud_info(self) -> dict:
         return {
             "score":      self.engine.score.obter_pontuacao(),
@@ -49,51 +49,21 @@ class OgSnake(BaseModo):
 
     # ── Input ─────────────────────────────────────────────────────────────────
 
-    def handle_event(self, event: pygame.event.Event) -> None:
-        if event.type == pygame.KEYDOWN and event.key in _KEYS:
-            self.snake.set_direction(*_KEYS[event.key])
-            self.started = True
+    def _jogador_pronto(self, quem: str) -> None:
+        self.started = True
+
+    def iniciar_reproducao(self) -> None:
+        self.started = True
 
     # ── Lógica ────────────────────────────────────────────────────────────────
 
     def update(self) -> None:
         if self._dying:
-            self._tick_morte(self.snake, self.engine.game_over)
+            self._tick_morte(self.engine.game_over)
             return
-        if not self.started:
+        if not self.started or self.terminado:
             return
-
-        self.snake.update()
-        head = self.snake.head_pos()
-
-        res = self.engine.mapa.verificar_colisao(head)
-        if res is True:
-            self._on_death(); return
-        if isinstance(res, tuple):
-            self.snake.set_head_pos(res)
-
-        if self.snake.collides_self():
-            self._on_death(); return
-
-        for comida in self.foods:
-            if head == comida.pos:
-                self.snake.grow()
-                pts = self.engine.score.obter_pontuacao() + 10
-                self.engine.score.adicionar_pontos(10)
-                self.engine.hud.set_score(
-                    self.engine.score.obter_pontuacao()
-                )
-                self.engine.particulas.emit_food_burst(
-                    comida.pos, FOOD_COLOR, self.engine.block
-                )
-                self.food_spawn_safe(comida, self.foods)
-
-    def _on_death(self) -> None:
-        self.engine.particulas.emit_death(
-            self.snake.segments, self.snake.body_color, self.engine.block
-        )
-        self.engine.trigger_shake(intensity=7.0, duration=0.32)
-        self._iniciar_morte(self.snake)
+        self._step()
 
     def visual_update(self, dt: float) -> None:
         for f in self.foods:
@@ -102,9 +72,10 @@ class OgSnake(BaseModo):
     # ── Desenho ───────────────────────────────────────────────────────────────
 
     def draw(self, surface: pygame.Surface) -> None:
-        self.snake.draw(surface)
+        cam = self.engine.camara
+        self.snake.draw(surface, cam, self.engine.alfa)
         for f in self.foods:
             try:
-                f.draw(surface)
+                f.draw(surface, cam)
             except Exception:
-                pass
\ No newline at end of file
+                pass
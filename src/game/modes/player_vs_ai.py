@@ -1,42 +1,24 @@
 # src/game/modes/player_vs_ai.py
 """
 Jogador humano contra Bot com IA (A* + Flood Fill + táticas).
+
+A IA do bot e as regras de boosts vivem em game.sim (BotIA, SimulacaoVsAI);
+este módulo trata apenas de input, efeitos visuais e desenho.
 """
 from __future__ import annotations
 
-import heapq
-from collections import deque
-from typing import List, Tuple
-
 import pygame
 
 from game.entities.snake  import Snake
 from game.entities.food   import Food
 from game.entities.boost  import Boost
-from game.modes.base_mode import BaseModo, _DEATH_DELAY_TICKS
-from game.core.score      import Score
-from game.config          import FOOD_COLOR
-
-TODAS_DIRECOES = [(1, 0), (-1, 0), (0, 1), (0, -1)]
-
-CUSTO_NORMAL       = 1.0
-CUSTO_BOOST_VEL    = 0.5
-CUSTO_BOOST_IMUNE  = 0.3
-CUSTO_PAREDE_IMUNE = 0.8
-
-LIMIAR_ATAQUE  = 1.20
-LIMIAR_FUGA    = 0.75
-DIST_CONFRONTO = 6
-DIST_CORTE     = 10
+from game.modes.base_mode import BaseModo
+from game.sim.itens       import DURACOES_BOOST
+from game.sim.simulacao   import SimulacaoVsAI
+from game.ui              import fontes
 
-DESVIO_MAX_BOOST_VEL   = 4
-DESVIO_MAX_BOOST_IMUNE = 6
-
-DURACAO_BOOST_VEL   = 90
-DURACAO_BOOST_IMUNE = 60
-
-_COR_BOOST_VEL   = (255, 200, 40)
-_COR_BOOST_IMUNE = (60, 180, 255)
+DURACAO_BOOST_VEL   = DURACOES_BOOST["velocidade"]
+DURACAO_BOOST_IMUNE = DURACOES_BOOST["imunidade"]
 
 
 class PlayerVsAI(BaseModo):
@@ -44,56 +26,46 @@ class PlayerVsAI(BaseModo):
     def __init__(self, engine) -> None:
         super().__init__(engine)
 
-        self._mapa = engine.mapa
-        self._obst = self._mapa._obst_set
+        self.sim = SimulacaoVsAI(
+            engine.mapa,
+            area_rect=engine.mapa.area_pixels,
+            block=engine.block,
+            score=engine.score,
+            rng=engine.rng,
+            fabrica_cobra=Snake,
+            fabrica_comida=Food,
+            fabrica_boost=Boost,
+        )
 
         # snake = cobra do jogador (consistente com OgSnake e Modo1v1)
-        self.snake = Snake(self._mapa.obter_spawn_player(1), engine.block)
-        self.bot   = Snake(self._mapa.obter_spawn_player(2), engine.block)
+        self.snake = self.sim.snake
+        self.bot   = self.sim.bot
         self.bot.body_color   = (200, 60,  60)
         self.bot.head_color   = (230, 100, 100)
         self.bot.border_color = (120, 20,  20)
 
-        self.boost_vel   = Boost("velocidade", engine.play_rect, engine.block)
-        self.boost_imune = Boost("imunidade",  engine.play_rect, engine.block)
-
-        self.comidas = [Food(engine.play_rect, engine.block)]
-        self.food_spawn_safe(self.comidas[0], self.comidas)
-        self._spawn_item(self.boost_vel)
-        self._spawn_item(self.boost_imune)
-
-        # Pontuação do bot reutiliza o mesmo multiplicador de dificuldade do jogador
-        self._score_bot = Score(multiplicador=engine.score.multiplicador)
-
-        self.boosts_bot     = {"velocidade": 0, "imunidade": 0}
-        self.boosts_jogador = {"velocidade": 0, "imunidade": 0}
-
-        self._blocos_boost_vel   = self._boost_para_blocos(self.boost_vel)
-        self._blocos_boost_imune = self._boost_para_blocos(self.boost_imune)
-
-        # Contadores de sub-tick para boost de velocidade (jogador e bot independentes)
-        self._vel_tick     = 0
-        self._vel_tick_bot = 0
+        self.boost_vel   = self.sim.boost_vel
+        self.boost_imune = self.sim.boost_imune
+        self.comidas     = self.sim.comidas
 
         self.p1_ready = False
 
-        self._jogador_morreu_flag = False
-        self._bot_morreu_flag     = False
-
-    # ── Propriedade de compatibilidade ────────────────────────────────────────
+    # ── Propriedades de compatibilidade ───────────────────────────────────────
 
     @property
     def pontos_bot(self) -> int:
         """Pontuação actual do bot (com multiplicador de dificuldade aplicado)."""
-        return self._score_bot.obter_pontuacao()
+        return self.sim.score_bot.obter_pontuacao()
 
-    # ── BaseModo ──────────────────────────────────────────────────────────────
+    @property
+    def boosts_jogador(self) -> dict:
+        return self.sim.boosts_jogador
 
-    def _segmentos_ocupados(self) -> set:
-        return set(self.snake.segments) | set(self.bot.segments)
+    @property
+    def boosts_bot(self) -> dict:
+        return self.sim.boosts_bot
 
-    def _snake_heads(self) -> List[Tuple[int, int]]:
-        return [self.snake.head_pos(), self.bot.head_pos()]
+    # ── BaseModo ──────────────────────────────────────────────────────────────
 
     def hud_info(self) -> dict:
         fps = max(1, int(self.engine.base_fps * self.engine.velocidade_mult))
@@ -110,87 +82,32 @@ class PlayerVsAI(BaseModo):
             "fps_ref":           fps,
         }
 
-    # ── Spawn ─────────────────────────────────────────────────────────────────
-
-    def _spawn_item(self, item) -> None:
-        ocupados = self._segmentos_ocupados() | self._zona_exclusao()
-        for outro in [self.comidas[0], self.boost_vel, self.boost_imune]:
-            if outro is not item and getattr(outro, "pos", None):
-                ocupados.add(outro.pos)
-        item.spawn(ocupados, self._mapa.obstaculos_pixels())
-
-    # ── Utilitários ───────────────────────────────────────────────────────────
-
-    def _bpx(self, pos_px):
-        b = self.engine.block
-        return (pos_px[0] // b, pos_px[1] // b)
-
-    def _valido(self, bx, by):
-        return 0 <= bx < self._mapa.cols and 0 <= by < self._mapa.rows
-
-    def _manhattan(self, a, b):
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-    def _boost_para_blocos(self, boost):
-        return {self._bpx(boost.pos)} if boost.pos else set()
-
-    def _atualizar_blocos_boosts(self):
-        self._blocos_boost_vel   = self._boost_para_blocos(self.boost_vel)
-        self._blocos_boost_imune = self._boost_para_blocos(self.boost_imune)
-
-    def _imune(self):                  return self.boosts_bot["imunidade"]      > 0
-    def _com_velocidade(self):         return self.boosts_bot["velocidade"]     > 0
-    def _jogador_imune(self):          return self.boosts_jogador["imunidade"]  > 0
-    def _jogador_com_velocidade(self): return self.boosts_jogador["velocidade"] > 0
-
-    def _tick_boosts(self):
-        for d in (self.boosts_bot, self.boosts_jogador):
-            for k in d:
-                if d[k] > 0:
-                    d[k] -= 1
-
-    def _ativar_boost_bot(self, tipo):
-        duracoes = {"velocidade": DURACAO_BOOST_VEL, "imunidade": DURACAO_BOOST_IMUNE}
-        if tipo in duracoes:
-            self.boosts_bot[tipo] = duracoes[tipo]
-
-    def _ativar_boost_jogador(self, tipo):
-        duracoes = {"velocidade": DURACAO_BOOST_VEL, "imunidade": DURACAO_BOOST_IMUNE}
-        if tipo in duracoes:
-            self.boosts_jogador[tipo] = duracoes[tipo]
-
     # ── Input ─────────────────────────────────────────────────────────────────
 
-    _TECLAS: dict = {
+    _TECLAS: dict = {"p1": {
         pygame.K_w: (0,-1), pygame.K_UP:    (0,-1),
         pygame.K_s: (0, 1), pygame.K_DOWN:  (0, 1),
         pygame.K_a: (-1, 0), pygame.K_LEFT: (-1, 0),
         pygame.K_d: (1,  0), pygame.K_RIGHT:(1,  0),
-    }
+    }}
 
-    def handle_event(self, event):
-        if event.type == pygame.KEYDOWN and event.key in self._TECLAS:
-            self.snake.set_direction(*self._TECLAS[event.key])
-            self.p1_ready = True
+    def _jogador_pronto(self, quem: str) -> None:
+        self.p1_ready = True
+
+    def iniciar_reproducao(self) -> None:
+        self.p1_ready = True
 
     # ── Update ────────────────────────────────────────────────────────────────
 
     def update(self):
-        if self.terminado:
-            return
-
         if self._dying:
-            j_done = self.snake.tick_death_flash() if self._jogador_morreu_flag else True
-            b_done = self.bot.tick_death_flash()   if self._bot_morreu_flag     else True
-            self._death_timer += 1
-            if (j_done and b_done) or self._death_timer >= _DEATH_DELAY_TICKS:
-                self._dying    = False
-                self.terminado = True
-                pts = self.engine.score.obter_pontuacao()
-                resultado = ("empate"  if self._jogador_morreu_flag and self._bot_morreu_flag
-                             else "derrota" if self._jogador_morreu_flag
-                             else "vitoria")
-                self.engine.game_over_vsai(resultado, pts, self.pontos_bot)
+            self._tick_morte(lambda: self.engine.game_over_vsai(
+                self.sim.resultado,
+                self.engine.score.obter_pontuacao(),
+                self.pontos_bot,
+            ))
+            return
+        if self.terminado:
             return
 
         if self.p1_ready and not self.countdown_active and not self.started:
@@ -199,363 +116,7 @@ class PlayerVsAI(BaseModo):
         if not self.started:
             return
 
-        self._tick_boosts()
-        self._logica_bot()
-
-        # ── Movimento do jogador ──────────────────────────────────────────────
-        # Boost de velocidade: 2 steps em 2 de cada 3 ticks (≈1.67×).
-        # A posição intermédia é verificada para evitar tunneling na comida.
-        self.snake.update()
-        if self._jogador_com_velocidade():
-            self._vel_tick = (self._vel_tick + 1) % 3
-            if self._vel_tick != 0:
-                if not self._colisao_fatal_jogador():
-                    self._verificar_comida_jogador()
-                    self.snake.update()
-
-        # ── Movimento do bot ──────────────────────────────────────────────────
-        # Mesma lógica de sub-tick: quando o bot tem boost de velocidade,
-        # avança 2 blocos em 2 de cada 3 ticks — simétrico ao jogador.
-        self.bot.update()
-        if self._com_velocidade():
-            self._vel_tick_bot = (self._vel_tick_bot + 1) % 3
-            if self._vel_tick_bot != 0:
-                if not self._colisao_fatal_bot():
-                    self._verificar_comida_bot()
-                    self.bot.update()
-
-        self._verificar_colisoes()
-
-    # ── Colisões fatais individuais ───────────────────────────────────────────
-
-    def _colisao_fatal_jogador(self) -> bool:
-        cabeca = self.snake.head_pos()
-        col    = self._mapa.verificar_colisao(cabeca)
-        if isinstance(col, tuple):
-            self.snake.set_head_pos(col)
-            return False
-        return (col is True and not self._jogador_imune()) or self.snake.collides_self()
-
-    def _colisao_fatal_bot(self) -> bool:
-        cabeca = self.bot.head_pos()
-        col    = self._mapa.verificar_colisao(cabeca)
-        if isinstance(col, tuple):
-            self.bot.set_head_pos(col)
-            return False
-        return (col is True and not self._imune()) or self.bot.collides_self()
-
-    # ── Verificação de comida intermédia (anti-tunneling) ─────────────────────
-
-    def _verificar_comida_jogador(self) -> None:
-        """Verifica comida e boosts na posição intermédia do jogador durante boost."""
-        cabeca = self.snake.head_pos()
-        for f in self.comidas:
-            if cabeca == f.pos:
-                self.snake.grow()
-                self.engine.score.adicionar_pontos(10)
-                self.engine.hud.set_score(self.engine.score.obter_pontuacao())
-                self.engine.particulas.emit_food_burst(
-                    f.pos, FOOD_COLOR, self.engine.block
-                )
-                self.food_spawn_safe(f, self.comidas)
-
-        for boost, tipo, cor in (
-            (self.boost_vel,   "velocidade", _COR_BOOST_VEL),
-            (self.boost_imune, "imunidade",  _COR_BOOST_IMUNE),
-        ):
-            if boost.pos and cabeca == boost.pos:
-                self._ativar_boost_jogador(tipo)
-                self.engine.particulas.emit_boost_pickup(
-                    boost.pos, cor, self.engine.block
-                )
-                self._spawn_item(boost)
-                self._atualizar_blocos_boosts()
-
-    def _verificar_comida_bot(self) -> None:
-        """Verifica comida e boosts na posição intermédia do bot durante boost."""
-        cabeca = self.bot.head_pos()
-        for f in self.comidas:
-            if cabeca == f.pos:
-                self.bot.grow()
-                self._score_bot.adicionar_pontos(10)
-                self.food_spawn_safe(f, self.comidas)
-
-        for boost, tipo, _ in (
-            (self.boost_vel,   "velocidade", None),
-            (self.boost_imune, "imunidade",  None),
-        ):
-            if boost.pos and cabeca == boost.pos:
-                self._ativar_boost_bot(tipo)
-                self._spawn_item(boost)
-                self._atualizar_blocos_boosts()
-
-    # ── Bot ───────────────────────────────────────────────────────────────────
-
-    def _obter_bloqueios(self):
-        b = self.engine.block
-        corpos = {
-            (s[0] // b, s[1] // b)
-            for cobra in (self.bot, self.snake)
-            for s in cobra.segments[:-1]
-        }
-        return corpos if self._imune() else corpos | self._obst
-
-    def _logica_bot(self):
-        bloqueios   = self._obter_bloqueios()
-        cabeca      = self._bpx(self.bot.head_pos())
-        cabeca_p    = self._bpx(self.snake.head_pos())
-        comida      = self._bpx(self.comidas[0].pos)
-        limite_ff   = max(4, len(self.bot.segments) // 2)
-        tam_bot     = len(self.bot.segments)
-        tam_jogador = len(self.snake.segments)
-        perto       = self._manhattan(cabeca, cabeca_p) <= DIST_CONFRONTO
-
-        boost_alvo = self._avaliar_boosts(
-            cabeca, comida, bloqueios, tam_bot, tam_jogador, perto
-        )
-        objetivo, modo = ((boost_alvo, "boost") if boost_alvo else
-                          self._decidir_objetivo(cabeca, cabeca_p, comida,
-                                                 tam_bot, tam_jogador, perto, bloqueios))
-
-        caminho = self._astar(cabeca, objetivo, bloqueios)
-        if caminho and len(caminho) >= 2:
-            prox    = caminho[1]
-            direcao = (prox[0] - cabeca[0], prox[1] - cabeca[1])
-            espaco  = self._flood_fill(prox, bloqueios, limite_ff)
-            limiar  = max(2, limite_ff // 2) if modo in ("ataque", "boost") else limite_ff
-            if espaco >= limiar:
-                self.bot.set_direction(*direcao)
-                return
-
-        melhor = self._melhor_direcao_sobrevivencia(cabeca, bloqueios, limite_ff)
-        if melhor:
-            self.bot.set_direction(*melhor)
-
-    def _decidir_objetivo(self, cabeca, cabeca_p, comida,
-                          tam_bot, tam_jogador, perto, bloqueios):
-        ratio = tam_bot / max(tam_jogador, 1)
-        if perto:
-            if self._imune() or ratio >= LIMIAR_ATAQUE:
-                return self._calcular_intercecao(cabeca, cabeca_p, bloqueios), "ataque"
-            if ratio < LIMIAR_FUGA:
-                return self._calcular_destino_fuga(cabeca, cabeca_p, bloqueios), "fuga"
-        elif ratio >= LIMIAR_ATAQUE and self._manhattan(cabeca, cabeca_p) <= DIST_CORTE:
-            return self._calcular_intercecao(cabeca, cabeca_p, bloqueios), "ataque"
-        return comida, "comer"
-
-    def _calcular_intercecao(self, cabeca_bot, cabeca_jogador, bloqueios):
-        dx, dy = self.snake.direction
-        passos = max(2, self._manhattan(cabeca_bot, cabeca_jogador) // 2)
-        ax = max(1, min(self._mapa.cols - 2, cabeca_jogador[0] + dx * passos))
-        ay = max(1, min(self._mapa.rows - 2, cabeca_jogador[1] + dy * passos))
-        alvo = (ax, ay)
-        if alvo in bloqueios:
-            segs = self.snake.segments
-            return self._bpx(segs[1] if len(segs) >= 2 else segs[0])
-        return alvo
-
-    def _calcular_destino_fuga(self, cabeca, cabeca_p, bloqueios):
-        cols, rows = self._mapa.cols, self._mapa.rows
-        dx, dy     = cabeca[0] - cabeca_p[0], cabeca[1] - cabeca_p[1]
-        dest_x     = max(1, min(cols - 2, cabeca[0] + dx * 5))
-        dest_y     = max(1, min(rows - 2, cabeca[1] + dy * 5))
-        destino    = (dest_x, dest_y)
-        if destino in bloqueios:
-            for raio in range(1, 6):
-                for ddx in range(-raio, raio + 1):
-                    for ddy in range(-raio, raio + 1):
-                        c = (dest_x + ddx, dest_y + ddy)
-                        if self._valido(*c) and c not in bloqueios:
-                            return c
-        return destino
-
-    def _avaliar_boosts(self, cabeca, comida, bloqueios, tam_bot, tam_jogador, perto):
-        dist_comida  = self._manhattan(cabeca, comida)
-        ratio        = tam_bot / max(tam_jogador, 1)
-        melhor_boost, melhor_prio = None, -1
-        candidatos = [
-            (self._blocos_boost_vel,   self._com_velocidade(),
-             perto and ratio < LIMIAR_FUGA,    DESVIO_MAX_BOOST_VEL,    0),
-            (self._blocos_boost_imune, self._imune(),
-             perto and ratio >= LIMIAR_ATAQUE, DESVIO_MAX_BOOST_IMUNE, 10),
-        ]
-        for blocos, ja_tem, skip, desvio_max, bonus in candidatos:
-            if ja_tem or skip:
-                continue
-            for pos in blocos:
-                if pos in bloqueios:
-                    continue
-                desvio = (self._manhattan(cabeca, pos)
-                          + self._manhattan(pos, comida)
-                          - dist_comida)
-                if desvio <= desvio_max:
-                    p = (desvio_max - desvio) + bonus
-                    if p > melhor_prio:
-                        melhor_prio, melhor_boost = p, pos
-        return melhor_boost
-
-    # ── A* ────────────────────────────────────────────────────────────────────
-
-    def _astar(self, inicio, objetivo, bloqueios):
-        cols, rows = self._mapa.cols, self._mapa.rows
-        imune      = self._imune()
-
-        def h(pos):
-            return abs(pos[0] - objetivo[0]) + abs(pos[1] - objetivo[1])
-
-        def custo(pos):
-            if pos in self._obst:
-                return CUSTO_PAREDE_IMUNE if imune else None
-            if pos in self._blocos_boost_imune: return CUSTO_BOOST_IMUNE
-            if pos in self._blocos_boost_vel:   return CUSTO_BOOST_VEL
-            return CUSTO_NORMAL
-
-        heap      = [(h(inicio), 0.0, inicio)]
-        came_from = {inicio: None}
-        g_score   = {inicio: 0.0}
-
-        while heap:
-            _, g, atual = heapq.heappop(heap)
-            if atual == objetivo:
-                path, node = [], atual
-                while node is not None:
-                    path.append(node)
-                    node = came_from[node]
-                path.reverse()
-                return path
-            if g > g_score.get(atual, float("inf")):
-                continue
-            for dx, dy in TODAS_DIRECOES:
-                viz = (atual[0] + dx, atual[1] + dy)
-                if not (0 <= viz[0] < cols and 0 <= viz[1] < rows):
-                    continue
-                if viz in bloqueios and viz not in self._obst:
-                    continue
-                c = custo(viz)
-                if c is None:
-                    continue
-                ng = g + c
-                if ng < g_score.get(viz, float("inf")):
-                    g_score[viz]   = ng
-                    came_from[viz] = atual
-                    heapq.heappush(heap, (ng + h(viz), ng, viz))
-        return None
-
-    def _flood_fill(self, inicio, bloqueios, limite):
-        if inicio in bloqueios:
-            return 0
-        visitado = {inicio}
-        fila     = deque([inicio])
-        contagem = 0
-        while fila:
-            atual = fila.popleft()
-            contagem += 1
-            if contagem >= limite:
-                return contagem
-            for dx, dy in TODAS_DIRECOES:
-                viz = (atual[0] + dx, atual[1] + dy)
-                if not self._valido(*viz) or viz in bloqueios or viz in visitado:
-                    continue
-                visitado.add(viz)
-                fila.append(viz)
-        return contagem
-
-    def _melhor_direcao_sobrevivencia(self, cabeca, bloqueios, limite):
-        oposta = (-self.bot.direction[0], -self.bot.direction[1])
-        melhor_dir, melhor_esp = None, -1
-        for d in TODAS_DIRECOES:
-            if d == oposta:
-                continue
-            prox = (cabeca[0] + d[0], cabeca[1] + d[1])
-            if not self._valido(*prox) or prox in bloqueios:
-                continue
-            esp = self._flood_fill(prox, bloqueios, limite)
-            if esp > melhor_esp:
-                melhor_esp, melhor_dir = esp, d
-        return melhor_dir
-
-    # ── Colisões (frame final) ────────────────────────────────────────────────
-
-    def _verificar_colisoes(self):
-        if self.terminado:
-            return
-
-        cabeca_j = self.snake.head_pos()
-        cabeca_b = self.bot.head_pos()
-
-        # ── Comida ───────────────────────────────────────────────────────────
-        for f in self.comidas:
-            if cabeca_j == f.pos:
-                self.snake.grow()
-                self.engine.score.adicionar_pontos(10)
-                self.engine.hud.set_score(self.engine.score.obter_pontuacao())
-                self.engine.particulas.emit_food_burst(
-                    f.pos, FOOD_COLOR, self.engine.block
-                )
-                self.food_spawn_safe(f, self.comidas)
-            if cabeca_b == f.pos:
-                self.bot.grow()
-                self._score_bot.adicionar_pontos(10)
-                self.food_spawn_safe(f, self.comidas)
-
-        # ── Boosts ───────────────────────────────────────────────────────────
-        for boost, tipo, cor in (
-            (self.boost_vel,   "velocidade", _COR_BOOST_VEL),
-            (self.boost_imune, "imunidade",  _COR_BOOST_IMUNE),
-        ):
-            if not boost.pos:
-                continue
-            if cabeca_j == boost.pos:
-                self._ativar_boost_jogador(tipo)
-                self.engine.particulas.emit_boost_pickup(
-                    boost.pos, cor, self.engine.block
-                )
-                self._spawn_item(boost)
-                self._atualizar_blocos_boosts()
-            elif cabeca_b == boost.pos:
-                self._ativar_boost_bot(tipo)
-                self._spawn_item(boost)
-                self._atualizar_blocos_boosts()
-
-        # ── Paredes / teleporte ───────────────────────────────────────────────
-        col_j = self._mapa.verificar_colisao(cabeca_j)
-        col_b = self._mapa.verificar_colisao(cabeca_b)
-        if isinstance(col_j, tuple): self.snake.set_head_pos(col_j)
-        if isinstance(col_b, tuple): self.bot.set_head_pos(col_b)
-
-        # ── Entre cobras ──────────────────────────────────────────────────────
-        if cabeca_j == cabeca_b:
-            vantagem       = len(self.bot.segments) - len(self.snake.segments)
-            jogador_morreu = vantagem >= 0
-            bot_morreu     = vantagem <= 0
-        else:
-            jogador_morreu = (
-                (col_j is True and not self._jogador_imune())
-                or cabeca_j in self.bot.segments
-                or self.snake.collides_self()
-            )
-            bot_morreu = (
-                (col_b is True and not self._imune())
-                or cabeca_b in self.snake.segments
-                or self.bot.collides_self()
-            )
-
-        if jogador_morreu or bot_morreu:
-            self._dying               = True
-            self._death_timer         = 0
-            self._jogador_morreu_flag = jogador_morreu
-            self._bot_morreu_flag     = bot_morreu
-            self.engine.trigger_shake(intensity=8.0, duration=0.35)
-            if jogador_morreu:
-                self.engine.particulas.emit_death(
-                    self.snake.segments, self.snake.body_color, self.engine.block
-                )
-                self.snake.start_death_flash()
-            if bot_morreu:
-                self.engine.particulas.emit_death(
-                    self.bot.segments, self.bot.body_color, self.engine.block
-                )
-                self.bot.start_death_flash()
+        self._step()
 
     # ── Visual ────────────────────────────────────────────────────────────────
 
@@ -564,24 +125,25 @@ class PlayerVsAI(BaseModo):
             f.update(dt)
 
     def draw(self, surface: pygame.Surface) -> None:
-        self.snake.draw(surface)
-        self.bot.draw(surface)
+        cam = self.engine.camara
+        self.snake.draw(surface, cam, self.engine.alfa)
+        self.bot.draw(surface, cam, self.engine.alfa)
         for f in self.comidas:
-            f.draw(surface)
-        self.boost_vel.draw(surface)
-        self.boost_imune.draw(surface)
+            f.draw(surface, cam)
+        self.boost_vel.draw(surface, cam)
+        self.boost_imune.draw(surface, cam)
 
         if self.started:
             return
 
         import game.config as cfg
-        f_p = pygame.font.SysFont(None, 30)
+        f_p = fontes.fonte(30, face=None)
         cx  = cfg.SCREEN_WIDTH // 2
         cy  = surface.get_height() // 2
         if not self.p1_ready:
-            msg = f_p.render("Carrega numa direção para começar!", True, (255, 255, 255))
+            msg = fontes.texto(f_p, "Carrega numa direção para começar!", (255, 255, 255))
             surface.blit(msg, (cx - msg.get_width() // 2, cy - 40))
-            ctl = f_p.render("WASD ou Setas", True, (180, 180, 180))
+            ctl = fontes.texto(f_p, "WASD ou Setas", (180, 180, 180))
             surface.blit(ctl, (cx - ctl.get_width() // 2, cy + 10))
         elif self.countdown_active:
-            self._draw_countdown(surface)
\ No newline at end of file
+            self._draw_countdown(surface)
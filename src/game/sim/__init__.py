@@ -0,0 +1 @@
+# pacote
@@ -0,0 +1,353 @@
+# src/game/sim/bot.py
+"""
+IA do bot do modo Vs AI (A* + Flood Fill + táticas) — sem pygame.
+
+O bot lê o estado da SimulacaoVsAI a que pertence e, a cada tick lógico,
+enfileira a direcção escolhida na sua cobra.
+
+Planeamento incremental: o último caminho A* fica guardado e, a cada tick,
+é apenas validado (O(comprimento)). Só se volta a procurar quando o
+objectivo muda, os custos mudam (boosts/imunidade) ou uma célula do
+caminho fica bloqueada — e neste caso só o sufixo a partir da célula
+bloqueada é refeito. `contadores` expõe os nós expandidos por tick.
+
+As procuras em si correm nos núcleos de game.sim.procura (ids planos,
+buffers com carimbos de geração); aqui só se traduz para/de (bx, by).
+
+Espaço livre: com limites pequenos cada consulta é uma BFS limitada; a
+partir de LIMIAR_COMPONENTES a grelha é rotulada em componentes ligadas
+uma vez por tick e todas as consultas desse tick passam a ser O(1).
+"""
+from __future__ import annotations
+
+from array import array
+
+from game.sim.procura import COM_NUMPY, INF, GrelhaProcura
+
+TODAS_DIRECOES = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+
+CUSTO_NORMAL       = 1.0
+CUSTO_BOOST_VEL    = 0.5
+CUSTO_BOOST_IMUNE  = 0.3
+CUSTO_PAREDE_IMUNE = 0.8
+
+LIMIAR_ATAQUE  = 1.20
+LIMIAR_FUGA    = 0.75
+DIST_CONFRONTO = 6
+DIST_CORTE     = 10
+
+DESVIO_MAX_BOOST_VEL   = 4
+DESVIO_MAX_BOOST_IMUNE = 6
+
+# Limite do flood fill a partir do qual rotular a grelha inteira fica mais
+# barato do que 1–4 BFS limitadas (~90 µs com NumPy, ~350 µs sem)
+LIMIAR_COMPONENTES = 32 if COM_NUMPY else 128
+
+
+class BotIA:
+    """Decide a direcção do bot a partir do estado da simulação."""
+
+    def __init__(self, sim) -> None:
+        self.sim   = sim
+        self._mapa = sim.mapa
+        self._obst = sim.mapa._obst_set
+
+        # Buffers de procura e custos-base por célula (sem/com imunidade)
+        self._grelha = GrelhaProcura(self._mapa.cols, self._mapa.rows)
+        rows         = self._mapa.rows
+        normal       = array("d", [CUSTO_NORMAL]) * self._grelha.n
+        imune        = array("d", normal)
+        for bx, by in self._obst:
+            if self._valido(bx, by):
+                normal[bx * rows + by] = INF
+                imune[bx * rows + by]  = CUSTO_PAREDE_IMUNE
+        self._custos_base = {False: normal, True: imune}
+        self._custos:       array = normal
+        self._custos_chave: tuple = ()
+
+        # Plano em cache: células da cabeça ao objectivo + contexto de custos
+        self._plano:    list  = []
+        self._contexto: tuple = ()
+
+        self.contadores = {
+            "ticks":        0,
+            "nos_tick":     0,    # nós expandidos pelo A* no último tick
+            "nos_total":    0,
+            "ff_tick":      0,    # células visitadas/rotuladas no último tick
+            "ff_total":     0,
+            "reutilizados": 0,    # ticks em que o plano serviu sem procura
+            "reparados":    0,    # só o sufixo foi refeito
+            "replaneados":  0,    # A* completo
+            "rotulagens":   0,    # grelhas rotuladas em componentes
+        }
+
+    # ── Utilitários ───────────────────────────────────────────────────────────
+
+    def _bpx(self, pos_px):
+        b = self.sim.block
+        return (pos_px[0] // b, pos_px[1] // b)
+
+    def _valido(self, bx, by):
+        return 0 <= bx < self._mapa.cols and 0 <= by < self._mapa.rows
+
+    def _manhattan(self, a, b):
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    def _imune(self):          return self.sim.boosts_bot["imunidade"]  > 0
+    def _com_velocidade(self): return self.sim.boosts_bot["velocidade"] > 0
+
+    def _id(self, pos):
+        return pos[0] * self._mapa.rows + pos[1]
+
+    def _preparar_custos(self, imune, blocos_vel, blocos_imune):
+        """Array de custos por célula — só é refeito quando o contexto muda."""
+        chave = (imune, blocos_vel, blocos_imune)
+        if chave == self._custos_chave:
+            return
+        custos = array("d", self._custos_base[imune])
+        for blocos, custo in ((blocos_vel, CUSTO_BOOST_VEL),
+                              (blocos_imune, CUSTO_BOOST_IMUNE)):
+            for pos in blocos:
+                if self._valido(*pos) and pos not in self._obst:
+                    custos[self._id(pos)] = custo
+        self._custos, self._custos_chave = custos, chave
+
+    # ── Estado (keyframes dos replays) ────────────────────────────────────────
+
+    def estado(self) -> dict:
+        """
+        Plano em cache e o seu contexto, em JSON. Contam para o determinismo:
+        um plano reaproveitado pode diferir do que o A* faria de novo.
+        """
+        def chave(imune, blocos_vel, blocos_imune):
+            return [imune, sorted(blocos_vel), sorted(blocos_imune)]
+
+        return {
+            "plano":      [list(p) for p in self._plano],
+            "objetivo":   list(self._contexto[0]) if self._contexto else None,
+            "custos":     chave(*self._custos_chave) if self._custos_chave else None,
+            "contadores": dict(self.contadores),
+        }
+
+    def repor_estado(self, dados: dict) -> None:
+        self._plano = [tuple(p) for p in dados["plano"]]
+        chave = ()
+        if dados["custos"] is not None:
+            imune, blocos_vel, blocos_imune = dados["custos"]
+            self._preparar_custos(imune,
+                                  frozenset(tuple(p) for p in blocos_vel),
+                                  frozenset(tuple(p) for p in blocos_imune))
+            chave = self._custos_chave
+        self._contexto = ((tuple(dados["objetivo"]),) + chave
+                          if dados["objetivo"] is not None else ())
+        self.contadores.update(dados["contadores"])
+
+    # ── Decisão ───────────────────────────────────────────────────────────────
+
+    def _obter_bloqueios(self):
+        b = self.sim.block
+        corpos = {
+            (s[0] // b, s[1] // b)
+            for cobra in (self.sim.bot, self.sim.snake)
+            for s in cobra.segments[:-1]
+        }
+        # Os núcleos lêem os corpos da grelha; as paredes vêm do array de custos
+        self._preparar_custos(self._imune(),
+                              frozenset(self.sim._blocos_boost_vel),
+                              frozenset(self.sim._blocos_boost_imune))
+        self._grelha.bloquear(self._id(p) for p in corpos if self._valido(*p))
+        return corpos if self._imune() else corpos | self._obst
+
+    def actualizar(self):
+        """Escolhe a próxima direcção do bot e enfileira-a na cobra."""
+        c = self.contadores
+        c["ticks"]   += 1
+        c["nos_tick"] = 0
+        c["ff_tick"]  = 0
+        self._decidir()
+        c["nos_total"] += c["nos_tick"]
+        c["ff_total"]  += c["ff_tick"]
+
+    def _decidir(self):
+        bot         = self.sim.bot
+        bloqueios   = self._obter_bloqueios()
+        cabeca      = self._bpx(bot.head_pos())
+        cabeca_p    = self._bpx(self.sim.snake.head_pos())
+        pos_comida  = self.sim.comidas[0].pos
+        comida      = self._bpx(pos_comida) if pos_comida else cabeca
+        limite_ff   = max(4, len(bot.segments) // 2)
+        tam_bot     = len(bot.segments)
+        tam_jogador = len(self.sim.snake.segments)
+        perto       = self._manhattan(cabeca, cabeca_p) <= DIST_CONFRONTO
+
+        boost_alvo = self._avaliar_boosts(
+            cabeca, comida, bloqueios, tam_bot, tam_jogador, perto
+        )
+        objetivo, modo = ((boost_alvo, "boost") if boost_alvo else
+                          self._decidir_objetivo(cabeca, cabeca_p, comida,
+                                                 tam_bot, tam_jogador, perto, bloqueios))
+
+        caminho = self._planear(cabeca, objetivo, bloqueios)
+        if caminho and len(caminho) >= 2:
+            prox    = caminho[1]
+            direcao = (prox[0] - cabeca[0], prox[1] - cabeca[1])
+            espaco  = self._flood_fill(prox, bloqueios, limite_ff)
+            limiar  = max(2, limite_ff // 2) if modo in ("ataque", "boost") else limite_ff
+            if espaco >= limiar:
+                bot.set_direction(*direcao)
+                return
+
+        melhor = self._melhor_direcao_sobrevivencia(cabeca, bloqueios, limite_ff)
+        if melhor:
+            bot.set_direction(*melhor)
+
+    def _decidir_objetivo(self, cabeca, cabeca_p, comida,
+                          tam_bot, tam_jogador, perto, bloqueios):
+        ratio = tam_bot / max(tam_jogador, 1)
+        if perto:
+            if self._imune() or ratio >= LIMIAR_ATAQUE:
+                return self._calcular_intercecao(cabeca, cabeca_p, bloqueios), "ataque"
+            if ratio < LIMIAR_FUGA:
+                return self._calcular_destino_fuga(cabeca, cabeca_p, bloqueios), "fuga"
+        elif ratio >= LIMIAR_ATAQUE and self._manhattan(cabeca, cabeca_p) <= DIST_CORTE:
+            return self._calcular_intercecao(cabeca, cabeca_p, bloqueios), "ataque"
+        return comida, "comer"
+
+    def _calcular_intercecao(self, cabeca_bot, cabeca_jogador, bloqueios):
+        dx, dy = self.sim.snake.direction
+        passos = max(2, self._manhattan(cabeca_bot, cabeca_jogador) // 2)
+        ax = max(1, min(self._mapa.cols - 2, cabeca_jogador[0] + dx * passos))
+        ay = max(1, min(self._mapa.rows - 2, cabeca_jogador[1] + dy * passos))
+        alvo = (ax, ay)
+        if alvo in bloqueios:
+            segs = self.sim.snake.segments
+            return self._bpx(segs[1] if len(segs) >= 2 else segs[0])
+        return alvo
+
+    def _calcular_destino_fuga(self, cabeca, cabeca_p, bloqueios):
+        cols, rows = self._mapa.cols, self._mapa.rows
+        dx, dy     = cabeca[0] - cabeca_p[0], cabeca[1] - cabeca_p[1]
+        dest_x     = max(1, min(cols - 2, cabeca[0] + dx * 5))
+        dest_y     = max(1, min(rows - 2, cabeca[1] + dy * 5))
+        destino    = (dest_x, dest_y)
+        if destino in bloqueios:
+            for raio in range(1, 6):
+                for ddx in range(-raio, raio + 1):
+                    for ddy in range(-raio, raio + 1):
+                        c = (dest_x + ddx, dest_y + ddy)
+                        if self._valido(*c) and c not in bloqueios:
+                            return c
+        return destino
+
+    def _avaliar_boosts(self, cabeca, comida, bloqueios, tam_bot, tam_jogador, perto):
+        dist_comida  = self._manhattan(cabeca, comida)
+        ratio        = tam_bot / max(tam_jogador, 1)
+        melhor_boost, melhor_prio = None, -1
+        candidatos = [
+            (self.sim._blocos_boost_vel,   self._com_velocidade(),
+             perto and ratio < LIMIAR_FUGA,    DESVIO_MAX_BOOST_VEL,    0),
+            (self.sim._blocos_boost_imune, self._imune(),
+             perto and ratio >= LIMIAR_ATAQUE, DESVIO_MAX_BOOST_IMUNE, 10),
+        ]
+        for blocos, ja_tem, skip, desvio_max, bonus in candidatos:
+            if ja_tem or skip:
+                continue
+            for pos in blocos:
+                if pos in bloqueios:
+                    continue
+                desvio = (self._manhattan(cabeca, pos)
+                          + self._manhattan(pos, comida)
+                          - dist_comida)
+                if desvio <= desvio_max:
+                    p = (desvio_max - desvio) + bonus
+                    if p > melhor_prio:
+                        melhor_prio, melhor_boost = p, pos
+        return melhor_boost
+
+    # ── Plano incremental ─────────────────────────────────────────────────────
+
+    def _planear(self, cabeca, objetivo, bloqueios):
+        """
+        Caminho da cabeça ao objectivo, reaproveitando o plano do tick anterior.
+
+        O plano serve enquanto o objectivo e os custos forem os mesmos e
+        nenhuma das suas células estiver bloqueada. Se uma estiver, o prefixo
+        até ela mantém-se e o A* corre só daí até ao objectivo.
+        """
+        contexto = (objetivo,) + self._custos_chave
+        plano = self._avancar_plano(cabeca) if contexto == self._contexto else None
+        self._contexto = contexto
+
+        if plano:
+            k = next((i for i in range(1, len(plano)) if plano[i] in bloqueios), None)
+            if k is None:
+                self.contadores["reutilizados"] += 1
+                self._plano = plano
+                return plano
+            if k > 1:
+                # O prefixo será ocupado pelo bot — o sufixo não o pode cruzar
+                sufixo = self._astar(plano[k - 1], objetivo, bloqueios,
+                                     evitar=set(plano[:k - 1]))
+                if sufixo:
+                    self.contadores["reparados"] += 1
+                    self._plano = plano[:k - 1] + sufixo
+                    return self._plano
+
+        self.contadores["replaneados"] += 1
+        self._plano = self._astar(cabeca, objetivo, bloqueios) or []
+        return self._plano or None
+
+    def _avancar_plano(self, cabeca):
+        """Corta do plano as células já percorridas; None se a cabeça saiu dele."""
+        plano = self._plano
+        # Com boost de velocidade o bot anda dois passos por tick
+        for i in range(min(3, len(plano))):
+            if plano[i] == cabeca:
+                return plano[i:]
+        return None
+
+    # ── A* ────────────────────────────────────────────────────────────────────
+
+    def _astar(self, inicio, objetivo, bloqueios, evitar=()):
+        """
+        Caminho (lista de (bx, by)) ou None. `bloqueios` tem de ser o conjunto
+        devolvido por _obter_bloqueios neste tick — já está marcado na grelha.
+        """
+        if not (self._valido(*inicio) and self._valido(*objetivo)):
+            return None
+        grelha  = self._grelha
+        caminho = grelha.astar(self._id(inicio), self._id(objetivo), self._custos,
+                               evitar=[self._id(p) for p in evitar])
+        self.contadores["nos_tick"] += grelha.expandidos
+        if caminho is None:
+            return None
+        rows = self._mapa.rows
+        return [divmod(c, rows) for c in caminho]
+
+    def _flood_fill(self, inicio, bloqueios, limite):
+        if not self._valido(*inicio):
+            return 0
+        grelha = self._grelha
+        if limite >= LIMIAR_COMPONENTES:
+            # min(tamanho, limite) é exactamente o que a BFS limitada devolve
+            contagem = min(limite, grelha.tamanho_componente(self._id(inicio), self._custos))
+            if grelha.expandidos:
+                self.contadores["rotulagens"] += 1
+        else:
+            contagem = grelha.bfs_contar(self._id(inicio), limite, self._custos)
+        self.contadores["ff_tick"] += grelha.expandidos
+        return contagem
+
+    def _melhor_direcao_sobrevivencia(self, cabeca, bloqueios, limite):
+        oposta = (-self.sim.bot.direction[0], -self.sim.bot.direction[1])
+        melhor_dir, melhor_esp = None, -1
+        for d in TODAS_DIRECOES:
+            if d == oposta:
+                continue
+            prox = (cabeca[0] + d[0], cabeca[1] + d[1])
+            if not self._valido(*prox) or prox in bloqueios:
+                continue
+            esp = self._flood_fill(prox, bloqueios, limite)
+            if esp > melhor_esp:
+                melhor_esp, melhor_dir = esp, d
+        return melhor_dir
@@ -0,0 +1,179 @@
+# src/game/sim/celulas_livres.py
+"""
+Índice incremental das células livres de uma grelha — sem pygame.
+
+As células livres vivem num array denso (lista) acompanhado de um mapa
+posição → índice no array. Retirar uma célula troca-a com a última e faz
+pop (swap-remove), pelo que ocupar, libertar e sortear são todos O(1).
+
+Cada célula ocupada guarda uma contagem de ocupantes (obstáculo, cobra,
+item...): só volta à lista de livres quando o último ocupante sai. Assim
+cobras, itens e obstáculos actualizam o índice cada um por si, sem saberem
+uns dos outros.
+
+As posições são em píxeis, tal como no resto da simulação.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+Pos = Tuple[int, int]
+
+# Tentativas de rejeição antes de filtrar a lista inteira
+_TENTATIVAS_FILTRO: int = 24
+
+
+class IndiceCelulasLivres:
+    """
+    Conjunto de células livres com add/remove/escolha uniforme em O(1).
+
+    Parâmetros:
+        area  — (x, y, w, h) em píxeis da zona indexada
+        block — tamanho de um bloco em píxeis
+    """
+
+    def __init__(self, area, block: int) -> None:
+        x0, y0, w, h = area
+        self.block = block
+        self.x0    = x0
+        self.y0    = y0
+        self.cols  = max(1, w // block)
+        self.rows  = max(1, h // block)
+
+        self._livres:    List[Pos]       = [
+            (x0 + gx * block, y0 + gy * block)
+            for gy in range(self.rows)
+            for gx in range(self.cols)
+        ]
+        self._indice:    Dict[Pos, int]  = {p: i for i, p in enumerate(self._livres)}
+        self._ocupantes: Dict[Pos, int]  = {}
+
+    # ── Consulta ──────────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self._livres)
+
+    def __contains__(self, pos) -> bool:
+        return pos in self._indice
+
+    def __iter__(self):
+        return iter(self._livres)
+
+    def na_grelha(self, pos: Pos) -> bool:
+        gx, rx = divmod(pos[0] - self.x0, self.block)
+        gy, ry = divmod(pos[1] - self.y0, self.block)
+        return not rx and not ry and 0 <= gx < self.cols and 0 <= gy < self.rows
+
+    # ── Ocupação (contagem de referências) ────────────────────────────────────
+
+    def ocupar(self, pos: Pos) -> None:
+        """Regista mais um ocupante em `pos`. Posições fora da grelha são ignoradas."""
+        n = self._ocupantes.get(pos)
+        if n:
+            self._ocupantes[pos] = n + 1
+        elif pos in self._indice:
+            self._retirar(pos)
+            self._ocupantes[pos] = 1
+
+    def libertar(self, pos: Pos) -> None:
+        """Remove um ocupante de `pos`; a célula volta a livre quando chega a zero."""
+        n = self._ocupantes.get(pos)
+        if not n:
+            return
+        if n > 1:
+            self._ocupantes[pos] = n - 1
+        else:
+            del self._ocupantes[pos]
+            self._repor(pos)
+
+    def ocupar_varios(self, posicoes: Iterable[Pos]) -> None:
+        for p in posicoes:
+            self.ocupar(p)
+
+    # ── Escolha aleatória ─────────────────────────────────────────────────────
+
+    def sortear(self, rng, longe_de: Iterable[Pos] = (), raio: int = 0,
+                excluir=()) -> Optional[Pos]:
+        """
+        Célula livre uniforme, ou None se a grelha estiver cheia.
+
+        `longe_de` + `raio` (em blocos) definem losangos de Manhattan a evitar
+        e `excluir` um conjunto extra de posições; ambos são filtros baratos
+        sobre a célula sorteada. Se nenhuma célula os respeitar, cai para uma
+        célula livre qualquer — nunca devolve uma célula ocupada.
+        """
+        livres = self._livres
+        if not livres:
+            return None
+
+        centros = list(longe_de) if raio > 0 else []
+        if not centros and not excluir:
+            return livres[rng.randrange(len(livres))]
+
+        lim = raio * self.block
+
+        def aceita(p) -> bool:
+            if p in excluir:
+                return False
+            px, py = p
+            for hx, hy in centros:
+                if abs(px - hx) + abs(py - hy) <= lim:
+                    return False
+            return True
+
+        for _ in range(_TENTATIVAS_FILTRO):
+            p = livres[rng.randrange(len(livres))]
+            if aceita(p):
+                return p
+
+        candidatas = [p for p in livres if aceita(p)]
+        if candidatas:
+            return candidatas[rng.randrange(len(candidatas))]
+        return livres[rng.randrange(len(livres))]
+
+    # ── Estado (keyframes dos replays) ────────────────────────────────────────
+
+    def estado(self) -> dict:
+        """
+        Estado serializável em JSON. A ordem de `_livres` entra: sortear()
+        indexa a lista, logo outra ordem daria outros spawns com o mesmo rng.
+        As células da grelha fora da lista têm 1 ocupante, salvo as de `multiplos`.
+        """
+        return {
+            "livres":    [self._id(p) for p in self._livres],
+            "multiplos": sorted([self._id(p), n] for p, n in self._ocupantes.items() if n > 1),
+        }
+
+    def repor_estado(self, dados: dict) -> None:
+        self._livres    = [self._pos(i) for i in dados["livres"]]
+        self._indice    = {p: i for i, p in enumerate(self._livres)}
+        self._ocupantes = {
+            self._pos(i): 1
+            for i in range(self.cols * self.rows)
+            if self._pos(i) not in self._indice
+        }
+        for i, n in dados["multiplos"]:
+            self._ocupantes[self._pos(i)] = n
+
+    def _id(self, pos: Pos) -> int:
+        return ((pos[1] - self.y0) // self.block * self.cols
+                + (pos[0] - self.x0) // self.block)
+
+    def _pos(self, i: int) -> Pos:
+        gy, gx = divmod(i, self.cols)
+        return (self.x0 + gx * self.block, self.y0 + gy * self.block)
+
+    # ── Swap-remove ───────────────────────────────────────────────────────────
+
+    def _retirar(self, pos: Pos) -> None:
+        i      = self._indice.pop(pos)
+        ultima = self._livres.pop()
+        if ultima != pos:
+            self._livres[i]      = ultima
+            self._indice[ultima] = i
+
+    def _repor(self, pos: Pos) -> None:
+        if pos in self._indice or not self.na_grelha(pos):
+            return
+        self._indice[pos] = len(self._livres)
+        self._livres.append(pos)
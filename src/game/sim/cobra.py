@@ -0,0 +1,220 @@
+# src/game/sim/cobra.py
+"""
+Lógica pura da cobra — sem pygame.
+
+Usada directamente pela simulação headless e como base de
+game.entities.snake.Snake, que lhe acrescenta rasto, flash de morte e desenho.
+
+O corpo é um deque (push da cabeça e pop da cauda em O(1)) acompanhado de um
+mapa de ocupação posição → contagem, mantido em sincronia a cada movimento.
+"Esta célula pertence à cobra?" e a auto-colisão passam a custar O(1),
+independentemente do comprimento.
+"""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Sequence
+from itertools import islice
+from typing import Dict, Iterator, Tuple
+
+from game.config import BLOCK_SIZE
+
+Pos = Tuple[int, int]
+
+
+class SegmentosCobra(Sequence):
+    """
+    Vista só de leitura do corpo, compatível com a antiga lista `segments`.
+
+    Indexação, slicing, len() e iteração comportam-se como numa lista
+    (cabeça em [0]); `pos in segments` usa o mapa de ocupação em O(1).
+    """
+
+    __slots__ = ("_corpo", "_ocupacao")
+
+    def __init__(self, corpo: deque, ocupacao: Dict[Pos, int]) -> None:
+        self._corpo    = corpo
+        self._ocupacao = ocupacao
+
+    def __len__(self) -> int:
+        return len(self._corpo)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self._corpo))
+            if step == 1:
+                return list(islice(self._corpo, start, max(start, stop)))
+            return list(self._corpo)[i]
+        return self._corpo[i]
+
+    def __iter__(self) -> Iterator[Pos]:
+        return iter(self._corpo)
+
+    def __reversed__(self) -> Iterator[Pos]:
+        return reversed(self._corpo)
+
+    def __contains__(self, pos) -> bool:
+        return pos in self._ocupacao
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, tuple, SegmentosCobra)):
+            return list(self._corpo) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SegmentosCobra({list(self._corpo)!r})"
+
+
+class CobraLogica:
+    """
+    Estado e regras de movimento de uma cobra.
+
+    Posições em píxeis (múltiplos de `block_size`), como no resto do jogo.
+    """
+
+    def __init__(self, start_pos: Tuple[int, int] = (100, 100),
+                 block_size: int = BLOCK_SIZE) -> None:
+        self.block = block_size
+
+        self._corpo:    deque           = deque([start_pos])
+        self._ocupacao: Dict[Pos, int]  = {start_pos: 1}
+        self.segments = SegmentosCobra(self._corpo, self._ocupacao)
+        self.indice   = None   # IndiceCelulasLivres partilhado (opcional)
+        self.direction: Tuple[int, int] = (1, 0)
+        self.grow_next: int             = 0
+
+        # ── Input buffer ───────────────────────────────────────────────────
+        # Guarda até 2 direcções pendentes para que inputs rápidos não se
+        # percam entre ticks de lógica. Validação anti-180° feita no enqueue.
+        self._dir_buffer: deque[Tuple[int, int]] = deque(maxlen=2)
+
+    # ── Input ─────────────────────────────────────────────────────────────────
+
+    def set_direction(self, dx: int, dy: int) -> bool:
+        """
+        Enfileira uma nova direcção no buffer; devolve False se foi rejeitada.
+
+        Rejeita:
+          - Inversão de 180° em relação à última direcção confirmada (ou em fila)
+          - Duplicado do último item já em fila (evita spam de inputs iguais)
+        """
+        # Referência para validar 180°: último em fila ou direcção actual
+        ref = self._dir_buffer[-1] if self._dir_buffer else self.direction
+
+        if (dx, dy) == (-ref[0], -ref[1]):        # inversão directa → ignorar
+            return False
+        if self._dir_buffer and self._dir_buffer[-1] == (dx, dy):  # duplicado
+            return False
+
+        self._dir_buffer.append((dx, dy))
+        return True
+
+    def entradas_pendentes(self) -> int:
+        """Direcções em fila que ainda não foram consumidas por update()."""
+        return len(self._dir_buffer)
+
+    def update(self) -> None:
+        """
+        Avança a cobra um bloco.
+        Consome o próximo input do buffer (se existir) antes de mover.
+        """
+        if self._dir_buffer:
+            next_dir = self._dir_buffer.popleft()
+            # Segurança extra: não inverter para o segmento seguinte
+            if len(self.segments) > 1:
+                hx, hy  = self.segments[0]
+                ndx, ndy = next_dir
+                if (hx + ndx * self.block, hy + ndy * self.block) != self.segments[1]:
+                    self.direction = next_dir
+            else:
+                self.direction = next_dir
+
+        hx, hy = self._corpo[0]
+        dx, dy = self.direction
+        self._empurrar_cabeca((hx + dx * self.block, hy + dy * self.block))
+        if self.grow_next > 0:
+            self.grow_next -= 1
+        else:
+            self._remover_cauda()
+
+    def grow(self, amount: int = 1) -> None:
+        """Agenda crescimento para os próximos `amount` ticks."""
+        self.grow_next += amount
+
+    # ── Colisões ──────────────────────────────────────────────────────────────
+
+    def collides_self(self) -> bool:
+        return self._ocupacao[self._corpo[0]] > 1
+
+    def ocupa(self, pos: Pos) -> bool:
+        """True se algum segmento da cobra estiver em `pos` — O(1)."""
+        return pos in self._ocupacao
+
+    def celulas(self):
+        """Posições ocupadas pelo corpo (sem repetições), para montar sets."""
+        return self._ocupacao.keys()
+
+    def head_pos(self) -> Tuple[int, int]:
+        return self._corpo[0]
+
+    def set_head_pos(self, pos: Tuple[int, int]) -> None:
+        self._libertar(self._corpo[0])
+        self._corpo[0] = pos
+        self._ocupar(pos)
+
+    def ligar_indice(self, indice) -> None:
+        """Passa a manter `indice` (IndiceCelulasLivres) a par das células do corpo."""
+        self.indice = indice
+        for pos in self._ocupacao:
+            indice.ocupar(pos)
+
+    # ── Estado (keyframes dos replays) ────────────────────────────────────────
+
+    def estado(self) -> dict:
+        """Corpo, direcção, crescimento pendente e buffer de input, em JSON."""
+        return {
+            "corpo":   [list(p) for p in self._corpo],
+            "direcao": list(self.direction),
+            "crescer": self.grow_next,
+            "buffer":  [list(d) for d in self._dir_buffer],
+        }
+
+    def repor_estado(self, dados: dict) -> None:
+        """
+        Repõe o estado guardado por estado(). Não toca no índice de células
+        livres — a simulação repõe-no inteiro, com a ordem original.
+        """
+        # Em sítio: `segments` é uma vista sobre estes dois objectos
+        self._corpo.clear()
+        self._corpo.extend(tuple(p) for p in dados["corpo"])
+        self._ocupacao.clear()
+        for pos in self._corpo:
+            self._ocupacao[pos] = self._ocupacao.get(pos, 0) + 1
+        self.direction = tuple(dados["direcao"])
+        self.grow_next = dados["crescer"]
+        self._dir_buffer.clear()
+        self._dir_buffer.extend(tuple(d) for d in dados["buffer"])
+
+    # ── Corpo (deque + ocupação sempre em sincronia) ──────────────────────────
+
+    def _empurrar_cabeca(self, pos: Pos) -> None:
+        self._corpo.appendleft(pos)
+        self._ocupar(pos)
+
+    def _remover_cauda(self) -> None:
+        self._libertar(self._corpo.pop())
+
+    def _ocupar(self, pos: Pos) -> None:
+        n = self._ocupacao.get(pos, 0)
+        self._ocupacao[pos] = n + 1
+        if not n and self.indice is not None:
+            self.indice.ocupar(pos)
+
+    def _libertar(self, pos: Pos) -> None:
+        n = self._ocupacao[pos] - 1
+        if n:
+            self._ocupacao[pos] = n
+        else:
+            del self._ocupacao[pos]
+            if self.indice is not None:
+                self.indice.libertar(pos)
@@ -0,0 +1,109 @@
+# src/game/sim/itens.py
+"""
+Lógica pura dos itens do mapa (comida e boosts) — sem pygame.
+
+game.entities.food.Food e game.entities.boost.Boost herdam destas classes
+e acrescentam apenas animação e desenho.
+
+spawn(ocupados, obstaculos) sorteia por rejeição e serve o uso avulso; as
+simulações ligam os itens a um IndiceCelulasLivres e colocam-nos directamente
+numa célula livre sorteada desse índice.
+"""
+from __future__ import annotations
+
+import random
+from typing import Optional, Tuple
+
+# Duração (em ticks lógicos) de cada tipo de boost
+DURACOES_BOOST: dict = {
+    "velocidade": 90,
+    "imunidade":  60,
+}
+
+
+def _sortear_livre(area, block, rng, occupied_positions, obstaculos_pixels):
+    """
+    Amostragem por rejeição de um bloco livre dentro de `area`.
+    Devolve a última tentativa como fallback de segurança.
+    """
+    x0, y0, w, h = area
+    cols = max(1, w // block)
+    rows = max(1, h // block)
+    last = None
+    for _ in range(500):
+        x    = x0 + rng.randint(0, cols - 1) * block
+        y    = y0 + rng.randint(0, rows - 1) * block
+        last = (x, y)
+        if (x, y) not in occupied_positions and (x, y) not in obstaculos_pixels:
+            return (x, y)
+    return last
+
+
+class _ItemGrelha:
+    """Posição de um item, opcionalmente registada num IndiceCelulasLivres."""
+
+    pos:    Optional[Tuple[int, int]] = None
+    indice = None
+
+    def colocar(self, pos: Optional[Tuple[int, int]]) -> None:
+        """Move o item para `pos` (None = fora do mapa), actualizando o índice."""
+        if self.indice is not None:
+            if self.pos is not None:
+                self.indice.libertar(self.pos)
+            if pos is not None:
+                self.indice.ocupar(pos)
+        self.pos = pos
+
+    def ligar_indice(self, indice) -> None:
+        self.indice = indice
+        if self.pos is not None:
+            indice.ocupar(self.pos)
+
+
+class ComidaLogica(_ItemGrelha):
+    """
+    Item de comida: apenas posição e spawn.
+
+    Parâmetros:
+        area_rect  — (x, y, w, h) da área de spawn
+        block_size — tamanho de um bloco em píxeis
+        rng        — gerador aleatório (por omissão: módulo `random`)
+    """
+
+    def __init__(self, area_rect, block_size: int, rng=None) -> None:
+        self.area  = area_rect
+        self.block = block_size
+        self._rng  = rng if rng is not None else random
+        self.pos: Optional[Tuple[int, int]] = None
+        self.spawn([])
+
+    def spawn(self, occupied_positions, obstaculos_pixels=None) -> None:
+        """Coloca a comida num bloco livre da grelha."""
+        if obstaculos_pixels is None:
+            obstaculos_pixels = ()
+        self.colocar(_sortear_livre(self.area, self.block, self._rng,
+                                    occupied_positions, obstaculos_pixels))
+
+
+class BoostLogica(_ItemGrelha):
+    """Item colecionável (velocidade ou imunidade): tipo, duração e posição."""
+
+    def __init__(self, tipo: str, area_rect, block_size, rng=None) -> None:
+        if tipo not in DURACOES_BOOST:
+            raise ValueError(
+                f"Tipo de boost desconhecido: '{tipo}'. Use: {list(DURACOES_BOOST)}")
+
+        self.tipo    = tipo
+        self.area    = area_rect
+        self.block   = block_size
+        self.duracao = DURACOES_BOOST[tipo]
+        self._rng    = rng if rng is not None else random
+
+        self.pos = None  # (x_px, y_px) — definido pelo spawn
+
+    def spawn(self, occupied_positions, obstaculos_pixels=None) -> None:
+        """Coloca o boost numa posição aleatória livre da grelha."""
+        if obstaculos_pixels is None:
+            obstaculos_pixels = ()
+        self.colocar(_sortear_livre(self.area, self.block, self._rng,
+                                    occupied_positions, obstaculos_pixels))
@@ -0,0 +1,265 @@
+# src/game/sim/lote.py
+"""
+Ambiente em lote: muitos tabuleiros independentes avançados de uma vez com NumPy.
+
+Pensado para afinação da IA e testes de capacidade — centenas de partidas
+OG Snake (1 cobra) ou Vs AI (2 cobras) num único step(acoes), com colisões,
+crescimento e respawn da comida vectorizados. Não depende de pygame.
+
+Representação (N tabuleiros, S cobras por tabuleiro, grelha H×W em blocos):
+  obst        (H, W)        bool   — obstáculos do mapa (Mapas._obst_set)
+  corpo       (N, S, H, W)  int32  — ticks que cada célula ainda fica ocupada
+  cab_x/cab_y (N, S)        int64  — cabeças
+  direcao     (N, S)        int8   — índice em DIRECOES
+  comprimento (N, S)        int32
+  comida_x/y  (N,)          int64
+
+Cada célula do corpo guarda o número de ticks que falta até a cauda passar
+por ela: a cabeça nova recebe o comprimento e, a cada tick sem crescimento,
+todas as células decrementam — a cauda liberta-se sozinha, sem listas.
+
+Regras (iguais às de game.sim.simulacao, salvo onde indicado):
+  - inversão de 180° é ignorada; acção -1 mantém a direcção
+  - mapas sem bordas completas fazem teleporte nas margens
+  - choque frontal entre duas cobras: morre a mais curta (ambas se empatadas)
+  - boosts do modo Vs AI não são simulados
+
+Uso::
+
+    env = AmbienteLote(Mapas("assets/mapas/arena.txt", auto_scale=False),
+                       n_tabuleiros=512, n_cobras=2, seed=7)
+    while True:
+        acoes = np.stack([politica(env), env.acoes_gulosas(1)], axis=1)
+        comeu, morreu, terminado = env.step(acoes)
+"""
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover — dependência opcional
+    raise ImportError("game.sim.lote requer NumPy (pip install numpy)") from e
+
+# Mesma ordem que game.sim.bot.TODAS_DIRECOES
+DIRECOES = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_DX      = np.array([d[0] for d in DIRECOES], dtype=np.int64)
+_DY      = np.array([d[1] for d in DIRECOES], dtype=np.int64)
+_OPOSTA  = np.array([1, 0, 3, 2], dtype=np.int8)
+
+_SPAWN_MIN_DIST: int = 4
+_PONTOS_COMIDA:  int = 10
+
+
+class AmbienteLote:
+    """
+    N tabuleiros do mesmo mapa avançados em simultâneo.
+
+    Parâmetros:
+        mapa         — instância de Mapas já carregada
+        n_tabuleiros — número de partidas independentes (N)
+        n_cobras     — 1 (OG Snake) ou 2 (Vs AI: jogador + bot)
+        seed         — semente do gerador NumPy (spawns de comida)
+        auto_reset   — reinicia sozinho os tabuleiros terminados no fim do step
+        limite_ticks — termina partidas que excedam este número de ticks
+    """
+
+    def __init__(self, mapa, n_tabuleiros: int, n_cobras: int = 1,
+                 seed: Optional[int] = None, auto_reset: bool = True,
+                 limite_ticks: Optional[int] = None) -> None:
+        if n_cobras not in (1, 2):
+            raise ValueError("n_cobras deve ser 1 ou 2")
+
+        self.N, self.S = int(n_tabuleiros), n_cobras
+        self.H, self.W = mapa.rows, mapa.cols
+        self.auto_reset   = auto_reset
+        self.limite_ticks = limite_ticks
+        self.wrap = not mapa.has_full_borders
+        self.rng  = np.random.default_rng(seed)
+
+        self.obst = np.zeros((self.H, self.W), dtype=bool)
+        for (x, y) in mapa._obst_set:
+            if 0 <= x < self.W and 0 <= y < self.H:
+                self.obst[y, x] = True
+
+        spawns = [mapa.spawn_snake_block, mapa.spawn_snake2_block]
+        fallback = [(self.W // 4, self.H // 2), (self.W * 3 // 4, self.H // 2)]
+        self._spawn_x = np.array([(spawns[s] or fallback[s])[0] for s in range(self.S)])
+        self._spawn_y = np.array([(spawns[s] or fallback[s])[1] for s in range(self.S)])
+
+        # Grelhas de coordenadas para a zona de exclusão (broadcast)
+        self._yy, self._xx = np.mgrid[0:self.H, 0:self.W]
+        self._b = np.arange(self.N)
+
+        N, S, H, W = self.N, self.S, self.H, self.W
+        self.corpo       = np.zeros((N, S, H, W), dtype=np.int32)
+        self.cab_x       = np.zeros((N, S), dtype=np.int64)
+        self.cab_y       = np.zeros((N, S), dtype=np.int64)
+        self.direcao     = np.zeros((N, S), dtype=np.int8)
+        self.comprimento = np.ones((N, S), dtype=np.int32)
+        self.crescer     = np.zeros((N, S), dtype=np.int32)
+        self.vivo        = np.ones((N, S), dtype=bool)
+        self.ativo       = np.ones(N, dtype=bool)
+        self.pontos      = np.zeros((N, S), dtype=np.int64)
+        self.ticks       = np.zeros(N, dtype=np.int64)
+        self.comida_x    = np.zeros(N, dtype=np.int64)
+        self.comida_y    = np.zeros(N, dtype=np.int64)
+
+        # Estatísticas acumuladas (úteis em testes de capacidade)
+        self.partidas_terminadas: int = 0
+        self.ticks_totais:        int = 0
+
+        self.reset()
+
+    # ── Reset ─────────────────────────────────────────────────────────────────
+
+    def reset(self, mascara: Optional[np.ndarray] = None) -> None:
+        """Reinicia os tabuleiros seleccionados (todos, se `mascara` for None)."""
+        idx = self._b if mascara is None else np.flatnonzero(mascara)
+        if idx.size == 0:
+            return
+        self.corpo[idx]       = 0
+        self.cab_x[idx]       = self._spawn_x
+        self.cab_y[idx]       = self._spawn_y
+        self.direcao[idx]     = 0
+        self.comprimento[idx] = 1
+        self.crescer[idx]     = 0
+        self.vivo[idx]        = True
+        self.ativo[idx]       = True
+        self.pontos[idx]      = 0
+        self.ticks[idx]       = 0
+        for s in range(self.S):
+            self.corpo[idx, s, self._spawn_y[s], self._spawn_x[s]] = 1
+        self._respawn_comida(idx)
+
+    # ── Step ──────────────────────────────────────────────────────────────────
+
+    def step(self, acoes) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Avança todos os tabuleiros um tick.
+
+        `acoes`: array (N,) ou (N, S) de índices em DIRECOES; -1 mantém a direcção.
+        Devolve (comeu (N,S), morreu (N,S), terminado (N,)); `terminado` marca
+        só as partidas que acabaram neste tick. Sem auto_reset, tabuleiros
+        terminados ficam congelados até reset().
+        """
+        N, S, H, W = self.N, self.S, self.H, self.W
+        b = self._b[:, None]
+        ativo = self.ativo[:, None]
+
+        a    = np.asarray(acoes, dtype=np.int8).reshape(N, S)
+        muda = (a >= 0) & (a != _OPOSTA[self.direcao]) & ativo
+        self.direcao = np.where(muda, a, self.direcao)
+
+        nx = self.cab_x + _DX[self.direcao]
+        ny = self.cab_y + _DY[self.direcao]
+        if self.wrap:
+            nx %= W
+            ny %= H
+            fora = np.zeros((N, S), dtype=bool)
+        else:
+            fora = (nx < 0) | (nx >= W) | (ny < 0) | (ny >= H)
+            np.clip(nx, 0, W - 1, out=nx)
+            np.clip(ny, 0, H - 1, out=ny)
+
+        # ── Cauda: decrementa (liberta) salvo se houver crescimento pendente ─
+        cresce = (self.crescer > 0) & ativo
+        self.crescer     -= cresce
+        self.comprimento += cresce
+        dec = (ativo & ~cresce)[:, :, None, None] & (self.corpo > 0)
+        self.corpo -= dec
+
+        # ── Colisões ─────────────────────────────────────────────────────────
+        ocupado = (self.corpo > 0).any(axis=1)                      # (N, H, W)
+        morreu  = fora | self.obst[ny, nx] | ocupado[b, ny, nx]
+        if S == 2:
+            frente = (nx[:, 0] == nx[:, 1]) & (ny[:, 0] == ny[:, 1])
+            vant   = self.comprimento[:, 1] - self.comprimento[:, 0]
+            morreu[:, 0] |= frente & (vant >= 0)
+            morreu[:, 1] |= frente & (vant <= 0)
+        morreu &= ativo
+
+        # ── Avanço da cabeça ─────────────────────────────────────────────────
+        vivos = ativo & ~morreu
+        self.cab_x = np.where(vivos, nx, self.cab_x)
+        self.cab_y = np.where(vivos, ny, self.cab_y)
+        bi, si = np.nonzero(vivos)
+        self.corpo[bi, si, ny[bi, si], nx[bi, si]] = self.comprimento[bi, si]
+
+        # ── Comida ───────────────────────────────────────────────────────────
+        comeu = (vivos
+                 & (nx == self.comida_x[:, None])
+                 & (ny == self.comida_y[:, None]))
+        self.crescer += comeu
+        self.pontos  += comeu * _PONTOS_COMIDA
+        cheio = np.zeros(N, dtype=bool)
+        com_respawn = comeu.any(axis=1)
+        if com_respawn.any():
+            cheio[com_respawn] = ~self._respawn_comida(np.flatnonzero(com_respawn))
+
+        # ── Fim de partida ───────────────────────────────────────────────────
+        self.vivo  &= ~morreu
+        self.ticks += self.ativo
+        terminado = morreu.any(axis=1) | cheio
+        if self.limite_ticks is not None:
+            terminado |= self.ticks >= self.limite_ticks
+        terminado &= self.ativo
+        self.ativo &= ~terminado
+
+        self.ticks_totais        += int(ativo.sum())
+        self.partidas_terminadas += int(terminado.sum())
+        if self.auto_reset and terminado.any():
+            self.reset(terminado)
+        return comeu, morreu, terminado
+
+    # ── Política de referência ────────────────────────────────────────────────
+
+    def acoes_gulosas(self, s: int = 0) -> np.ndarray:
+        """
+        Acção (N,) gulosa e segura para a cobra `s` de cada tabuleiro:
+        entre as direcções livres (sem inversão) escolhe a que mais se
+        aproxima da comida. Serve de bot de base para tabuleiros Vs AI.
+        """
+        N, H, W = self.N, self.H, self.W
+        cx = self.cab_x[:, s, None] + _DX[None, :]               # (N, 4)
+        cy = self.cab_y[:, s, None] + _DY[None, :]
+        if self.wrap:
+            cx %= W
+            cy %= H
+            dentro = np.ones((N, 4), dtype=bool)
+        else:
+            dentro = (cx >= 0) & (cx < W) & (cy >= 0) & (cy < H)
+            cx = np.clip(cx, 0, W - 1)
+            cy = np.clip(cy, 0, H - 1)
+
+        ocupado = (self.corpo > 1).any(axis=1)    # a cauda (1) liberta-se já
+        livre   = dentro & ~self.obst[cy, cx] & ~ocupado[self._b[:, None], cy, cx]
+        livre  &= np.arange(4)[None, :] != _OPOSTA[self.direcao[:, s]][:, None]
+
+        dist  = (np.abs(cx - self.comida_x[:, None])
+                 + np.abs(cy - self.comida_y[:, None]))
+        custo = np.where(livre, dist, dist + H * W * 4)
+        return custo.argmin(axis=1).astype(np.int8)
+
+    # ── Interno ───────────────────────────────────────────────────────────────
+
+    def _respawn_comida(self, idx: np.ndarray) -> np.ndarray:
+        """
+        Sorteia comida uniforme nas células livres de cada tabuleiro em `idx`,
+        evitando a zona de exclusão Manhattan em torno das cabeças sempre que
+        possível. Devolve (len(idx),) bool — False se o tabuleiro estiver cheio.
+        """
+        livre = ~self.obst[None] & ~(self.corpo[idx] > 0).any(axis=1)   # (k, H, W)
+
+        dist = (np.abs(self._yy[None, None] - self.cab_y[idx][:, :, None, None])
+                + np.abs(self._xx[None, None] - self.cab_x[idx][:, :, None, None]))
+        zona = (dist <= _SPAWN_MIN_DIST).any(axis=1)
+        permitido = livre & ~zona
+        sem_opcao = ~permitido.reshape(len(idx), -1).any(axis=1)
+        permitido[sem_opcao] = livre[sem_opcao]
+
+        r = self.rng.random(permitido.shape)
+        r[~permitido] = -1.0
+        flat = r.reshape(len(idx), -1).argmax(axis=1)
+        self.comida_y[idx], self.comida_x[idx] = np.divmod(flat, self.W)
+        return livre.reshape(len(idx), -1).any(axis=1)
@@ -0,0 +1,319 @@
+# src/game/sim/procura.py
+"""
+Núcleos de procura (A* e BFS) sobre índices planos de célula — sem pygame.
+
+Cada célula (x, y) da grelha é um inteiro  c = x * rows + y  (ordem por
+colunas: comparar ids é o mesmo que comparar os tuplos (x, y), pelo que os
+desempates do heap são iguais aos da versão com tuplos).
+
+  - Tabela de vizinhos pré-calculada por (cols, rows), partilhada entre
+    grelhas do mesmo tamanho, na ordem de TODAS_DIRECOES.
+  - g-scores, pais, visitados e bloqueios em buffers `array` alocados uma
+    vez; "limpar" um buffer é incrementar a geração (carimbo) — O(1).
+  - Custos por célula num array de doubles preparado pelo chamador;
+    INF marca uma célula intransitável (para o A* e para o BFS).
+  - Componentes ligadas do espaço livre rotuladas uma vez por estado de
+    bloqueios: "quanto espaço tenho a partir daqui" passa a ser uma consulta
+    O(1). Vectorizado com NumPy quando disponível (corridas por coluna +
+    union-find sobre as corridas), BFS simples caso contrário.
+
+Uso::
+
+    grelha = GrelhaProcura(cols, rows)
+    grelha.bloquear(ids_dos_corpos)           # uma vez por tick
+    caminho = grelha.astar(inicio, objetivo, custos)
+    espaco  = grelha.bfs_contar(inicio, limite, custos)
+    espaco  = grelha.tamanho_componente(inicio, custos)
+"""
+from __future__ import annotations
+
+import heapq
+from array import array
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover — dependência opcional
+    np = None
+
+COM_NUMPY: bool = np is not None
+
+INF = float("inf")
+
+# Carimbos em array("I"): recomeça antes de transbordar 32 bits
+_GERACAO_MAX = 0xFFFFFFFF
+
+# Mesma ordem que bot.TODAS_DIRECOES: (1,0), (-1,0), (0,1), (0,-1)
+_DIRECOES = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+@lru_cache(maxsize=None)
+def tabela_vizinhos(cols: int, rows: int) -> Tuple[Tuple[int, ...], ...]:
+    """Para cada id, os ids vizinhos dentro da grelha (ordem de _DIRECOES)."""
+    tabela = []
+    for x in range(cols):
+        for y in range(rows):
+            tabela.append(tuple(
+                (x + dx) * rows + (y + dy)
+                for dx, dy in _DIRECOES
+                if 0 <= x + dx < cols and 0 <= y + dy < rows
+            ))
+    return tuple(tabela)
+
+
+@lru_cache(maxsize=None)
+def _coordenadas(cols: int, rows: int) -> Tuple[array, array]:
+    """Arrays x e y de cada id (só leitura, partilhados)."""
+    n = cols * rows
+    return (array("i", (c // rows for c in range(n))),
+            array("i", (c % rows  for c in range(n))))
+
+
+class GrelhaProcura:
+    """Buffers de procura reutilizáveis para uma grelha cols × rows."""
+
+    def __init__(self, cols: int, rows: int) -> None:
+        n = cols * rows
+        self.cols     = cols
+        self.rows     = rows
+        self.n        = n
+        self.vizinhos = tabela_vizinhos(cols, rows)
+        self.xs, self.ys = _coordenadas(cols, rows)
+
+        self._g        = array("d", bytes(8 * n))
+        self._pai      = array("i", bytes(4 * n))
+        self._gen_g    = array("I", bytes(4 * n))
+        self._gen_vis  = array("I", bytes(4 * n))
+        self._gen_bloq = array("I", bytes(4 * n))
+        self._fila     = array("i", bytes(4 * n))
+        self._ger      = 0      # geração do A* / BFS
+        self._ger_bloq = 0      # geração dos bloqueios
+
+        # Nós expandidos pela última chamada (A*) / células contadas (BFS)
+        self.expandidos = 0
+
+        # Rótulos de componentes: válidos para (geração de bloqueios, custos)
+        self._rotulos        = None
+        self._tamanhos       = None
+        self._chave_rotulos  = None
+        self._custos_rotulos = None
+
+    # ── Conversões ────────────────────────────────────────────────────────────
+
+    def id(self, x: int, y: int) -> int:
+        return x * self.rows + y
+
+    def pos(self, c: int) -> Tuple[int, int]:
+        return divmod(c, self.rows)
+
+    def dentro(self, x: int, y: int) -> bool:
+        return 0 <= x < self.cols and 0 <= y < self.rows
+
+    # ── Bloqueios ─────────────────────────────────────────────────────────────
+
+    def bloquear(self, ids: Iterable[int]) -> None:
+        """Substitui o conjunto de células bloqueadas (O(len(ids)))."""
+        if self._ger_bloq >= _GERACAO_MAX:
+            self._gen_bloq = array("I", bytes(4 * self.n))
+            self._ger_bloq = 0
+        self._ger_bloq += 1
+        ger, bloq = self._ger_bloq, self._gen_bloq
+        for c in ids:
+            bloq[c] = ger
+
+    def bloqueada(self, c: int) -> bool:
+        return self._gen_bloq[c] == self._ger_bloq
+
+    def _nova_geracao(self) -> int:
+        if self._ger >= _GERACAO_MAX:
+            self._gen_g   = array("I", bytes(4 * self.n))
+            self._gen_vis = array("I", bytes(4 * self.n))
+            self._ger     = 0
+        self._ger += 1
+        return self._ger
+
+    # ── A* ────────────────────────────────────────────────────────────────────
+
+    def astar(self, inicio: int, objetivo: int, custos,
+              evitar: Iterable[int] = ()) -> Optional[List[int]]:
+        """
+        Caminho de custo mínimo de `inicio` a `objetivo` (ids, ambos incluídos)
+        ou None. Não entra em células bloqueadas, com custo INF ou em `evitar`.
+        """
+        ger              = self._nova_geracao()
+        g, pai, gen_g    = self._g, self._pai, self._gen_g
+        bloq, ger_bloq   = self._gen_bloq, self._ger_bloq
+        vizinhos, xs, ys = self.vizinhos, self.xs, self.ys
+        ox, oy           = xs[objetivo], ys[objetivo]
+        push, pop        = heapq.heappush, heapq.heappop
+
+        # Células a evitar: g = -1 nunca é melhorado
+        for c in evitar:
+            gen_g[c] = ger
+            g[c]     = -1.0
+
+        gen_g[inicio] = ger
+        g[inicio]     = 0.0
+        pai[inicio]   = -1
+        heap          = [(abs(xs[inicio] - ox) + abs(ys[inicio] - oy), 0.0, inicio)]
+        expandidos    = 0
+
+        while heap:
+            _, ga, atual = pop(heap)
+            expandidos += 1
+            if atual == objetivo:
+                self.expandidos = expandidos
+                caminho = []
+                while atual != -1:
+                    caminho.append(atual)
+                    atual = pai[atual]
+                caminho.reverse()
+                return caminho
+            if ga > g[atual]:
+                continue
+            for viz in vizinhos[atual]:
+                if bloq[viz] == ger_bloq:
+                    continue
+                ng = ga + custos[viz]
+                if gen_g[viz] != ger:
+                    if ng == INF:
+                        continue
+                    gen_g[viz] = ger
+                elif ng >= g[viz]:
+                    continue
+                g[viz]   = ng
+                pai[viz] = atual
+                push(heap, (ng + abs(xs[viz] - ox) + abs(ys[viz] - oy), ng, viz))
+
+        self.expandidos = expandidos
+        return None
+
+    # ── BFS ───────────────────────────────────────────────────────────────────
+
+    def bfs_contar(self, inicio: int, limite: int, custos) -> int:
+        """
+        Células alcançáveis a partir de `inicio` sem passar por bloqueadas
+        (ou de custo INF), parando ao chegar a `limite`. 0 se `inicio` o for.
+        """
+        bloq, ger_bloq = self._gen_bloq, self._ger_bloq
+        if bloq[inicio] == ger_bloq or custos[inicio] == INF:
+            self.expandidos = 0
+            return 0
+
+        ger      = self._nova_geracao()
+        vis      = self._gen_vis
+        fila     = self._fila
+        vizinhos = self.vizinhos
+
+        vis[inicio] = ger
+        fila[0]     = inicio
+        cabeca, cauda = 0, 1
+        while cabeca < cauda:
+            atual   = fila[cabeca]
+            cabeca += 1
+            if cabeca >= limite:
+                break
+            for viz in vizinhos[atual]:
+                if bloq[viz] == ger_bloq or vis[viz] == ger or custos[viz] == INF:
+                    continue
+                vis[viz]    = ger
+                fila[cauda] = viz
+                cauda      += 1
+
+        self.expandidos = cabeca
+        return cabeca
+
+    # ── Componentes ligadas ───────────────────────────────────────────────────
+
+    def tamanho_componente(self, c: int, custos) -> int:
+        """
+        Nº de células livres ligadas a `c` (0 se `c` estiver bloqueada).
+
+        A primeira consulta depois de bloquear() rotula a grelha inteira; as
+        seguintes são O(1). `custos` não pode ser alterado no lugar entre
+        consultas — passar um array novo invalida os rótulos.
+        """
+        if self._chave_rotulos != self._ger_bloq or self._custos_rotulos is not custos:
+            self._rotular(custos)
+        else:
+            self.expandidos = 0
+        r = self._rotulos[c]
+        return self._tamanhos[r] if r >= 0 else 0
+
+    def _rotular(self, custos) -> None:
+        self._chave_rotulos  = self._ger_bloq
+        self._custos_rotulos = custos
+        if np is not None:
+            self._rotular_numpy(custos)
+        else:
+            self._rotular_bfs(custos)
+        self.expandidos = self.n
+
+    def _rotular_numpy(self, custos) -> None:
+        """Corridas verticais de células livres unidas por union-find."""
+        n, rows = self.n, self.rows
+        bloq    = np.frombuffer(self._gen_bloq, dtype=np.uint32) == self._ger_bloq
+        if isinstance(custos, array):
+            custo = np.frombuffer(custos, dtype=np.float64)
+        else:
+            custo = np.asarray(custos, dtype=np.float64)
+        livre = ~bloq & (custo != INF)
+
+        # Corridas de células livres consecutivas dentro de cada coluna
+        inicio        = livre.copy()
+        inicio[1:]   &= ~livre[:-1]
+        inicio[::rows] = livre[::rows]
+        corrida       = np.cumsum(inicio) - 1
+        n_corridas    = int(corrida[-1]) + 1 if n else 0
+
+        # Corridas de colunas vizinhas que se tocam → mesma componente.
+        # Só o primeiro contacto de cada troço conta (o par repete-se ao
+        # longo do troço), o que deixa poucas dezenas de pares para o
+        # union-find.
+        ambos         = livre[:-rows] & livre[rows:]
+        primeiro      = ambos.copy()
+        primeiro[1:] &= ~ambos[:-1]
+        primeiro[::rows] = ambos[::rows]
+        pai = list(range(n_corridas))
+
+        def raiz(r):
+            while pai[r] != r:
+                pai[r] = pai[pai[r]]
+                r = pai[r]
+            return r
+
+        for a, b in zip(corrida[:-rows][primeiro].tolist(),
+                        corrida[rows:][primeiro].tolist()):
+            ra, rb = raiz(a), raiz(b)
+            if ra != rb:
+                if ra < rb: pai[rb] = ra
+                else:       pai[ra] = rb
+
+        # Rótulo de cada célula = a sua corrida; tamanho = o da componente
+        por_corrida = np.bincount(corrida[livre], minlength=n_corridas).tolist()
+        soma        = [0] * n_corridas
+        for r, t in enumerate(por_corrida):
+            soma[raiz(r)] += t
+        self._rotulos  = np.where(livre, corrida, -1).tolist()
+        self._tamanhos = [soma[raiz(r)] for r in range(n_corridas)]
+
+    def _rotular_bfs(self, custos) -> None:
+        bloq, ger_bloq = self._gen_bloq, self._ger_bloq
+        vizinhos       = self.vizinhos
+        rotulos        = [-1] * self.n
+        tamanhos: List[int] = []
+        for origem in range(self.n):
+            if rotulos[origem] >= 0 or bloq[origem] == ger_bloq or custos[origem] == INF:
+                continue
+            r = len(tamanhos)
+            rotulos[origem] = r
+            fila = [origem]
+            for atual in fila:
+                for viz in vizinhos[atual]:
+                    if (rotulos[viz] < 0 and bloq[viz] != ger_bloq
+                            and custos[viz] != INF):
+                        rotulos[viz] = r
+                        fila.append(viz)
+            tamanhos.append(len(fila))
+        self._rotulos, self._tamanhos = rotulos, tamanhos
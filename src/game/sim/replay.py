@@ -0,0 +1,387 @@
+# src/game/sim/replay.py
+"""
+Replays determinísticos — sem pygame.
+
+Uma partida fica totalmente determinada pela seed (rng dos spawns), pelo
+mapa e pela sequência de direcções enfileiradas em cada tick lógico. O
+GravadorReplay liga-se a uma simulação (sim.gravador) e guarda só isso;
+o ReprodutorReplay volta a correr a simulação tick a tick, em headless
+(à velocidade máxima) ou a alimentar o modo de jogo no ecrã.
+
+Formato binário (little-endian):
+
+    cabeçalho   "<4sHHQII"  magic b"SNKR", versão, intervalo de keyframes,
+                            seed, nº de ticks, nº de keyframes
+    meta        u32 + zlib(JSON)    modo, dificuldade, nomes, mapa completo…
+    entradas    u32 + zlib(bytes)   por tick: n em varint (LEB128), seguido de
+                                    n bytes (índice do jogador << 2 | índice da
+                                    direcção); na versão 1, n era um só byte
+    keyframes   n × "<III"          (tick, offset nas entradas, hash do estado)
+    estados     u32 + zlib(JSON)    estado da simulação em cada keyframe
+                                    (só a partir da versão 3)
+
+Um tick sem input ocupa 1 byte antes da compressão, e não há limite de
+direcções por tick (todas as que a simulação aplicou ficam gravadas). Os
+keyframes indexam o fluxo de entradas e guardam um hash do estado: o
+reprodutor verifica-os (detecta dessincronização). Cada keyframe leva
+também o estado da simulação (Simulacao.estado(): corpos, buffers de
+input, itens, boosts, pontuações, rng, plano do bot), pelo que
+procurar(tick) recomeça do keyframe mais próximo mesmo num replay acabado
+de carregar; os keyframes já visitados ficam ainda em snapshot na memória.
+
+Uso headless::
+
+    rep = ReprodutorReplay(Replay.carregar("partida.snkr"))
+    rep.correr()                 # até ao fim, o mais depressa possível
+    sim = rep.procurar(5000)     # estado depois do tick 5000
+"""
+from __future__ import annotations
+
+import bisect
+import copy
+import json
+import random
+import struct
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from game.core.score    import Score
+from game.maps.map      import Mapas
+from game.sim.simulacao import criar_simulacao
+
+MAGIC  = b"SNKR"
+VERSAO = 3
+
+# Versões que ainda se conseguem ler (a 1 guardava n num só byte; a 1 e a 2
+# não têm estados nos keyframes, e procurar() nelas parte do tick 0)
+_VERSOES_LIDAS = (1, 2, 3)
+
+_CABECALHO = struct.Struct("<4sHHQII")
+_TAMANHO   = struct.Struct("<I")
+_KEYFRAME  = struct.Struct("<III")
+
+# Ticks entre keyframes (~40 s a 7 ticks lógicos por segundo)
+INTERVALO_KEYFRAMES: int = 300
+
+# Códigos de 1 byte: jogador nos bits 2+, direcção nos bits 0–1
+JOGADORES = ("p1", "p2", "bot")
+DIRECOES  = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_COD_JOGADOR = {q: i for i, q in enumerate(JOGADORES)}
+_COD_DIRECAO = {d: i for i, d in enumerate(DIRECOES)}
+
+Keyframe = Tuple[int, int, int]   # (tick, offset, hash)
+
+
+class ReplayInvalido(ValueError):
+    """Ficheiro que não é um replay ou de uma versão desconhecida."""
+
+
+def hash_estado(sim) -> int:
+    """CRC32 do estado lógico (cobras, itens, pontuação, rng) — para detectar dessincronização."""
+    estado = (
+        sim.tick,
+        [(q, tuple(c.segments), c.direction, c.grow_next) for q, c in sim.cobras.items()],
+        [item.pos for item in sim.itens()],
+        sim.score.obter_pontuacao(),
+        sim.rng.getstate(),
+    )
+    return zlib.crc32(repr(estado).encode())
+
+
+def _escrever_varint(destino: bytearray, n: int) -> None:
+    """Inteiro ≥ 0 em LEB128: 7 bits por byte, bit 7 = continua."""
+    while n >= 0x80:
+        destino.append(n & 0x7F | 0x80)
+        n >>= 7
+    destino.append(n)
+
+
+def _ler_varint(dados: bytes, pos: int) -> Tuple[int, int]:
+    """(valor, posição seguinte) de um varint LEB128 em `dados[pos:]`."""
+    n = desloc = 0
+    while True:
+        b = dados[pos]
+        pos += 1
+        n |= (b & 0x7F) << desloc
+        if b < 0x80:
+            return n, pos
+        desloc += 7
+
+
+# ── Replay (dados) ────────────────────────────────────────────────────────────
+
+class Replay:
+    """Seed, metadados e entradas de uma partida."""
+
+    def __init__(self, seed: int, meta: dict, entradas: bytes = b"",
+                 n_ticks: int = 0, keyframes: Optional[List[Keyframe]] = None,
+                 intervalo: int = INTERVALO_KEYFRAMES, versao: int = VERSAO,
+                 estados: Optional[List[dict]] = None) -> None:
+        self.seed      = seed
+        self.meta      = meta
+        self.entradas  = entradas
+        self.n_ticks   = n_ticks
+        self.keyframes = keyframes or []
+        self.intervalo = intervalo
+        self.versao    = versao       # formato das entradas (ver ler_contagem)
+        self.estados   = estados or []  # Simulacao.estado() de cada keyframe (v3+)
+
+    def ler_contagem(self, pos: int) -> Tuple[int, int]:
+        """Nº de direcções do tick que começa em `pos` e onde começam os seus códigos."""
+        if self.versao == 1:
+            return self.entradas[pos], pos + 1
+        return _ler_varint(self.entradas, pos)
+
+    def n_direcoes(self) -> int:
+        """Total de direcções gravadas (percorre o fluxo de entradas)."""
+        total, pos = 0, 0
+        while pos < len(self.entradas):
+            n, pos = self.ler_contagem(pos)
+            total += n
+            pos   += n
+        return total
+
+    # ── Simulação ─────────────────────────────────────────────────────────────
+
+    def criar_mapa(self) -> Mapas:
+        return Mapas.de_dados(self.meta["mapa"], block_size=self.meta["block"])
+
+    def criar_simulacao(self, mapa: Optional[Mapas] = None, **kwargs):
+        """Simulação headless no estado do tick 0."""
+        meta = self.meta
+        kw = dict(area_rect=tuple(meta["area"]), block=meta["block"],
+                  score=Score(multiplicador=meta["multiplicador"]),
+                  rng=random.Random(self.seed))
+        if "nome_p1" in meta:
+            kw["nome_p1"] = meta["nome_p1"]
+        kw.update(kwargs)
+        return criar_simulacao(meta["modo"], mapa or self.criar_mapa(), **kw)
+
+    # ── Ficheiro ──────────────────────────────────────────────────────────────
+
+    def para_bytes(self) -> bytes:
+        meta     = zlib.compress(json.dumps(self.meta, separators=(",", ":")).encode("utf-8"), 9)
+        entradas = zlib.compress(self.entradas, 9)
+        partes   = [
+            _CABECALHO.pack(MAGIC, self.versao, self.intervalo, self.seed,
+                            self.n_ticks, len(self.keyframes)),
+            _TAMANHO.pack(len(meta)), meta,
+            _TAMANHO.pack(len(entradas)), entradas,
+        ]
+        partes.extend(_KEYFRAME.pack(*k) for k in self.keyframes)
+        if self.versao >= 3:
+            estados = json.dumps(self.estados, separators=(",", ":")).encode("utf-8")
+            estados = zlib.compress(estados, 9)
+            partes += [_TAMANHO.pack(len(estados)), estados]
+        return b"".join(partes)
+
+    @classmethod
+    def de_bytes(cls, dados: bytes) -> "Replay":
+        try:
+            magic, versao, intervalo, seed, n_ticks, n_kf = _CABECALHO.unpack_from(dados, 0)
+        except struct.error as e:
+            raise ReplayInvalido("Ficheiro de replay truncado") from e
+        if magic != MAGIC:
+            raise ReplayInvalido("Não é um ficheiro de replay")
+        if versao not in _VERSOES_LIDAS:
+            raise ReplayInvalido(f"Versão de replay não suportada: {versao}")
+
+        pos = _CABECALHO.size
+        blocos = []
+        for _ in range(2):
+            (n,) = _TAMANHO.unpack_from(dados, pos)
+            pos += _TAMANHO.size
+            blocos.append(zlib.decompress(dados[pos:pos + n]))
+            pos += n
+        keyframes = [_KEYFRAME.unpack_from(dados, pos + i * _KEYFRAME.size)
+                     for i in range(n_kf)]
+        estados = None
+        if versao >= 3:
+            pos += n_kf * _KEYFRAME.size
+            (n,) = _TAMANHO.unpack_from(dados, pos)
+            pos += _TAMANHO.size
+            estados = json.loads(zlib.decompress(dados[pos:pos + n]).decode("utf-8"))
+        return cls(seed, json.loads(blocos[0].decode("utf-8")), blocos[1],
+                   n_ticks, keyframes, intervalo, versao, estados)
+
+    def guardar(self, caminho: str) -> None:
+        with open(caminho, "wb") as f:
+            f.write(self.para_bytes())
+
+    @classmethod
+    def carregar(cls, caminho: str) -> "Replay":
+        with open(caminho, "rb") as f:
+            return cls.de_bytes(f.read())
+
+
+# ── Gravação ──────────────────────────────────────────────────────────────────
+
+class GravadorReplay:
+    """
+    Liga-se a uma simulação (sim.gravador = gravador): a simulação chama
+    entrada() em cada enfileirar() e fim_tick() no fim de cada step().
+    """
+
+    def __init__(self, seed: int, meta: dict,
+                 intervalo: int = INTERVALO_KEYFRAMES) -> None:
+        self.seed      = seed
+        self.meta      = meta
+        self.intervalo = intervalo
+        self._entradas = bytearray()
+        self._pendentes: List[int] = []
+        self._keyframes: List[Keyframe] = []
+        self._estados:   List[dict]     = []
+        self.n_ticks   = 0
+
+    def entrada(self, quem: str, direcao) -> None:
+        # Sem limite por tick: enquanto a simulação espera (pronto/countdown)
+        # as teclas acumulam-se e todas chegaram a set_direction()
+        cod = _COD_DIRECAO.get(tuple(direcao))
+        if cod is not None and quem in _COD_JOGADOR:
+            self._pendentes.append(_COD_JOGADOR[quem] << 2 | cod)
+
+    def fim_tick(self, sim) -> None:
+        _escrever_varint(self._entradas, len(self._pendentes))
+        self._entradas.extend(self._pendentes)
+        self._pendentes.clear()
+        self.n_ticks += 1
+        if self.n_ticks % self.intervalo == 0:
+            self._keyframes.append((self.n_ticks, len(self._entradas), hash_estado(sim)))
+            self._estados.append(sim.estado())
+
+    def para_replay(self) -> Replay:
+        return Replay(self.seed, self.meta, bytes(self._entradas), self.n_ticks,
+                      list(self._keyframes), self.intervalo,
+                      estados=list(self._estados))
+
+
+# ── Reprodução ────────────────────────────────────────────────────────────────
+
+class ReprodutorReplay:
+    """
+    Reproduz um Replay numa simulação.
+
+    Sem `sim` cria uma simulação headless e avancar()/correr()/procurar()
+    fazem tudo. Com a `sim` de um modo de jogo no ecrã, o modo chama
+    enfileirar_proximo() antes de cada step() e verificar() depois.
+    """
+
+    def __init__(self, replay: Replay, sim=None) -> None:
+        self.replay   = replay
+        self.headless = sim is None
+        self._mapa    = replay.criar_mapa() if sim is None else sim.mapa
+        self.sim      = sim if sim is not None else replay.criar_simulacao(self._mapa)
+        self._offset  = 0
+        self._kf_ticks = [k[0] for k in replay.keyframes]
+        self._kf       = {k[0]: k for k in replay.keyframes}
+
+        # tick → (cópia da simulação, offset); o tick 0 serve sempre de ponto de partida
+        self._snapshots: Dict[int, tuple] = {}
+        # tick → estado gravado no ficheiro, ainda por passar a snapshot
+        self._estados:   Dict[int, dict]  = {}
+        if self.headless:
+            self._snapshots[0] = (self._copiar(self.sim), 0)
+            self._estados = {k[0]: e for k, e in zip(replay.keyframes, replay.estados)}
+
+        # Primeiro tick em que o hash não bateu certo (None = sincronizado)
+        self.dessincronizado: Optional[int] = None
+
+    @property
+    def tick(self) -> int:
+        return self.sim.tick
+
+    @property
+    def fim(self) -> bool:
+        return self.sim.tick >= self.replay.n_ticks or self.sim.terminado
+
+    # ── Passo a passo ─────────────────────────────────────────────────────────
+
+    def enfileirar_proximo(self) -> None:
+        """Enfileira na simulação as direcções gravadas para o próximo tick."""
+        dados, pos = self.replay.entradas, self._offset
+        if pos >= len(dados):
+            return
+        n, pos = self.replay.ler_contagem(pos)
+        for cod in dados[pos:pos + n]:
+            self.sim.enfileirar(JOGADORES[cod >> 2], DIRECOES[cod & 3])
+        self._offset = pos + n
+
+    def verificar(self) -> None:
+        """Depois de um step(): compara com o keyframe gravado, se houver."""
+        kf = self._kf.get(self.sim.tick)
+        if kf is None:
+            return
+        if kf[1] != self._offset or kf[2] != hash_estado(self.sim):
+            if self.dessincronizado is None:
+                self.dessincronizado = self.sim.tick
+        elif self.headless and self.sim.tick not in self._snapshots:
+            self._snapshots[self.sim.tick] = (self._copiar(self.sim), self._offset)
+
+    def avancar(self) -> list:
+        """Um tick lógico (headless). Devolve os eventos da simulação."""
+        self.enfileirar_proximo()
+        eventos = self.sim.step()
+        self.verificar()
+        return eventos
+
+    def correr(self, ate: Optional[int] = None) -> int:
+        """Avança até ao tick `ate` (ou ao fim) sem render; devolve o tick final."""
+        alvo = self.replay.n_ticks if ate is None else min(ate, self.replay.n_ticks)
+        while self.sim.tick < alvo and not self.sim.terminado:
+            self.avancar()
+        return self.sim.tick
+
+    # ── Procura ───────────────────────────────────────────────────────────────
+
+    def procurar(self, tick: int):
+        """
+        Põe a simulação no estado depois de `tick` e devolve-a. Recomeça do
+        keyframe mais próximo antes de `tick` — snapshot em memória ou estado
+        gravado no ficheiro — ou continua do estado actual, se estiver mais
+        perto; os keyframes ainda não visitados geram snapshots pelo caminho.
+        """
+        if not self.headless:
+            raise RuntimeError("procurar() só está disponível em reprodução headless")
+        tick = max(0, min(tick, self.replay.n_ticks))
+        while True:
+            base = max(t for t in (*self._snapshots, *self._estados) if t <= tick)
+            if base <= self.sim.tick <= tick:
+                return self._correr_ate(tick)
+            if base in self._snapshots or self._repor_keyframe(base):
+                break
+        copia, offset = self._snapshots[base]
+        self.sim     = self._copiar(copia)
+        self._offset = offset
+        return self._correr_ate(tick)
+
+    def keyframe_anterior(self, tick: int) -> int:
+        """Tick do último keyframe gravado ≤ `tick` (0 se nenhum)."""
+        i = bisect.bisect_right(self._kf_ticks, tick)
+        return self._kf_ticks[i - 1] if i else 0
+
+    def _repor_keyframe(self, tick: int) -> bool:
+        """
+        Passa o estado gravado no keyframe `tick` a snapshot. Um estado ilegível
+        ou que não reproduz o hash do keyframe é descartado (False) — procurar()
+        recua então para o anterior.
+        """
+        estado = self._estados.pop(tick)
+        sim    = self.replay.criar_simulacao(self._mapa)
+        kf     = self._kf[tick]
+        try:
+            sim.repor_estado(estado)
+        except (KeyError, IndexError, TypeError, ValueError):
+            return False
+        if hash_estado(sim) != kf[2]:
+            return False
+        self._snapshots[tick] = (sim, kf[1])
+        return True
+
+    def _correr_ate(self, tick: int):
+        while self.sim.tick < tick and not self.sim.terminado:
+            self.avancar()
+        return self.sim
+
+    def _copiar(self, sim):
+        # O mapa é só de leitura — partilhado entre cópias
+        return copy.deepcopy(sim, {id(self._mapa): self._mapa})
@@ -0,0 +1,548 @@
+# src/game/sim/simulacao.py
+"""
+Núcleo de simulação headless dos modos de jogo.
+
+Cada simulação guarda o estado completo de uma partida (cobras, comida,
+boosts, pontuação) e avança um tick lógico por chamada a step(entradas),
+sem pygame, sem janela e sem relógio de parede. Os modos em game.modes
+envolvem estas classes e traduzem os eventos devolvidos em partículas,
+screen shake, HUD e ecrãs de fim.
+
+Uso headless::
+
+    from game.maps.map      import Mapas
+    from game.sim.simulacao import SimulacaoOg
+
+    sim = SimulacaoOg(Mapas("assets/mapas/arena.txt", auto_scale=False),
+                      rng=random.Random(42))
+    while not sim.terminado:
+        sim.step({"p1": (0, -1)})
+"""
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import game.config as cfg
+from game.core.score import Score
+from game.sim.celulas_livres import IndiceCelulasLivres
+from game.sim.cobra          import CobraLogica
+from game.sim.itens          import BoostLogica, ComidaLogica, DURACOES_BOOST
+
+_SPAWN_MIN_DIST: int = 4
+
+# Tipos de evento devolvidos por step()
+EV_COMER: str = "comer"
+EV_BOOST: str = "boost"
+EV_MORTE: str = "morte"
+
+Direcao = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class Evento:
+    """Algo que aconteceu num tick e que a camada de apresentação pode mostrar."""
+    tipo:  str                             # EV_COMER | EV_BOOST | EV_MORTE
+    quem:  str                             # "p1" | "p2" | "bot"
+    pos:   Optional[Tuple[int, int]] = None
+    extra: str = ""                        # tipo de boost em EV_BOOST
+
+
+class SimulacaoBase:
+    """
+    Estado + regras comuns a todos os modos.
+
+    Parâmetros:
+        mapa           — instância de Mapas já carregada
+        area_rect      — (x, y, w, h) da área de spawn (por omissão: ecrã de jogo)
+        block          — tamanho do bloco em píxeis (por omissão: mapa.block)
+        score          — Score do jogador 1 (por omissão: novo Score)
+        rng            — random.Random usado em todos os spawns
+        fabrica_cobra  — classe das cobras  (CobraLogica ou Snake)
+        fabrica_comida — classe da comida   (ComidaLogica ou Food)
+        fabrica_boost  — classe dos boosts  (BoostLogica ou Boost)
+
+    As fábricas permitem aos modos com render usar as entidades desenháveis
+    sem duplicar estado; em modo headless ficam as versões puras.
+
+    `livres` é o índice de células livres da área de spawn: obstáculos,
+    cobras e itens registam-se nele e actualizam-no a cada movimento, pelo
+    que cada spawn é um sorteio O(1) em vez de amostragem por rejeição.
+    """
+
+    def __init__(self, mapa, area_rect=None, block: Optional[int] = None,
+                 score: Optional[Score] = None, rng=None,
+                 fabrica_cobra=CobraLogica, fabrica_comida=ComidaLogica,
+                 fabrica_boost=BoostLogica) -> None:
+        self.mapa  = mapa
+        self.block = block or mapa.block
+        self.area  = area_rect or (0, 0, cfg.SCREEN_WIDTH, cfg.SCREEN_HEIGHT)
+        self.score = score if score is not None else Score()
+        self.rng   = rng if rng is not None else random.Random()
+
+        self._fabrica_cobra  = fabrica_cobra
+        self._fabrica_comida = fabrica_comida
+        self._fabrica_boost  = fabrica_boost
+
+        self.cobras: Dict[str, CobraLogica] = {}
+        self.tick:      int  = 0
+        self.terminado: bool = False
+        self.resultado: str  = ""
+        self._eventos: List[Evento] = []
+
+        self.livres = IndiceCelulasLivres(self.area, self.block)
+        self.livres.ocupar_varios(mapa.obstaculos_pixels())
+
+        # GravadorReplay opcional (game.sim.replay): recebe cada entrada e tick
+        self.gravador = None
+
+    # ── API pública ───────────────────────────────────────────────────────────
+
+    def enfileirar(self, quem: str, direcao: Direcao) -> bool:
+        """Enfileira uma direcção no buffer de input da cobra `quem` (False se rejeitada)."""
+        if self.gravador is not None:
+            self.gravador.entrada(quem, direcao)
+        return self.cobras[quem].set_direction(*direcao)
+
+    def step(self, entradas: Optional[Dict[str, Optional[Direcao]]] = None) -> List[Evento]:
+        """
+        Avança um tick lógico.
+
+        `entradas` mapeia "p1"/"p2"/... para uma direcção (ou None) que é
+        enfileirada antes de mover. Devolve os eventos ocorridos no tick.
+        """
+        if self.terminado:
+            return []
+        self._eventos = []
+        if entradas:
+            for quem, direcao in entradas.items():
+                if direcao is not None:
+                    self.enfileirar(quem, direcao)
+        self._avancar()
+        self.tick += 1
+        if self.gravador is not None:
+            self.gravador.fim_tick(self)
+        return self._eventos
+
+    # ── Estado (keyframes dos replays) ────────────────────────────────────────
+
+    def estado(self) -> dict:
+        """
+        Estado lógico completo em JSON: com repor_estado() numa simulação
+        nova do mesmo replay, os ticks seguintes saem iguais aos originais.
+        """
+        versao, interno, gauss = self.rng.getstate()
+        return {
+            "tick":      self.tick,
+            "terminado": self.terminado,
+            "resultado": self.resultado,
+            "pontos":    self.score.pontos,
+            "rng":       [versao, list(interno), gauss],
+            "cobras":    {q: c.estado() for q, c in self.cobras.items()},
+            "itens":     [list(i.pos) if i.pos else None for i in self.itens()],
+            "livres":    self.livres.estado(),
+        }
+
+    def repor_estado(self, dados: dict) -> None:
+        self.tick         = dados["tick"]
+        self.terminado    = dados["terminado"]
+        self.resultado    = dados["resultado"]
+        self.score.pontos = dados["pontos"]
+        versao, interno, gauss = dados["rng"]
+        self.rng.setstate((versao, tuple(interno), gauss))
+        for quem, cobra in dados["cobras"].items():
+            self.cobras[quem].repor_estado(cobra)
+        # Directo em .pos: o índice é reposto inteiro a seguir
+        for item, pos in zip(self.itens(), dados["itens"]):
+            item.pos = tuple(pos) if pos else None
+        self.livres.repor_estado(dados["livres"])
+
+    # ── Criação de entidades ──────────────────────────────────────────────────
+
+    def _nova_cobra(self, player_num: int) -> CobraLogica:
+        cobra = self._fabrica_cobra(self.mapa.obter_spawn_player(player_num),
+                                    self.block)
+        cobra.ligar_indice(self.livres)
+        return cobra
+
+    def _nova_comida(self) -> ComidaLogica:
+        comida = self._fabrica_comida(self.area, self.block, rng=self.rng)
+        comida.ligar_indice(self.livres)
+        return comida
+
+    def _novo_boost(self, tipo: str) -> BoostLogica:
+        boost = self._fabrica_boost(tipo, self.area, self.block, rng=self.rng)
+        boost.ligar_indice(self.livres)
+        return boost
+
+    # ── Spawn seguro ──────────────────────────────────────────────────────────
+
+    def itens(self) -> list:
+        """Itens presentes no mapa (comida e boosts)."""
+        return []
+
+    def _snake_heads(self) -> List[Tuple[int, int]]:
+        return [c.head_pos() for c in self.cobras.values()]
+
+    def food_spawn_safe(self, food_obj) -> None:
+        """
+        Spawn que evita cobras, outros itens e obstáculos (já fora do índice)
+        e a zona de exclusão — losango de Manhattan de raio _SPAWN_MIN_DIST
+        à volta de cada cabeça, aplicado como filtro ao sorteio.
+        """
+        food_obj.colocar(self.livres.sortear(
+            self.rng, longe_de=self._snake_heads(), raio=_SPAWN_MIN_DIST))
+
+    # ── Hooks de subclasse ────────────────────────────────────────────────────
+
+    def _avancar(self) -> None:
+        raise NotImplementedError
+
+    def _emitir(self, tipo: str, quem: str, pos=None, extra: str = "") -> None:
+        self._eventos.append(Evento(tipo, quem, pos, extra))
+
+
+# ── OG Snake ──────────────────────────────────────────────────────────────────
+
+class SimulacaoOg(SimulacaoBase):
+    """Modo clássico de um jogador."""
+
+    def __init__(self, mapa, **kwargs) -> None:
+        super().__init__(mapa, **kwargs)
+        self.snake = self._nova_cobra(1)
+        self.cobras["p1"] = self.snake
+        self.foods = [self._nova_comida()]
+        self.food_spawn_safe(self.foods[0])
+
+    def itens(self) -> list:
+        return self.foods
+
+    def _avancar(self) -> None:
+        self.snake.update()
+        head = self.snake.head_pos()
+
+        res = self.mapa.verificar_colisao(head)
+        if res is True:
+            self._morrer(); return
+        if isinstance(res, tuple):
+            self.snake.set_head_pos(res)
+
+        if self.snake.collides_self():
+            self._morrer(); return
+
+        for comida in self.foods:
+            if head == comida.pos:
+                self.snake.grow()
+                self.score.adicionar_pontos(10)
+                self._emitir(EV_COMER, "p1", comida.pos)
+                self.food_spawn_safe(comida)
+
+    def _morrer(self) -> None:
+        self.terminado = True
+        self.resultado = "derrota"
+        self._emitir(EV_MORTE, "p1", self.snake.head_pos())
+
+
+# ── 1v1 ───────────────────────────────────────────────────────────────────────
+
+class Simulacao1v1(SimulacaoBase):
+    """Modo multijogador local (2 cobras, 2 comidas)."""
+
+    def __init__(self, mapa, nome_p1: str = "P1", **kwargs) -> None:
+        super().__init__(mapa, **kwargs)
+        self.nome_p1 = nome_p1
+        self.p1_morreu = False
+        self.p2_morreu = False
+
+        self.snake  = self._nova_cobra(1)
+        self.snake2 = self._nova_cobra(2)
+        self.cobras["p1"] = self.snake
+        self.cobras["p2"] = self.snake2
+
+        self.foods = [self._nova_comida() for _ in range(2)]
+        for f in self.foods:
+            self.food_spawn_safe(f)
+
+    def itens(self) -> list:
+        return self.foods
+
+    def _avancar(self) -> None:
+        self.snake.update()
+        self.snake2.update()
+        h1, h2 = self.snake.head_pos(), self.snake2.head_pos()
+
+        r1, r2  = (self.mapa.verificar_colisao(h1),
+                   self.mapa.verificar_colisao(h2))
+        p1_dead = r1 is True
+        p2_dead = r2 is True
+        if isinstance(r1, tuple): self.snake.set_head_pos(r1)
+        if isinstance(r2, tuple): self.snake2.set_head_pos(r2)
+
+        if h1 == h2:
+            self._morrer(True, True, "Empate (Choque Frontal)"); return
+        if self.snake2.ocupa(h1):        p1_dead = True
+        if self.snake.ocupa(h2):         p2_dead = True
+        if self.snake.collides_self():  p1_dead = True
+        if self.snake2.collides_self(): p2_dead = True
+
+        if p1_dead or p2_dead:
+            resultado = ("Empate" if p1_dead and p2_dead
+                         else "Vitoria P2" if p1_dead
+                         else f"Vitoria {self.nome_p1}")
+            self._morrer(p1_dead, p2_dead, resultado)
+            return
+
+        for comida in self.foods:
+            if h1 == comida.pos:
+                self.snake.grow()
+                self._emitir(EV_COMER, "p1", comida.pos)
+                self.food_spawn_safe(comida)
+            if h2 == comida.pos:
+                self.snake2.grow()
+                self._emitir(EV_COMER, "p2", comida.pos)
+                self.food_spawn_safe(comida)
+
+    def estado(self) -> dict:
+        dados = super().estado()
+        dados["mortos"] = [self.p1_morreu, self.p2_morreu]
+        return dados
+
+    def repor_estado(self, dados: dict) -> None:
+        super().repor_estado(dados)
+        self.p1_morreu, self.p2_morreu = dados["mortos"]
+
+    def _morrer(self, p1: bool, p2: bool, resultado: str) -> None:
+        self.terminado = True
+        self.resultado = resultado
+        self.p1_morreu = p1
+        self.p2_morreu = p2
+        if p1: self._emitir(EV_MORTE, "p1", self.snake.head_pos())
+        if p2: self._emitir(EV_MORTE, "p2", self.snake2.head_pos())
+
+
+# ── Vs AI ─────────────────────────────────────────────────────────────────────
+
+class SimulacaoVsAI(SimulacaoBase):
+    """Jogador humano contra o bot (BotIA), com boosts de velocidade e imunidade."""
+
+    def __init__(self, mapa, **kwargs) -> None:
+        super().__init__(mapa, **kwargs)
+
+        # snake = cobra do jogador (consistente com OgSnake e Modo1v1)
+        self.snake = self._nova_cobra(1)
+        self.bot   = self._nova_cobra(2)
+        self.cobras["p1"]  = self.snake
+        self.cobras["bot"] = self.bot
+
+        self.boost_vel   = self._novo_boost("velocidade")
+        self.boost_imune = self._novo_boost("imunidade")
+
+        self.comidas = [self._nova_comida()]
+        self.food_spawn_safe(self.comidas[0])
+        self._spawn_item(self.boost_vel)
+        self._spawn_item(self.boost_imune)
+
+        # Pontuação do bot reutiliza o mesmo multiplicador de dificuldade do jogador
+        self.score_bot = Score(multiplicador=self.score.multiplicador)
+
+        self.boosts_bot     = {"velocidade": 0, "imunidade": 0}
+        self.boosts_jogador = {"velocidade": 0, "imunidade": 0}
+
+        self._blocos_boost_vel   = self._boost_para_blocos(self.boost_vel)
+        self._blocos_boost_imune = self._boost_para_blocos(self.boost_imune)
+
+        # Contadores de sub-tick para boost de velocidade (jogador e bot independentes)
+        self._vel_tick     = 0
+        self._vel_tick_bot = 0
+
+        self.jogador_morreu = False
+        self.bot_morreu     = False
+
+        from game.sim.bot import BotIA      # tardio: a procura só é precisa no Vs AI
+        self.ia = BotIA(self)
+
+    def itens(self) -> list:
+        return [*self.comidas, self.boost_vel, self.boost_imune]
+
+    def estado(self) -> dict:
+        dados = super().estado()
+        dados.update(
+            pontos_bot     = self.score_bot.pontos,
+            boosts_bot     = dict(self.boosts_bot),
+            boosts_jogador = dict(self.boosts_jogador),
+            vel_tick       = [self._vel_tick, self._vel_tick_bot],
+            mortos         = [self.jogador_morreu, self.bot_morreu],
+            bot            = self.ia.estado(),
+        )
+        return dados
+
+    def repor_estado(self, dados: dict) -> None:
+        super().repor_estado(dados)
+        self.score_bot.pontos = dados["pontos_bot"]
+        self.boosts_bot.update(dados["boosts_bot"])
+        self.boosts_jogador.update(dados["boosts_jogador"])
+        self._vel_tick, self._vel_tick_bot   = dados["vel_tick"]
+        self.jogador_morreu, self.bot_morreu = dados["mortos"]
+        self._atualizar_blocos_boosts()
+        self.ia.repor_estado(dados["bot"])
+
+    # ── Spawn ─────────────────────────────────────────────────────────────────
+
+    def _spawn_item(self, item) -> None:
+        self.food_spawn_safe(item)
+
+    # ── Boosts ────────────────────────────────────────────────────────────────
+
+    def _boost_para_blocos(self, boost):
+        b = self.block
+        return {(boost.pos[0] // b, boost.pos[1] // b)} if boost.pos else set()
+
+    def _atualizar_blocos_boosts(self):
+        self._blocos_boost_vel   = self._boost_para_blocos(self.boost_vel)
+        self._blocos_boost_imune = self._boost_para_blocos(self.boost_imune)
+
+    def _imune(self):                  return self.boosts_bot["imunidade"]      > 0
+    def _com_velocidade(self):         return self.boosts_bot["velocidade"]     > 0
+    def _jogador_imune(self):          return self.boosts_jogador["imunidade"]  > 0
+    def _jogador_com_velocidade(self): return self.boosts_jogador["velocidade"] > 0
+
+    def _tick_boosts(self):
+        for d in (self.boosts_bot, self.boosts_jogador):
+            for k in d:
+                if d[k] > 0:
+                    d[k] -= 1
+
+    def _apanhar_boost(self, quem: str, boost) -> None:
+        alvo = self.boosts_jogador if quem == "p1" else self.boosts_bot
+        alvo[boost.tipo] = DURACOES_BOOST[boost.tipo]
+        self._emitir(EV_BOOST, quem, boost.pos, boost.tipo)
+        self._spawn_item(boost)
+        self._atualizar_blocos_boosts()
+
+    # ── Tick ──────────────────────────────────────────────────────────────────
+
+    def _avancar(self) -> None:
+        self._tick_boosts()
+        self.ia.actualizar()
+
+        # ── Movimento do jogador ──────────────────────────────────────────────
+        # Boost de velocidade: 2 steps em 2 de cada 3 ticks (≈1.67×).
+        # A posição intermédia é verificada para evitar tunneling na comida.
+        self.snake.update()
+        if self._jogador_com_velocidade():
+            self._vel_tick = (self._vel_tick + 1) % 3
+            if self._vel_tick != 0:
+                if not self._colisao_fatal(self.snake, self._jogador_imune()):
+                    self._verificar_itens("p1", self.snake)
+                    self.snake.update()
+
+        # ── Movimento do bot ──────────────────────────────────────────────────
+        # Mesma lógica de sub-tick: quando o bot tem boost de velocidade,
+        # avança 2 blocos em 2 de cada 3 ticks — simétrico ao jogador.
+        self.bot.update()
+        if self._com_velocidade():
+            self._vel_tick_bot = (self._vel_tick_bot + 1) % 3
+            if self._vel_tick_bot != 0:
+                if not self._colisao_fatal(self.bot, self._imune()):
+                    self._verificar_itens("bot", self.bot)
+                    self.bot.update()
+
+        self._verificar_colisoes()
+
+    # ── Colisões fatais individuais ───────────────────────────────────────────
+
+    def _colisao_fatal(self, cobra, imune: bool) -> bool:
+        cabeca = cobra.head_pos()
+        col    = self.mapa.verificar_colisao(cabeca)
+        if isinstance(col, tuple):
+            cobra.set_head_pos(col)
+            return False
+        return (col is True and not imune) or cobra.collides_self()
+
+    # ── Verificação de comida intermédia (anti-tunneling) ─────────────────────
+
+    def _verificar_itens(self, quem: str, cobra) -> None:
+        """Verifica comida e boosts na posição intermédia durante boost."""
+        cabeca = cobra.head_pos()
+        score  = self.score if quem == "p1" else self.score_bot
+        for f in self.comidas:
+            if cabeca == f.pos:
+                cobra.grow()
+                score.adicionar_pontos(10)
+                self._emitir(EV_COMER, quem, f.pos)
+                self.food_spawn_safe(f)
+
+        for boost in (self.boost_vel, self.boost_imune):
+            if boost.pos and cabeca == boost.pos:
+                self._apanhar_boost(quem, boost)
+
+    # ── Colisões (frame final) ────────────────────────────────────────────────
+
+    def _verificar_colisoes(self):
+        cabeca_j = self.snake.head_pos()
+        cabeca_b = self.bot.head_pos()
+
+        # ── Comida ───────────────────────────────────────────────────────────
+        for f in self.comidas:
+            if cabeca_j == f.pos:
+                self.snake.grow()
+                self.score.adicionar_pontos(10)
+                self._emitir(EV_COMER, "p1", f.pos)
+                self.food_spawn_safe(f)
+            if cabeca_b == f.pos:
+                self.bot.grow()
+                self.score_bot.adicionar_pontos(10)
+                self._emitir(EV_COMER, "bot", f.pos)
+                self.food_spawn_safe(f)
+
+        # ── Boosts ───────────────────────────────────────────────────────────
+        for boost in (self.boost_vel, self.boost_imune):
+            if not boost.pos:
+                continue
+            if cabeca_j == boost.pos:
+                self._apanhar_boost("p1", boost)
+            elif cabeca_b == boost.pos:
+                self._apanhar_boost("bot", boost)
+
+        # ── Paredes / teleporte ───────────────────────────────────────────────
+        col_j = self.mapa.verificar_colisao(cabeca_j)
+        col_b = self.mapa.verificar_colisao(cabeca_b)
+        if isinstance(col_j, tuple): self.snake.set_head_pos(col_j)
+        if isinstance(col_b, tuple): self.bot.set_head_pos(col_b)
+
+        # ── Entre cobras ──────────────────────────────────────────────────────
+        if cabeca_j == cabeca_b:
+            vantagem       = len(self.bot.segments) - len(self.snake.segments)
+            jogador_morreu = vantagem >= 0
+            bot_morreu     = vantagem <= 0
+        else:
+            jogador_morreu = (
+                (col_j is True and not self._jogador_imune())
+                or self.bot.ocupa(cabeca_j)
+                or self.snake.collides_self()
+            )
+            bot_morreu = (
+                (col_b is True and not self._imune())
+                or self.snake.ocupa(cabeca_b)
+                or self.bot.collides_self()
+            )
+
+        if jogador_morreu or bot_morreu:
+            self.terminado      = True
+            self.jogador_morreu = jogador_morreu
+            self.bot_morreu     = bot_morreu
+            self.resultado = ("empate"  if jogador_morreu and bot_morreu
+                              else "derrota" if jogador_morreu
+                              else "vitoria")
+            if jogador_morreu: self._emitir(EV_MORTE, "p1",  cabeca_j)
+            if bot_morreu:     self._emitir(EV_MORTE, "bot", cabeca_b)
+
+
+# ── Fábrica ───────────────────────────────────────────────────────────────────
+
+def criar_simulacao(modo: str, mapa, **kwargs) -> SimulacaoBase:
+    """Devolve a simulação correspondente a um dos modos de game.config."""
+    if modo == cfg.MODO_1V1:   return Simulacao1v1(mapa, **kwargs)
+    if modo == cfg.MODO_VS_AI: return SimulacaoVsAI(mapa, **kwargs)
+    return SimulacaoOg(mapa, **kwargs)
@@ -8,7 +8,7 @@ Devolve True se o jogador quer repetir, False se quer voltar ao menu.
 import pygame
 import sys
 import game.config as cfg
-from game.ui import ui_utils
+from game.ui import fontes, ui_utils
 
 
 # ── Utilitário interno ────────────────────────────────────────────────────────
@@ -16,7 +16,7 @@ def _render_btn(surface, font, rect, texto, cor_base, cor_hover, cor_texto, mlog
     cor = cor_hover if rect.collidepoint(mlog) else cor_base
     pygame.draw.rect(surface, cor, rect, border_radius=8)
     pygame.draw.rect(surface, tuple(min(c + 40, 255) for c in cor), rect, 1, border_radius=8)
-    t = font.render(texto, True, cor_texto)
+    t = fontes.texto(font, texto, cor_texto)
     surface.blit(t, t.get_rect(center=rect.center))
 
 
@@ -47,10 +47,10 @@ def ecra_fim_jogo(screen, surface, logical_size, titulo,
     Overlay escuro sobre o último frame do jogo.
     fundo: Surface com o último frame; se None usa a surface actual.
     """
-    f_titulo = pygame.font.SysFont("Consolas", 48, bold=True)
-    f_sub    = pygame.font.SysFont("Consolas", 26)
-    f_btn    = pygame.font.SysFont("Consolas", 24)
-    f_dica   = pygame.font.SysFont("Consolas", 18)
+    f_titulo = fontes.fonte(48, negrito=True)
+    f_sub    = fontes.fonte(26)
+    f_btn    = fontes.fonte(24)
+    f_dica   = fontes.fonte(18)
 
     lw, lh   = logical_size
     cx, cy   = lw // 2, lh // 2
@@ -78,13 +78,13 @@ def ecra_fim_jogo(screen, surface, logical_size, titulo,
         pygame.draw.rect(ps, (60, 66, 90, 220), ps.get_rect(), 2, border_radius=14)
         surface.blit(ps, painel.topleft)
 
-        t = f_titulo.render(titulo, True, cor_titulo)
+        t = fontes.texto(f_titulo, titulo, cor_titulo)
         surface.blit(t, t.get_rect(center=(cx, cy - 100)))
         if subtitulo:
-            s = f_sub.render(subtitulo, True, (190, 195, 210))
+            s = fontes.texto(f_sub, subtitulo, (190, 195, 210))
             surface.blit(s, s.get_rect(center=(cx, cy - 40)))
 
-        dica = f_dica.render("ENTER → novo jogo   ESC → menu", True, (100, 105, 120))
+        dica = fontes.texto(f_dica, "ENTER → novo jogo   ESC → menu", (100, 105, 120))
         surface.blit(dica, dica.get_rect(center=(cx, cy + 48)))
 
         mlog = ui_utils.window_to_logical(screen, logical_size, pygame.mouse.get_pos())
@@ -122,11 +122,11 @@ def ecra_fim_vsai(screen, surface, logical_size,
         titulo_txt, titulo_cor = "Empate", (220, 180, 60)
         sub_txt = "Ficaram empatados!"
 
-    f_titulo = pygame.font.SysFont("Consolas", 56, bold=True)
-    f_sub    = pygame.font.SysFont("Consolas", 26)
-    f_info   = pygame.font.SysFont("Consolas", 22)
-    f_btn    = pygame.font.SysFont("Consolas", 24)
-    f_dica   = pygame.font.SysFont("Consolas", 18)
+    f_titulo = fontes.fonte(56, negrito=True)
+    f_sub    = fontes.fonte(26)
+    f_info   = fontes.fonte(22)
+    f_btn    = fontes.fonte(24)
+    f_dica   = fontes.fonte(18)
 
     lw, lh   = logical_size
     cx, cy   = lw // 2, lh // 2
@@ -153,18 +153,18 @@ def ecra_fim_vsai(screen, surface, logical_size,
         pygame.draw.rect(ps, (80, 100, 80, 180), ps.get_rect(), 1, border_radius=14)
         surface.blit(ps, painel.topleft)
 
-        t = f_titulo.render(titulo_txt, True, titulo_cor)
+        t = fontes.texto(f_titulo, titulo_txt, titulo_cor)
         surface.blit(t, t.get_rect(center=(cx, cy - 125)))
-        sub = f_sub.render(sub_txt, True, (200, 210, 200))
+        sub = fontes.texto(f_sub, sub_txt, (200, 210, 200))
         surface.blit(sub, sub.get_rect(center=(cx, cy - 65)))
         pygame.draw.line(surface, (60, 80, 60), (cx - 200, cy - 28), (cx + 200, cy - 28), 1)
 
-        s1 = f_info.render(f"{nome_jogador}:  {pts_jogador} pts", True, (120, 220, 140))
-        s2 = f_info.render(f"Bot:  {pts_bot} pts",               True, (220, 100, 100))
+        s1 = fontes.texto(f_info, f"{nome_jogador}:  {pts_jogador} pts", (120, 220, 140))
+        s2 = fontes.texto(f_info, f"Bot:  {pts_bot} pts",                 (220, 100, 100))
         surface.blit(s1, s1.get_rect(center=(cx, cy + 10)))
         surface.blit(s2, s2.get_rect(center=(cx, cy + 45)))
 
-        dica = f_dica.render("ENTER → novo jogo   ESC → menu", True, (90, 100, 90))
+        dica = fontes.texto(f_dica, "ENTER → novo jogo   ESC → menu", (90, 100, 90))
         surface.blit(dica, dica.get_rect(center=(cx, cy + 85)))
 
         mlog = ui_utils.window_to_logical(screen, logical_size, pygame.mouse.get_pos())
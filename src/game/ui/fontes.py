@@ -0,0 +1,99 @@
+# src/game/ui/fontes.py
+"""
+Registo central de fontes e cache LRU de texto renderizado.
+
+As fontes são obtidas por GestorAssets.obter_fonte_sistema, que guarda cada
+(face, tamanho, negrito) depois da primeira procura — SysFont consulta as
+fontes do sistema e é lento demais para correr dentro de um draw por frame.
+precarregar() resolve no arranque todas as combinações usadas pelo jogo.
+
+texto() devolve a Surface já rasterizada a partir de uma cache LRU chaveada
+por (fonte, texto, cor): etiquetas estáticas como "PONTUAÇÃO" ou "ESPERA..."
+são rasterizadas uma vez em vez de 60 vezes por segundo.
+
+Uso::
+
+    from game.ui import fontes
+    fontes.precarregar()                      # após pygame.init()
+    f = fontes.fonte(15)
+    surface.blit(fontes.texto(f, "MODO", C.HUD_LABEL), (x, y))
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import pygame
+
+from game.core.assets import GestorAssets
+
+FACE: str = "Consolas"
+
+# Todas as (face, tamanho, negrito) usadas por menu, HUD, modos e ecrãs de fim
+_PRECARREGAR: Tuple[Tuple[Optional[str], int, bool], ...] = (
+    # HUD lateral
+    (FACE, 13, False), (FACE, 15, False), (FACE, 18, False),
+    (FACE, 20, True),  (FACE, 36, True),
+    # Menu e botões
+    (FACE, 52, True),  (FACE, 30, False), (FACE, 26, False),
+    # Ecrãs de fim
+    (FACE, 48, True),  (FACE, 56, True),  (FACE, 62, True),
+    (FACE, 28, False), (FACE, 24, False), (FACE, 22, False),
+    (FACE, 20, False),
+    # Avisos e countdown dos modos (fonte por omissão do pygame)
+    (None, 30, False), (None, 80, False),
+)
+
+_MAX_TEXTOS: int = 512
+
+_cache_textos: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+_estatisticas = {"acertos": 0, "falhas": 0}
+
+
+# ── Fontes ────────────────────────────────────────────────────────────────────
+
+def fonte(tamanho: int, negrito: bool = False,
+          face: Optional[str] = FACE) -> pygame.font.Font:
+    """Fonte do sistema resolvida uma única vez (cache no GestorAssets)."""
+    return GestorAssets().obter_fonte_sistema(face, tamanho, negrito)
+
+
+def precarregar() -> None:
+    """Resolve todas as fontes do jogo — chamar uma vez no arranque."""
+    if not pygame.font.get_init():
+        pygame.font.init()
+    for face, tamanho, negrito in _PRECARREGAR:
+        fonte(tamanho, negrito, face)
+
+
+# ── Texto renderizado ─────────────────────────────────────────────────────────
+
+def texto(f: pygame.font.Font, txt: str, cor,
+          antialias: bool = True) -> pygame.Surface:
+    """
+    f.render(txt, antialias, cor) com cache LRU.
+
+    A Surface devolvida é partilhada — blit à vontade, mas não a alterar.
+    """
+    chave = (f, txt, tuple(cor), antialias)
+    surf  = _cache_textos.get(chave)
+    if surf is not None:
+        _cache_textos.move_to_end(chave)
+        _estatisticas["acertos"] += 1
+        return surf
+
+    _estatisticas["falhas"] += 1
+    surf = f.render(txt, antialias, cor)
+    _cache_textos[chave] = surf
+    if len(_cache_textos) > _MAX_TEXTOS:
+        _cache_textos.popitem(last=False)
+    return surf
+
+
+def limpar_cache() -> None:
+    _cache_textos.clear()
+
+
+def estatisticas() -> dict:
+    """Acertos/falhas da cache de texto e número de entradas (debug/profiling)."""
+    return {**_estatisticas, "entradas": len(_cache_textos)}
@@ -7,6 +7,7 @@ from typing import Any, Dict, Tuple
 import pygame
 
 import game.config as C
+from game.ui import fontes
 
 _PAD:          int   = 12
 _SEC_GAP:      int   = 10
@@ -33,6 +34,10 @@ class HUD:
         self._score:  int   = 0
         self._pop_t:  float = _POP_DURATION
 
+        # Último estado desenhado — permite saltar o redesenho da sidebar
+        self._info_desenhada: Dict[str, Any] | None = None
+        self._pop_desenhado:  bool = False
+
         self._f_label: pygame.font.Font | None = None
         self._f_value: pygame.font.Font | None = None
         self._f_big:   pygame.font.Font | None = None
@@ -50,6 +55,11 @@ class HUD:
             self._pop_t = 0.0
         self._score = pts
 
+    def precisa_redesenho(self, info: Dict[str, Any]) -> bool:
+        """True se algum campo mudou ou a animação de pop ainda está a correr."""
+        return (self._pop_t < _POP_DURATION or self._pop_desenhado
+                or info != self._info_desenhada)
+
     def atualizar_pontuacao(self, nova: int) -> None:
         self.set_score(nova)
 
@@ -62,6 +72,8 @@ class HUD:
     def draw_sidebar(self, surface: pygame.Surface,
                      info: Dict[str, Any], modo: str) -> None:
         self._init_fonts()
+        self._info_desenhada = dict(info)
+        self._pop_desenhado  = self._pop_t < _POP_DURATION
 
         sw = C.SIDEBAR_W
         sh = surface.get_height()
@@ -151,11 +163,11 @@ class HUD:
         p  = _PAD
         cy = top + 14
 
-        lbl = self._f_mini.render(player_label.upper(), True, C.HUD_LABEL)
+        lbl = fontes.texto(self._f_mini, player_label.upper(), C.HUD_LABEL)
         surface.blit(lbl, (sx + p, cy))
         cy += lbl.get_height() + 3
 
-        nm = self._f_name.render(name, True, color)
+        nm = fontes.texto(self._f_name, name, color)
         surface.blit(nm, (sx + p, cy))
         cy += nm.get_height() + 10
 
@@ -163,7 +175,7 @@ class HUD:
                          (sx + p, cy), (sx + sw - p, cy), 1)
         cy += 8
 
-        lbl2 = self._f_mini.render("COMPRIMENTO", True, C.HUD_LABEL)
+        lbl2 = fontes.texto(self._f_mini, "COMPRIMENTO", C.HUD_LABEL)
         surface.blit(lbl2, (sx + p, cy))
         cy += lbl2.get_height() + 4
         bar_w  = sw - p * 2
@@ -174,7 +186,7 @@ class HUD:
         pygame.draw.rect(surface, color,
                          pygame.Rect(sx + p, cy, filled, _BAR_H),
                          border_radius=_BAR_RADIUS)
-        num = self._f_label.render(str(length), True, color)
+        num = fontes.texto(self._f_label, str(length), color)
         surface.blit(num, (sx + sw - p - num.get_width(), cy - 1))
         cy += _BAR_H + 10
 
@@ -185,7 +197,7 @@ class HUD:
             dot_col = (180, 80, 80)
             status  = "ESPERA..."
         pygame.draw.circle(surface, dot_col, (sx + p + 5, cy + 6), 4)
-        st = self._f_mini.render(status, True, dot_col)
+        st = fontes.texto(self._f_mini, status, dot_col)
         surface.blit(st, (sx + p + 14, cy))
 
     # ── Secções reutilizáveis ─────────────────────────────────────────────────
@@ -194,10 +206,10 @@ class HUD:
                         label: str, name: str, color) -> int:
         p  = _PAD
         y += 14
-        lbl = self._f_mini.render(label, True, C.HUD_LABEL)
+        lbl = fontes.texto(self._f_mini, label, C.HUD_LABEL)
         surface.blit(lbl, (sx + p, y))
         y += lbl.get_height() + 3
-        nm = self._f_name.render(name[:10], True, color)
+        nm = fontes.texto(self._f_name, name[:10], color)
         surface.blit(nm, (sx + p, y))
         y += nm.get_height() + _SEC_GAP
         pygame.draw.line(surface, C.HUD_SECTION_LINE,
@@ -206,7 +218,7 @@ class HUD:
 
     def _section_score(self, surface, sx, y, sw, score: int) -> int:
         p   = _PAD
-        lbl = self._f_mini.render("PONTUAÇÃO", True, C.HUD_LABEL)
+        lbl = fontes.texto(self._f_mini, "PONTUAÇÃO", C.HUD_LABEL)
         surface.blit(lbl, (sx + p, y))
         y += lbl.get_height() + 4
 
@@ -214,7 +226,9 @@ class HUD:
         scale = 1.0 + 0.55 * (1.0 - _ease_out_cubic(t))
         color = _lerp_color(C.WHITE, C.HUD_SCORE, t)
 
-        base_surf = self._f_big.render(str(score), True, color)
+        # Durante o pop a cor muda a cada frame — só o estado final vai para a cache
+        base_surf = (fontes.texto(self._f_big, str(score), color) if t >= 1.0
+                     else self._f_big.render(str(score), True, color))
         bw, bh    = base_surf.get_size()
         sw2 = max(1, int(bw * scale))
         sh2 = max(1, int(bh * scale))
@@ -234,7 +248,7 @@ class HUD:
                         length: int, max_len: int,
                         color, label: str = "COMPRIMENTO") -> int:
         p    = _PAD
-        lbl  = self._f_mini.render(label, True, C.HUD_LABEL)
+        lbl  = fontes.texto(self._f_mini, label, C.HUD_LABEL)
         surface.blit(lbl, (sx + p, y))
         y += lbl.get_height() + 4
 
@@ -248,7 +262,7 @@ class HUD:
                          pygame.Rect(sx + p, y, filled, _BAR_H),
                          border_radius=_BAR_RADIUS)
 
-        num = self._f_label.render(str(length), True, color)
+        num = fontes.texto(self._f_label, str(length), color)
         surface.blit(num, (sx + sw - p - num.get_width(), y - 1))
         y += _BAR_H + _SEC_GAP
 
@@ -258,19 +272,19 @@ class HUD:
 
     def _section_mode(self, surface, sx, y, sw) -> int:
         p   = _PAD
-        lbl = self._f_mini.render("MODO", True, C.HUD_LABEL)
+        lbl = fontes.texto(self._f_mini, "MODO", C.HUD_LABEL)
         surface.blit(lbl, (sx + p, y))
         y += lbl.get_height() + 3
-        mv = self._f_label.render(self.modo, True, C.HUD_TEXT)
+        mv = fontes.texto(self._f_label, self.modo, C.HUD_TEXT)
         surface.blit(mv, (sx + p, y))
         y += mv.get_height() + 2
-        dv = self._f_mini.render(self.dificuldade, True, C.HUD_LABEL)
+        dv = fontes.texto(self._f_mini, self.dificuldade, C.HUD_LABEL)
         surface.blit(dv, (sx + p, y))
         return y + dv.get_height() + _SEC_GAP
 
     def _section_divider(self, surface, sx, y, sw, label: str) -> int:
         p   = _PAD
-        lbl = self._f_mini.render(label, True, C.HUD_LABEL)
+        lbl = fontes.texto(self._f_mini, label, C.HUD_LABEL)
         surface.blit(lbl, (sx + p, y))
         return y + lbl.get_height() + 4
 
@@ -281,7 +295,7 @@ class HUD:
                               max_len: int, color) -> int:
         p      = _PAD
         bar_w  = sw - p * 2
-        name_s = self._f_mini.render(name[:8], True, C.HUD_TEXT)
+        name_s = fontes.texto(self._f_mini, name[:8], C.HUD_TEXT)
         surface.blit(name_s, (sx + p, y))
         by = y + name_s.get_height() + 2
         filled = max(1, int(bar_w * min(length, max_len) / max(max_len, 1)))
@@ -291,7 +305,7 @@ class HUD:
         pygame.draw.rect(surface, color,
                          pygame.Rect(sx + p, by, filled, _BAR_H - 1),
                          border_radius=_BAR_RADIUS)
-        num = self._f_mini.render(str(length), True, color)
+        num = fontes.texto(self._f_mini, str(length), color)
         surface.blit(num, (sx + sw - p - num.get_width(), by - 1))
         return by + (_BAR_H - 1) + 6
 
@@ -314,12 +328,12 @@ class HUD:
                          1, border_radius=5)
 
         cor_texto = cor if ativo else (55, 60, 80)
-        tn = self._f_label.render(nome, True, cor_texto)
+        tn = fontes.texto(self._f_label, nome, cor_texto)
         surface.blit(tn, (sx + p + 6, y + 6))
 
         if ativo:
             segs = max(0, ticks // max(fps, 1))
-            ts   = self._f_mini.render(f"{segs}s", True, (200, 210, 225))
+            ts   = fontes.texto(self._f_mini, f"{segs}s", (200, 210, 225))
             surface.blit(ts, (sx + sw - p - ts.get_width() - 4, y + 7))
 
         bar_y = y + slot_h - 6
@@ -340,11 +354,11 @@ class HUD:
     def _init_fonts(self) -> None:
         if self._f_label is not None:
             return
-        self._f_mini  = pygame.font.SysFont("Consolas", 13)
-        self._f_label = pygame.font.SysFont("Consolas", 15)
-        self._f_value = pygame.font.SysFont("Consolas", 18)
-        self._f_name  = pygame.font.SysFont("Consolas", 20, bold=True)
-        self._f_big   = pygame.font.SysFont("Consolas", 36, bold=True)
+        self._f_mini  = fontes.fonte(13)
+        self._f_label = fontes.fonte(15)
+        self._f_value = fontes.fonte(18)
+        self._f_name  = fontes.fonte(20, negrito=True)
+        self._f_big   = fontes.fonte(36, negrito=True)
 
 
 # ── Utilitários ───────────────────────────────────────────────────────────────
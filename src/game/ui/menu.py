@@ -16,14 +16,13 @@ import pygame
 
 import game.config as cfg
 import game.config as C
-from game.core.engine        import Game
+from game.core               import arranque
 from game.core.records       import RecordsManager
 from game.core.nomes         import GestorNomes
 from game.core.musica        import GestorMusica
 from game.core.configuracoes import Configuracoes
 from game.ui                 import ui_utils
-
-pygame.init()
+from game.ui                 import fontes
 
 LOGICAL_W = cfg.SCREEN_WIDTH
 LOGICAL_H = cfg.SCREEN_HEIGHT
@@ -47,6 +46,7 @@ def draw_title(surface, font_big, w, y_base, t: float = 0.0):
     bob   = math.sin(t * _TITLE_BOB_SPEED * math.tau) * _TITLE_BOB_AMP
     pulse = (math.sin(t * 0.8 * math.tau) + 1.0) / 2.0
     color = _lerp_color(_TITLE_COL_A, _TITLE_COL_B, pulse * 0.4)
+    # Cor pulsa a cada frame — render directo para não encher a cache de texto
     text  = font_big.render("Snake", True, color)
     surface.blit(text, text.get_rect(center=(w // 2, int(y_base + bob))))
 
@@ -62,7 +62,7 @@ class Button:
         self.color       = color
         self.hover_color = hover_color
         self.action      = action
-        self.font        = pygame.font.SysFont("Consolas", font_size)
+        self.font        = fontes.fonte(font_size)
         self._slide_t    = 0.0
         self._slide_delay = slide_delay
         self._elapsed    = 0.0
@@ -146,17 +146,21 @@ class Slider:
 
 class Menu:
     def __init__(self):
-        self.screen = pygame.display.set_mode(
-            (cfg.SCREEN_WIDTH, cfg.SCREEN_HEIGHT), pygame.RESIZABLE)
-        pygame.display.set_caption("Snake")
+        arranque.iniciar_pygame()
+        with arranque.fase("janela"):
+            self.screen = pygame.display.set_mode(
+                (cfg.SCREEN_WIDTH, cfg.SCREEN_HEIGHT), pygame.RESIZABLE)
+            pygame.display.set_caption("Snake")
+        with arranque.fase("fontes.precarregar"):
+            fontes.precarregar()   # todas as fontes resolvidas uma vez, no arranque
 
         self.running         = True
         self.logical_size    = (LOGICAL_W, LOGICAL_H)
         self.logical_surface = pygame.Surface(self.logical_size)
 
-        self.font_title = pygame.font.SysFont("Consolas", 52, bold=True)
-        self.font_big   = pygame.font.SysFont("Consolas", 30)
-        self.font_sm    = pygame.font.SysFont("Consolas", 18)
+        self.font_title = fontes.fonte(52, negrito=True)
+        self.font_big   = fontes.fonte(30)
+        self.font_sm    = fontes.fonte(18)
 
         self.gestor_nomes = GestorNomes()
         self.musica       = GestorMusica()
@@ -167,7 +171,10 @@ class Menu:
         self.recenter_buttons()
 
         # Iniciar música do menu
-        self.musica.tocar_menu()
+        with arranque.fase("música do menu"):
+            self.musica.tocar_menu()
+        # Efeitos descodificados em segundo plano enquanto o menu está no ecrã
+        self.musica.precarregar_sfx()
 
     def _wl(self, pos):
         return ui_utils.window_to_logical(self.screen, self.logical_size, pos)
@@ -176,7 +183,7 @@ class Menu:
         ui_utils.blit_scaled(self.screen, self.logical_surface, self.logical_size)
 
     def txt_center(self, text, font, color, y):
-        s = font.render(text, True, color)
+        s = fontes.texto(font, text, color)
         self.logical_surface.blit(s, s.get_rect(center=(LOGICAL_W // 2, y)))
 
     # ── Acções dos botões ─────────────────────────────────────────────────────
@@ -212,6 +219,7 @@ class Menu:
                 ("Campo Livre",    "assets/mapas/campo_livre.txt"),
                 ("Obstáculos",     "assets/mapas/obstaculos.txt"),
                 ("Arena (bordas)", "assets/mapas/arena.txt"),
+                ("Arena Grande",   "assets/mapas/arena_grande.txt"),
             ])
             if not mapa or not self.running: return
             self._iniciar(p1, modo, dif, mapa, p2="IA_Bot")
@@ -225,6 +233,7 @@ class Menu:
                 ("Campo Livre",    "assets/mapas/campo_livre.txt"),
                 ("Obstáculos",     "assets/mapas/obstaculos.txt"),
                 ("Arena (bordas)", "assets/mapas/arena.txt"),
+                ("Arena Grande",   "assets/mapas/arena_grande.txt"),
             ])
             if not mapa or not self.running: return
             self._iniciar(p1, modo, dif, mapa)
@@ -311,21 +320,21 @@ class Menu:
             self.txt_center("Configurações", self.font_big, C.HUD_ACCENT, 130)
 
             # Volume música
-            lbl_mv = self.font_sm.render("Volume Música", True, C.HUD_TEXT_MAIN)
+            lbl_mv = fontes.texto(self.font_sm, "Volume Música", C.HUD_TEXT_MAIN)
             self.logical_surface.blit(lbl_mv, (sl_x, 186))
-            pct_mv = self.font_sm.render(
-                f"{int(self.config.musica_volume * 100)}%",
-                True, C.HUD_SCORE)
+            pct_mv = fontes.texto(
+                self.font_sm,
+                f"{int(self.config.musica_volume * 100)}%", C.HUD_SCORE)
             self.logical_surface.blit(
                 pct_mv, (sl_x + slider_w + 10, 186))
             sl_musica.draw(self.logical_surface, self.config.musica_volume)
 
             # Volume SFX
-            lbl_sv = self.font_sm.render("Volume SFX", True, C.HUD_TEXT_MAIN)
+            lbl_sv = fontes.texto(self.font_sm, "Volume SFX", C.HUD_TEXT_MAIN)
             self.logical_surface.blit(lbl_sv, (sl_x, 254))
-            pct_sv = self.font_sm.render(
-                f"{int(self.config.sfx_volume * 100)}%",
-                True, C.HUD_SCORE)
+            pct_sv = fontes.texto(
+                self.font_sm,
+                f"{int(self.config.sfx_volume * 100)}%", C.HUD_SCORE)
             self.logical_surface.blit(
                 pct_sv, (sl_x + slider_w + 10, 254))
             sl_sfx.draw(self.logical_surface, self.config.sfx_volume)
@@ -463,7 +472,7 @@ class Menu:
             pygame.draw.rect(self.logical_surface, C.BG_INPUT, box, border_radius=6)
             pygame.draw.rect(self.logical_surface, C.UI_BORDER, box, 1, border_radius=6)
             cursor = "|" if (tique // 28) % 2 == 0 else " "
-            ts = self.font_big.render(nome + cursor, True, C.WHITE)
+            ts = fontes.texto(self.font_big, nome + cursor, C.WHITE)
             self.logical_surface.blit(ts, (box.x + 12, box.y + 10))
             self.txt_center("ENTER confirmar  ·  ESC voltar",
                             self.font_sm, C.HUD_TEXT, box.bottom + 16)
@@ -478,7 +487,7 @@ class Menu:
                                      rect, border_radius=6)
                     pygame.draw.rect(self.logical_surface, C.UI_BORDER,
                                      rect, 1, border_radius=6)
-                    tn = self.font_sm.render(n, True, C.WHITE)
+                    tn = fontes.texto(self.font_sm, n, C.WHITE)
                     self.logical_surface.blit(
                         tn, tn.get_rect(center=rect.center))
             if aviso:
@@ -498,10 +507,12 @@ class Menu:
                          + i * (btn_w_f + btn_gap), 130, btn_w_f, 30), m)
             for i, m in enumerate(MODOS)
         ]
-        clock = pygame.time.Clock()
+        clock    = pygame.time.Clock()
+        recordes = RecordsManager()
         while self.running:
+            # Top em memória — só volta à base se esta tiver mudado
             mf     = None if filtro == "Todos" else filtro
-            scores = RecordsManager().ler_pontuacoes(modo_filtrar=mf)
+            scores = recordes.top(modo=mf, n=10)
             for ev in pygame.event.get():
                 if ev.type == pygame.QUIT:
                     self.running = False; return
@@ -535,7 +546,7 @@ class Menu:
             else:
                 cab = f"  # {'Nome':<12} {'Modo':<13} {'Dif':<13} {'Pts':>5}"
                 self.logical_surface.blit(
-                    self.font_sm.render(cab, True, C.HUD_TEXT_MAIN), (80, 172))
+                    fontes.texto(self.font_sm, cab, C.HUD_TEXT_MAIN), (80, 172))
                 pygame.draw.line(self.logical_surface, C.UI_BORDER,
                                  (80, 192), (LOGICAL_W - 80, 192), 1)
                 for i, p in enumerate(scores[:10]):
@@ -543,7 +554,7 @@ class Menu:
                              f" {p['dificuldade']:<13} {p['pontuacao']:>5}")
                     cor   = C.HUD_SCORE if i == 0 else C.HUD_TEXT
                     self.logical_surface.blit(
-                        self.font_sm.render(linha, True, cor),
+                        fontes.texto(self.font_sm, linha, cor),
                         (80, 198 + i * 26))
             ui_utils.draw_btn(self.logical_surface, btn_voltar,
                               C.BTN_PLAY, C.BTN_PLAY_HOV,
@@ -586,9 +597,13 @@ class Menu:
     # ── Iniciar jogo ──────────────────────────────────────────────────────────
 
     def _iniciar(self, p1, modo, dif, mapa, p2=None):
+        # Import tardio: engine, modos e renderer só quando se joga
+        from game.core.engine import Game
+
         nome_dif, mult = dif
         saved = self.screen.get_size()
-        # Fade-out da música do menu antes de iniciar
+        # Fade-out da música do menu (em segundo plano) com a faixa do jogo já aberta
+        self.musica.preparar_jogo(nome_dif if modo != cfg.MODO_1V1 else "Normal")
         self.musica.fade_out(700)
         repetir = True
         while repetir and self.running:
@@ -670,6 +685,7 @@ class Menu:
                                 break
 
             self._blit()
+            arranque.primeiro_frame()
 
         pygame.quit()
         sys.exit()
\ No newline at end of file
@@ -0,0 +1,127 @@
+# src/game/ui/perfil_overlay.py
+"""
+Overlay de perfil de frames (F3): sparkline do tempo total por frame e
+tabela p50/p95/p99 por fase, a partir de um game.core.perfil.PerfilFrames,
+e uma linha com os contadores do ciclo lógico (recuperação e interpolação).
+
+O painel é recomposto a cada _REFRESCO frames e reutilizado entre eles —
+o custo do overlay aparece na própria tabela, na fase "overlay".
+"""
+from __future__ import annotations
+
+from typing import Callable, Optional, Sequence
+
+import pygame
+
+from game.core.perfil import FASES, PerfilFrames
+from game.ui          import fontes
+
+_REFRESCO:     int   = 10      # frames entre recomposições do painel
+_PONTOS:       int   = 180     # frames mostrados na sparkline
+_SPARK_H:      int   = 44
+_LINHA_H:      int   = 15
+_PAD:          int   = 8
+_LARGURA:      int   = 300
+_ORCAMENTO_MS: float = 1000.0 / 60.0
+_COLUNAS = (_LARGURA - 2 * _PAD - 120, _LARGURA - 2 * _PAD - 60, _LARGURA - 2 * _PAD)
+
+_COR_FUNDO   = (8, 10, 16, 210)
+_COR_BORDA   = (70, 80, 110)
+_COR_TEXTO   = (200, 210, 225)
+_COR_TITULO  = (140, 200, 255)
+_COR_SPARK   = (110, 220, 140)
+_COR_ALERTA  = (235, 110, 90)
+_COR_LIMITE  = (90, 90, 120)
+
+
+class OverlayPerfil:
+    """Painel semitransparente no canto superior esquerdo da área de jogo."""
+
+    def __init__(self, perfil: PerfilFrames,
+                 extras: Sequence[Callable[[], str]] = ()) -> None:
+        self.perfil  = perfil
+        self.visivel = False
+        self.mensagem: Optional[str] = None   # ex.: caminho do último CSV
+        self.extras  = tuple(extras)          # linhas extra (ex.: contadores de SFX)
+
+        self._painel: Optional[pygame.Surface] = None
+        self._frames_desde = _REFRESCO
+
+    def alternar(self) -> None:
+        self.visivel       = not self.visivel
+        self._frames_desde = _REFRESCO
+
+    def draw(self, surface: pygame.Surface, pos=(_PAD, _PAD)) -> None:
+        if not self.visivel:
+            return
+        self._frames_desde += 1
+        if self._painel is None or self._frames_desde >= _REFRESCO:
+            self._painel       = self._compor()
+            self._frames_desde = 0
+        surface.blit(self._painel, pos)
+
+    # ── Composição ────────────────────────────────────────────────────────────
+
+    def _compor(self) -> pygame.Surface:
+        # render() directo: os números mudam sempre e só encheriam a cache LRU
+        f      = fontes.fonte(13)
+        linhas = len(FASES) + 4 + (1 if self.mensagem else 0) + len(self.extras)
+        altura = _PAD * 3 + _SPARK_H + linhas * _LINHA_H
+        painel = pygame.Surface((_LARGURA, altura), pygame.SRCALPHA)
+        painel.fill(_COR_FUNDO)
+        pygame.draw.rect(painel, _COR_BORDA, painel.get_rect(), 1)
+
+        # ── Sparkline do tempo total ──────────────────────────────────────────
+        serie = self.perfil.serie(ultimos=_PONTOS)
+        area  = pygame.Rect(_PAD, _PAD, _LARGURA - 2 * _PAD, _SPARK_H)
+        topo  = max(2 * _ORCAMENTO_MS, max(serie, default=0.0))
+        y_orc = area.bottom - int(_ORCAMENTO_MS / topo * area.h)
+        pygame.draw.line(painel, _COR_LIMITE, (area.x, y_orc), (area.right, y_orc))
+        if len(serie) >= 2:
+            passo  = area.w / (_PONTOS - 1)
+            x0     = area.right - passo * (len(serie) - 1)
+            pontos = [(int(x0 + i * passo), area.bottom - int(v / topo * area.h))
+                      for i, v in enumerate(serie)]
+            cor = _COR_ALERTA if serie[-1] > _ORCAMENTO_MS else _COR_SPARK
+            pygame.draw.lines(painel, cor, False, pontos)
+
+        # ── Tabela de percentis ───────────────────────────────────────────────
+        # Colunas alinhadas à direita em x fixos (a fonte pode não ser mono)
+        y   = area.bottom + _PAD
+        pct = self.perfil.percentis()
+        self._linha(painel, f, y, "fase (ms)", ("p50", "p95", "p99"), _COR_TITULO)
+        y += _LINHA_H
+        for nome in FASES + ("total",):
+            p50, p95, p99 = pct[nome]
+            cor = _COR_ALERTA if nome == "total" and p95 > _ORCAMENTO_MS else _COR_TEXTO
+            self._linha(painel, f, y, nome, (f"{p50:.2f}", f"{p95:.2f}", f"{p99:.2f}"), cor)
+            y += _LINHA_H
+
+        painel.blit(f.render(self._resumo_logica(), True, _COR_TEXTO), (_PAD, y))
+        y += _LINHA_H
+        for extra in self.extras:
+            painel.blit(f.render(extra(), True, _COR_TEXTO), (_PAD, y))
+            y += _LINHA_H
+        painel.blit(f.render(f"{len(self.perfil)} frames  ·  F3 ocultar  ·  F4 CSV",
+                             True, _COR_LIMITE), (_PAD, y))
+        if self.mensagem:
+            y += _LINHA_H
+            painel.blit(f.render(self.mensagem, True, _COR_SPARK), (_PAD, y))
+        return painel
+
+    def _resumo_logica(self) -> str:
+        """Passos lógicos por frame (máx.), frames a recuperar, descartados e α médio."""
+        passos = self.perfil.serie_contador("passos")
+        desc   = self.perfil.serie_contador("descartados")
+        alfa   = self.perfil.serie_contador("alfa")
+        recup  = sum(1 for p in passos if p > 1)
+        media  = sum(alfa) / len(alfa) if alfa else 0.0
+        return (f"lógica: máx {int(max(passos, default=0))}/frame  "
+                f"{recup} recup.  {int(sum(desc))} desc.  α {media:.2f}")
+
+    @staticmethod
+    def _linha(painel, f, y, nome, valores, cor) -> None:
+        painel.blit(f.render(nome, True, cor), (_PAD, y))
+        for i, v in enumerate(valores):
+            t = f.render(v, True, cor)
+            painel.blit(t, t.get_rect(topright=(_COLUNAS[i], y)))
@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import pygame
 import game.config as C
+from game.ui import fontes
 
 
 def draw_bg(surface: pygame.Surface, w: int, h: int) -> None:
@@ -55,7 +56,7 @@ def draw_btn(surface: pygame.Surface, rect: pygame.Rect,
     pygame.draw.rect(surface, tuple(max(c - 20, 0) for c in col),
                      rect, 1, border_radius=radius)
     # Texto centrado
-    txt = font.render(text, True, C.WHITE)
+    txt = fontes.texto(font, text, C.WHITE)
     surface.blit(txt, txt.get_rect(center=rect.center))
 
 